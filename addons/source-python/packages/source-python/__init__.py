@@ -57,6 +57,7 @@ def unload():
     unload_plugins()
     remove_entities_listener()
     unload_auth()
+    unload_user_settings()
 
 
 # =============================================================================
@@ -79,6 +80,11 @@ def setup_logging():
 
     from configobj import ConfigObjError
     from cvars import ConVar
+    from listeners import on_convar_changed_listener_manager
+    from loggers import _on_convar_changed
+
+    # Refresh the stored logging values whenever a ConVar changes
+    on_convar_changed_listener_manager.register_listener(_on_convar_changed)
 
     # Use try/except in case the logging values are not integers
     try:
@@ -177,7 +183,7 @@ def setup_sp_command():
     """Set up the 'sp' command."""
     _sp_logger.log_debug('Setting up the "sp" command...')
 
-    from core.command import auth, docs, dump
+    from core.command import auth, docs, dump, profile
 
 
 # =============================================================================
@@ -201,6 +207,14 @@ def unload_auth():
 # =============================================================================
 # >> USER_SETTINGS
 # =============================================================================
+def unload_user_settings():
+    """Write all changed user settings to the database."""
+    _sp_logger.log_debug('Unloading user settings...')
+
+    from settings.storage import _player_settings_storage
+    _player_settings_storage.flush()
+
+
 def setup_user_settings():
     """Set up user settings."""
     _sp_logger.log_debug('Setting up user settings...')
@@ -6,9 +6,13 @@
 # >> IMPORTS
 # =============================================================================
 # Python Imports
-#   Thread
+#   Collections
+from collections import OrderedDict
+#   Contextlib
 from contextlib import contextmanager
-from threading import Thread
+#   Thread
+from threading import Event
+from threading import Lock
 
 # Source.Python Imports
 #   Auth
@@ -16,6 +20,8 @@ from auth.base import Backend
 from auth.manager import auth_manager
 from auth.manager import PlayerPermissions
 from auth.manager import ParentPermissions
+#   Hooks
+from hooks.exceptions import except_hooks
 #   Paths
 from paths import SP_DATA_PATH
 #   Listeners
@@ -31,6 +37,7 @@ from sqlalchemy import Enum
 from sqlalchemy import create_engine
 from sqlalchemy import Table
 from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
@@ -57,6 +64,9 @@ parents_table = Table(
     Column('child_id', Integer, ForeignKey('objects.id'), primary_key=True)
 )
 
+# Number of rows fetched at once while loading the permissions
+LOAD_CHUNK_SIZE = 1000
+
 
 # =============================================================================
 # >> HELPER FUNCTIONS
@@ -76,12 +86,15 @@ def session_scope():
         session.close()
 
 def get_or_create(session, model, **kwargs):
-    """Get or create a row."""
+    """Get or create a row.
+
+    New rows are only flushed, so they are committed with the session.
+    """
     instance = session.query(model).filter_by(**kwargs).first()
     if not instance:
         instance = model(**kwargs)
         session.add(instance)
-        session.commit()
+        session.flush()
 
     return instance
 
@@ -126,21 +139,209 @@ class LoadThread(GameThread):
         self._running = False
 
     def run(self):
+        # Stream all rows in chunks with one query per table instead of
+        #   loading the relationships of every node separately
         with session_scope() as session:
-            for node in session.query(PermissionObject).all():
+            query = session.query(
+                PermissionObject.type, PermissionObject.identifier)
+            for node_type, identifier in query.yield_per(LOAD_CHUNK_SIZE):
+                if not self._running:
+                    return
+
+                self.get_store(node_type, identifier)
+
+            query = session.query(
+                PermissionObject.type, PermissionObject.identifier,
+                Permission.node).join(
+                    Permission, Permission.object_id == PermissionObject.id)
+            for node_type, identifier, node in query.yield_per(
+                    LOAD_CHUNK_SIZE):
+                if not self._running:
+                    return
+
+                self.get_store(node_type, identifier).add(
+                    node, update_backend=False)
+
+            parent = aliased(PermissionObject)
+            query = session.query(
+                PermissionObject.type, PermissionObject.identifier,
+                parent.identifier).join(
+                    parents_table,
+                    parents_table.c.child_id == PermissionObject.id).join(
+                        parent, parents_table.c.parent_id == parent.id)
+            for node_type, identifier, parent_name in query.yield_per(
+                    LOAD_CHUNK_SIZE):
                 if not self._running:
-                    break
+                    return
+
+                self.get_store(node_type, identifier).add_parent(
+                    parent_name, update_backend=False)
+
+    @staticmethod
+    def get_store(node_type, identifier):
+        if node_type == 'Parent':
+            return auth_manager.parents[identifier]
+
+        return auth_manager.players[identifier]
+
+
+class WriteThread(GameThread):
+    """Thread that writes the changed permissions in batches.
+
+    Operations are coalesced by their target, so only the last operation
+    for a permission or parent is executed. All pending operations are
+    committed in a single transaction. Each operation is executed in its
+    own savepoint, so an operation that violates a constraint is dropped
+    without affecting the other operations.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._running = True
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._event = Event()
+
+        # Store the pending operations
+        #   {(<kind>, <node type>, <identifier>, <target>, <server id>):
+        #       <added>}
+        self._pending = OrderedDict()
+
+    def put(self, kind, node_type, identifier, target, server_id, added):
+        """Queue an operation."""
+        key = (kind, node_type, identifier, target, server_id)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = added
+
+        self._event.set()
+
+    def stop(self):
+        self._running = False
+        self._event.set()
+
+    def flush(self):
+        """Execute all pending operations in the calling thread."""
+        with self._write_lock:
+            self._write()
+
+    def run(self):
+        while self._running:
+            self._event.wait()
+            self._event.clear()
+            try:
+                self.flush()
+            except:
+                except_hooks.print_exception()
+
+    def _write(self):
+        """Execute and commit all pending operations."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            operations, self._pending = self._pending, OrderedDict()
+
+        try:
+            with session_scope() as session:
+                objects = dict()
+                for key, added in operations.items():
+                    kind, node_type, identifier, target, server_id = key
+                    try:
+                        with session.begin_nested():
+                            if kind == 'permission':
+                                self._write_permission(
+                                    session, objects, node_type,
+                                    identifier, target, server_id, added)
+                            else:
+                                self._write_parent(
+                                    session, objects, node_type,
+                                    identifier, target, added)
+                    except IntegrityError:
+                        # The operation has been rolled back, including
+                        #   the objects it created
+                        objects.clear()
+        except:
+            # Queue the operations again, unless they have been replaced
+            with self._lock:
+                for key, added in operations.items():
+                    self._pending.setdefault(key, added)
+
+            raise
+
+    def _write_permission(
+            self, session, objects, node_type, identifier, permission,
+            server_id, added):
+        permission_obj = self._get_object(
+            session, objects, node_type, identifier, added)
+        if permission_obj is None:
+            return
+
+        # Permissions without a server id are stored with the default value
+        if server_id is None:
+            server_id = -1
+
+        query = session.query(Permission).filter_by(
+            object_id=permission_obj.id,
+            server_id=server_id,
+            node=permission
+        )
+
+        if not added:
+            query.delete(False)
+        elif query.first() is None:
+            session.add(Permission(
+                object_id=permission_obj.id,
+                server_id=server_id,
+                node=permission
+            ))
+
+    def _write_parent(
+            self, session, objects, node_type, identifier, parent_name,
+            added):
+        child = self._get_object(
+            session, objects, node_type, identifier, added)
+        parent = self._get_object(
+            session, objects, 'Parent', parent_name, added)
+        if child is None or parent is None:
+            return
+
+        query = session.query(parents_table).filter_by(
+            child_id=child.id,
+            parent_id=parent.id
+        )
+
+        if not added:
+            query.delete(False)
+        elif query.first() is None:
+            session.execute(parents_table.insert().values(
+                parent_id=parent.id,
+                child_id=child.id))
 
-                if node.type == 'Parent':
-                    store = auth_manager.parents[node.identifier]
-                else:
-                    store = auth_manager.players[node.identifier]
+    @staticmethod
+    def _get_object(session, objects, node_type, identifier, create):
+        """Return the PermissionObject of the given node.
 
-                for permission in node.permissions:
-                    store.add(permission.node, update_backend=False)
+        If it doesn't exist, it is only created if ``create`` is True.
+        Otherwise, None is returned.
+        """
+        key = (node_type, identifier)
+        try:
+            return objects[key]
+        except KeyError:
+            pass
 
-                for parent in node.parents:
-                    store.add_parent(parent.identifier, update_backend=False)
+        if create:
+            instance = get_or_create(session, PermissionObject,
+                identifier=identifier, type=node_type)
+        else:
+            instance = session.query(PermissionObject).filter_by(
+                identifier=identifier, type=node_type).first()
+            if instance is None:
+                return None
+
+        objects[key] = instance
+        return instance
 
 
 class SQLBackend(Backend):
@@ -152,6 +353,7 @@ class SQLBackend(Backend):
     def __init__(self):
         self.engine = None
         self.thread = None
+        self.write_thread = None
 
     def load(self):
         self.engine = create_engine(self.options['uri'])
@@ -159,69 +361,39 @@ class SQLBackend(Backend):
         Session.configure(bind=self.engine)
         self.thread = LoadThread()
         self.thread.start()
+        self.write_thread = WriteThread()
+        self.write_thread.start()
 
     def unload(self):
         self.thread.stop()
         self.thread.join()
+        self.write_thread.stop()
+        self.write_thread.join()
+        self.flush()
+
+    def flush(self):
+        """Write all pending changes to the database."""
+        self.write_thread.flush()
 
     def permission_added(self, node, permission, server_id):
-        try:
-            with session_scope() as session:
-                node_type, identifier = self.get_node_type_and_identifier(node)
-                permission_obj = get_or_create(session, PermissionObject,
-                    identifier=identifier, type=node_type)
-
-                instance = Permission(
-                    object_id=permission_obj.id,
-                    server_id=server_id,
-                    node=permission
-                )
-                session.add(instance)
-        except IntegrityError:
-            pass
+        self.write_thread.put('permission',
+            *self.get_node_type_and_identifier(node), permission, server_id,
+            True)
 
     def permission_removed(self, node, permission, server_id):
-        with session_scope() as session:
-            node_type, identifier = self.get_node_type_and_identifier(node)
-            permission_obj = session.query(PermissionObject).filter_by(
-                identifier=identifier, type=node_type).one()
-
-            session.query(Permission).filter_by(
-                object_id=permission_obj.id,
-                server_id=server_id,
-                node=permission
-            ).delete(False)
+        self.write_thread.put('permission',
+            *self.get_node_type_and_identifier(node), permission, server_id,
+            False)
 
     def parent_added(self, node, parent_name):
-        try:
-            with session_scope() as session:
-                node_type, identifier = self.get_node_type_and_identifier(node)
-                child = get_or_create(session, PermissionObject,
-                    identifier=identifier, type=node_type)
-
-                parent = get_or_create(session, PermissionObject,
-                    identifier=parent_name, type='Parent')
-
-                parent_insert = parents_table.insert().values(
-                    parent_id=parent.id,
-                    child_id=child.id)
-                session.execute(parent_insert)
-        except IntegrityError:
-            pass
+        self.write_thread.put('parent',
+            *self.get_node_type_and_identifier(node), parent_name, None,
+            True)
 
     def parent_removed(self, node, parent_name):
-        with session_scope() as session:
-            node_type, identifier = self.get_node_type_and_identifier(node)
-            child = session.query(PermissionObject).filter_by(
-                identifier=identifier, type=node_type).one()
-
-            parent = session.query(PermissionObject).filter_by(
-                identifier=parent_name, type='Parent').one()
-
-            session.query(parents_table).filter_by(
-                child_id=child.id,
-                parent_id=parent.id
-            ).delete(False)
+        self.write_thread.put('parent',
+            *self.get_node_type_and_identifier(node), parent_name, None,
+            False)
 
     @staticmethod
     def get_node_type_and_identifier(node):
@@ -18,6 +18,12 @@ from configobj import ConfigObj
 from auth.base import Backend
 #   Core
 from core.settings import _core_settings
+#   Listeners
+from listeners import on_client_connect_listener_manager
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
+from listeners import on_level_shutdown_listener_manager
+from listeners import on_network_id_validated_listener_manager
 #   Paths
 from paths import BACKENDS_PATH
 #   Players
@@ -43,19 +49,45 @@ __all__ = ('_AuthManager',
 # >> CLASSES
 # =============================================================================
 class PermissionBase(dict):
-    """Base class for parent and player permissions."""
+    """Base class for parent and player permissions.
+
+    All granted permissions of the object and its parents are compiled into
+    a single regular expression and the results of all checks are cached.
+    Both are rebuilt after any permission or parent has been changed.
+    """
+
+    # Incremented whenever a permission or parent of any object changes
+    _generation = 0
 
     def __init__(self, name):
         """Initialize the object."""
         super().__init__()
         self.parents = set()
         self.name = name
+        self._matcher_generation = -1
+        self._matcher = None
+        self._results = dict()
 
     def __hash__(self):
         """Return a hash value based on the name."""
         # This is required, because we are adding dicts to sets
         return hash(self.name)
 
+    def __setitem__(self, permission, value):
+        """Store the permission and invalidate all cached results."""
+        super().__setitem__(permission, value)
+        PermissionBase._invalidate()
+
+    def __delitem__(self, permission):
+        """Remove the permission and invalidate all cached results."""
+        super().__delitem__(permission)
+        PermissionBase._invalidate()
+
+    @staticmethod
+    def _invalidate():
+        """Invalidate the cached results of all objects."""
+        PermissionBase._generation += 1
+
     def add(self, permission, server_id=None, update_backend=True):
         """Add a permission.
 
@@ -103,6 +135,7 @@ class PermissionBase(dict):
             # TODO: Detect cycles
             self.parents.add(parent)
             parent.children.add(self)
+            PermissionBase._invalidate()
 
         if update_backend and auth_manager.active_backend is not None:
             auth_manager.active_backend.parent_added(self, parent_name)
@@ -114,9 +147,10 @@ class PermissionBase(dict):
         :param bool update_backend: If True, the backend will be updated.
         """
         parent = auth_manager.parents[parent_name]
-        if parent not in self.parents:
+        if parent in self.parents:
             self.parents.remove(parent)
             parent.children.remove(self)
+            PermissionBase._invalidate()
 
         if update_backend and auth_manager.active_backend is not None:
             auth_manager.active_backend.parent_removed(self, parent_name)
@@ -129,25 +163,48 @@ class PermissionBase(dict):
 
     def __contains__(self, permission):
         """Return True if the permission is granted by this object."""
-        return self._has_permission(permission, [])
+        # Have permissions or parents changed since the last check?
+        if self._matcher_generation != PermissionBase._generation:
+            self._matcher = self._compile_matcher()
+            self._matcher_generation = PermissionBase._generation
+            self._results.clear()
+
+        try:
+            return self._results[permission]
+        except KeyError:
+            pass
+
+        result = self._results[permission] = (
+            self._matcher is not None and
+            self._matcher.match(permission) is not None)
+
+        return result
 
-    def _has_permission(self, permission, name_list):
+    def _compile_matcher(self):
+        """Compile all permissions of the object and its parents into one."""
+        # Use non-capturing wildcards, since the groups are not required
+        patterns = list()
+        for re_perm in self._get_all_patterns([]):
+            patterns.append(re_perm.pattern.replace('(.*)', '.*'))
+
+        if not patterns:
+            return None
+
+        return re.compile('|'.join(patterns))
+
+    def _get_all_patterns(self, name_list):
+        """Yield the compiled permissions of the object and its parents."""
         # Checks to see if parents are recursive
         if self.name in name_list:
             # Break if recursive
-            return False
+            return
         else:
             name_list.append(self.name)
 
-        for re_perm in self.values():
-            if re_perm.match(permission):
-                return True
+        yield from self.values()
 
         for parent in self.parents:
-            if parent._has_permission(permission, name_list):
-                return True
-
-        return False
+            yield from parent._get_all_patterns(name_list)
 
     def flatten(self):
         """Return all permissions flattened recursively.
@@ -161,6 +218,7 @@ class PermissionBase(dict):
     def clear(self):
         super().clear()
         self.parents.clear()
+        PermissionBase._invalidate()
 
 
 class PlayerPermissions(PermissionBase):
@@ -239,6 +297,16 @@ class _AuthManager(dict):
         self.active_backend = None
         self.server_id = -1
 
+        # Store {<index>: <PlayerPermissions>}
+        self._index_permissions = dict()
+        for manager in (
+                on_client_connect_listener_manager,
+                on_client_disconnect_listener_manager,
+                on_client_put_in_server_listener_manager,
+                on_level_shutdown_listener_manager,
+                on_network_id_validated_listener_manager):
+            manager.register_listener(self._clear_index_permissions)
+
     def find_and_add_available_backends(self):
         """Find and add all available backends.
 
@@ -289,6 +357,7 @@ class _AuthManager(dict):
             self.active_backend.unload()
             self.parents.clear()
             self.players.clear()
+            self._clear_index_permissions()
             self.active_backend = None
 
     def is_backend_loaded(self, backend_name):
@@ -301,8 +370,20 @@ class _AuthManager(dict):
 
     def get_player_permissions(self, index):
         """.. seealso:: :meth:`get_player_permissions_from_steamid`"""
-        return self.get_player_permissions_from_steamid(
-            playerinfo_from_index(index).steamid)
+        try:
+            return self._index_permissions[index]
+        except KeyError:
+            pass
+
+        permissions = self._index_permissions[
+            index] = self.get_player_permissions_from_steamid(
+                playerinfo_from_index(index).steamid)
+
+        return permissions
+
+    def _clear_index_permissions(self, *args):
+        """Clear the cached permissions of all player indexes."""
+        self._index_permissions.clear()
 
     def get_player_permissions_from_steamid(self, steamid):
         """Return the permissions of a player.
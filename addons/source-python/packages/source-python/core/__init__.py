@@ -8,9 +8,10 @@
 # Python Imports
 #   Collections
 from collections import defaultdict
+#   Contextlib
+from contextlib import contextmanager
 #   Inspect
 from inspect import getmodule
-from inspect import stack
 #   OS
 from os import sep
 #   Path
@@ -52,6 +53,7 @@ __all__ = ('AutoUnload',
            'PLATFORM',
            'SOURCE_ENGINE',
            'SOURCE_ENGINE_BRANCH',
+           'autounload_owner',
            'echo_console',
            )
 
@@ -68,6 +70,12 @@ PLATFORM = system().lower()
 # Get the sp.core logger
 core_logger = _sp_logger.core
 
+# Store module names resolved from a code object's file name
+_caller_module_names = dict()
+
+# Store the owners given to autounload_owner()
+_owner_overrides = list()
+
 
 # =============================================================================
 # >> CLASSES
@@ -86,11 +94,14 @@ class AutoUnload(object):
         # Get the class instance
         self = super().__new__(cls)
 
-        # Get the calling module
-        caller = getmodule(stack()[1][0])
+        # Get the owning module's name
+        if _owner_overrides:
+            caller = _owner_overrides[-1]
+        else:
+            caller = _get_caller_name(sys._getframe(1))
 
         # Call class-specific logic for adding the instance.
-        self._add_instance(caller.__name__)
+        self._add_instance(caller)
 
         # Return the instance
         return self
@@ -144,6 +155,44 @@ class GameConfigObj(ConfigObj):
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
+def _get_caller_name(frame):
+    """Return the name of the module the given frame is executed in.
+
+    Only the given frame is inspected. Frames that have no ``__name__`` in
+    their globals are resolved through :func:`inspect.getmodule` once per
+    file and the result is cached.
+    """
+    try:
+        return frame.f_globals['__name__']
+    except KeyError:
+        pass
+
+    filename = frame.f_code.co_filename
+    try:
+        return _caller_module_names[filename]
+    except KeyError:
+        pass
+
+    name = _caller_module_names[filename] = getmodule(frame).__name__
+    return name
+
+
+@contextmanager
+def autounload_owner(owner):
+    """Attribute all :class:`AutoUnload` instances created to the owner.
+
+    Instances created within the context are unloaded together with the
+    given owner instead of the module that created them.
+
+    :param owner: The owning module or its name.
+    """
+    _owner_overrides.append(getattr(owner, '__name__', owner))
+    try:
+        yield
+    finally:
+        _owner_overrides.pop()
+
+
 def echo_console(text):
     """Echo a message to the server's console."""
     # Import engine_server
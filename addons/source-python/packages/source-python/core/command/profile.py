@@ -0,0 +1,88 @@
+# ../core/command/profile.py
+
+"""Registers the sp profile sub-commands."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+#   Commands
+from commands.typed import TypedServerCommand
+#   Core
+from core.command import _core_command
+from core.command import core_command_logger
+from core.profiler import callback_profiler
+
+
+# =============================================================================
+# >> GLOBALS
+# =============================================================================
+logger = core_command_logger.profile
+
+
+# =============================================================================
+# >> sp profile
+# =============================================================================
+@_core_command.sub_command(['profile', 'start'])
+def _sp_profile_start(command_info, tick_budget:float=None):
+    """Start profiling listeners, events and hooks.
+
+    If a tick budget in milliseconds is given, a warning is logged for every
+    tick whose callbacks took longer.
+    """
+    callback_profiler.start(
+        None if tick_budget is None else tick_budget / 1000)
+    logger.log_message('Profiler has been started.')
+
+@_core_command.sub_command(['profile', 'stop'])
+def _sp_profile_stop(command_info):
+    """Stop profiling."""
+    callback_profiler.stop()
+    logger.log_message('Profiler has been stopped.')
+
+@_core_command.sub_command(['profile', 'reset'])
+def _sp_profile_reset(command_info):
+    """Remove all collected statistics."""
+    callback_profiler.reset()
+    logger.log_message('Profiler statistics have been reset.')
+
+@_core_command.sub_command(['profile', 'print'])
+def _sp_profile_print(command_info, count:int=20):
+    """Print the callbacks and owners with the highest total time."""
+    result = 'Callbacks (times in ms):\n  ' + _format_header(
+        'source - callback')
+    for stats in callback_profiler.get_callback_stats()[:count]:
+        result += '\n  ' + _format_stats(stats) + '  {0} - {1}'.format(
+            stats.source, stats.name)
+
+    result += '\n\nOwners (times in ms):\n  ' + _format_header('owner')
+    for stats in callback_profiler.get_owner_stats()[:count]:
+        result += '\n  ' + _format_stats(stats) + '  ' + stats.owner
+
+    if callback_profiler.tick_budget is not None:
+        result += '\n\nTicks over budget: {0}'.format(
+            callback_profiler.over_budget_ticks)
+
+    logger.log_message(result)
+
+
+# =============================================================================
+# >> HELPERS
+# =============================================================================
+def _format_header(name):
+    """Return the column headers of the printed statistics."""
+    return '{0:>8} {1:>10} {2:>8} {3:>8} {4:>8}  {5}'.format(
+        'calls', 'total', 'mean', 'p95', 'max', name)
+
+def _format_stats(stats):
+    """Return the formatted numbers of the given CallbackStats instance."""
+    return '{0:>8} {1:>10.3f} {2:>8.3f} {3:>8.3f} {4:>8.3f}'.format(
+        stats.count, stats.total * 1000, stats.mean * 1000,
+        stats.percentile(95) * 1000, stats.max * 1000)
+
+
+# =============================================================================
+# >> DESCRIPTIONS
+# =============================================================================
+_sp_profile = TypedServerCommand.parser.get_node(['sp', 'profile'])
+_sp_profile.description = 'Commands to profile listeners, events and hooks.'
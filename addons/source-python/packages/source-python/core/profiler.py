@@ -0,0 +1,280 @@
+# ../core/profiler.py
+
+"""Provides a profiler for listeners, events and hook callbacks."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Collections
+from collections import deque
+#   Time
+from time import perf_counter
+
+# Source.Python Imports
+#   Core
+from core import core_logger
+from _core import set_callback_profiler
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('CallbackStats',
+           '_CallbackProfiler',
+           'callback_profiler',
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Get the sp.core.profiler logger
+core_profiler_logger = core_logger.profiler
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class CallbackStats(object):
+    """Class used to store the execution times of a callback or owner."""
+
+    #: Number of execution times used to calculate percentiles
+    max_samples = 1000
+
+    def __init__(self, source, name, owner):
+        """Initialize the statistics.
+
+        :param str source: The listener, event or hook that called the
+            callback. None for the statistics of an owner.
+        :param str name: The qualified name of the callback. None for the
+            statistics of an owner.
+        :param str owner: The top-level module the callback is defined in.
+        """
+        self.source = source
+        self.name = name
+        self.owner = owner
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples = deque(maxlen=self.max_samples)
+
+    def add(self, elapsed):
+        """Add an execution time.
+
+        :param float elapsed: The execution time in seconds.
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+        self._samples.append(elapsed)
+
+    @property
+    def mean(self):
+        """Return the average execution time in seconds.
+
+        :rtype: float
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Return the given percentile of the recent execution times.
+
+        :param float percent: The percentile (e.g. 95).
+        :return: The execution time in seconds.
+        :rtype: float
+        """
+        if not self._samples:
+            return 0.0
+
+        samples = sorted(self._samples)
+        return samples[min(
+            len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+class _CallbackProfiler(object):
+    """Class used to profile listeners, events and hook callbacks.
+
+    While the profiler is running, every callback of a listener manager,
+    an event, a pre-event and a memory hook reports its execution time.
+    The times are accumulated per callback and per owning module. If a tick
+    budget is set, a warning is logged for every tick whose callbacks took
+    longer than the budget.
+    """
+
+    def __init__(self):
+        """Initialize the profiler."""
+        self.is_running = False
+
+        #: Maximum time in seconds the callbacks of a tick may take before
+        #: a warning is logged. None disables the warnings.
+        self.tick_budget = None
+
+        #: Number of ticks that exceeded the tick budget
+        self.over_budget_ticks = 0
+
+        # Store the statistics {(<source>, <name>): <CallbackStats>}
+        self._callbacks = dict()
+
+        # Store the statistics {<owner>: <CallbackStats>}
+        self._owners = dict()
+
+        # Store the execution times of the current tick
+        self._tick_total = 0.0
+        self._tick_calls = list()
+
+        # Cache the names of the callbacks {<callback>: (<name>, <owner>)}
+        self._names = dict()
+
+    def start(self, tick_budget=None):
+        """Start profiling.
+
+        :param float tick_budget: Maximum time in seconds the callbacks of
+            a tick may take before a warning is logged.
+        """
+        self.tick_budget = tick_budget
+        if self.is_running:
+            return
+
+        # Import the tick listener manager
+        # This is done here to avoid circular imports
+        from listeners import on_tick_listener_manager
+
+        self.is_running = True
+        self._reset_tick()
+        on_tick_listener_manager.register_listener(self._on_tick)
+        set_callback_profiler(self.record)
+
+    def stop(self):
+        """Stop profiling."""
+        if not self.is_running:
+            return
+
+        from listeners import on_tick_listener_manager
+
+        set_callback_profiler(None)
+        on_tick_listener_manager.unregister_listener(self._on_tick)
+        self.is_running = False
+
+    def reset(self):
+        """Remove all collected statistics."""
+        self._callbacks.clear()
+        self._owners.clear()
+        self._names.clear()
+        self.over_budget_ticks = 0
+        self._reset_tick()
+
+    def record(self, source, callback, elapsed):
+        """Add the execution time of a callback.
+
+        :param str source: The listener, event or hook that called the
+            callback.
+        :param callable callback: The callback that has been called.
+        :param float elapsed: The execution time in seconds.
+        """
+        name, owner = self._get_name(callback)
+
+        try:
+            stats = self._callbacks[source, name]
+        except KeyError:
+            stats = self._callbacks[source, name] = CallbackStats(
+                source, name, owner)
+
+        stats.add(elapsed)
+
+        try:
+            owner_stats = self._owners[owner]
+        except KeyError:
+            owner_stats = self._owners[owner] = CallbackStats(
+                None, None, owner)
+
+        owner_stats.add(elapsed)
+
+        self._tick_total += elapsed
+        if self.tick_budget is not None:
+            self._tick_calls.append((elapsed, source, name))
+
+    def call(self, source, callback, *args):
+        """Call the callback and add its execution time.
+
+        :param str source: The listener, event or hook that calls the
+            callback.
+        :param callable callback: The callback to call.
+        :return: The return value of the callback.
+        """
+        start = perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            self.record(source, callback, perf_counter() - start)
+
+    def get_callback_stats(self):
+        """Return the statistics of all callbacks.
+
+        :return: The statistics sorted by their total execution time.
+        :rtype: list
+        """
+        return sorted(
+            self._callbacks.values(),
+            key=lambda stats: stats.total, reverse=True)
+
+    def get_owner_stats(self):
+        """Return the statistics of all owning modules.
+
+        :return: The statistics sorted by their total execution time.
+        :rtype: list
+        """
+        return sorted(
+            self._owners.values(),
+            key=lambda stats: stats.total, reverse=True)
+
+    def _get_name(self, callback):
+        """Return the qualified name and the owner of the callback."""
+        # Callbacks are usually the same function objects, but bound methods
+        #   are created on every access, so use the underlying function
+        function = getattr(callback, '__func__', callback)
+        try:
+            return self._names[function]
+        except (KeyError, TypeError):
+            pass
+
+        module = getattr(function, '__module__', None) or '<unknown>'
+        name = '{0}.{1}'.format(module, getattr(
+            function, '__qualname__', type(function).__qualname__))
+        result = (name, module.split('.')[0])
+
+        # Unhashable callbacks can't be cached
+        try:
+            self._names[function] = result
+        except TypeError:
+            pass
+
+        return result
+
+    def _on_tick(self):
+        """Check the execution time of the previous tick."""
+        if (self.tick_budget is not None and
+                self._tick_total > self.tick_budget):
+            self.over_budget_ticks += 1
+
+            message = (
+                'Callbacks took {0:.3f} ms (budget: {1:.3f} ms):'.format(
+                    self._tick_total * 1000, self.tick_budget * 1000))
+            for elapsed, source, name in sorted(
+                    self._tick_calls, reverse=True)[:5]:
+                message += '\n\t{0:.3f} ms - {1} - {2}'.format(
+                    elapsed * 1000, source, name)
+
+            core_profiler_logger.log_warning(message)
+
+        self._reset_tick()
+
+    def _reset_tick(self):
+        """Reset the execution times of the current tick."""
+        self._tick_total = 0.0
+        self._tick_calls.clear()
+
+# The singleton object of the :class:`_CallbackProfiler` class
+callback_profiler = _CallbackProfiler()
@@ -9,10 +9,6 @@
 #   Enum
 from enum import IntEnum
 
-# Source.Python Imports
-#   Entities
-from entities.helpers import inthandle_from_index
-
 
 # =============================================================================
 # >> FORWARD IMPORTS
@@ -27,6 +23,7 @@ from _engines._trace import GameTrace
 from _engines._trace import Surface
 from _engines._trace import SurfaceFlags
 from _engines._trace import TraceFilter
+from _engines._trace import TraceFilterSimple
 from _engines._trace import EntityEnumerator
 from _engines._trace import TraceType
 from _engines._trace import CONTENTS_EMPTY
@@ -186,39 +183,3 @@ class ContentMasks(IntEnum):
     CURRENT = MASK_CURRENT
     DEAD_SOLID = MASK_DEADSOLID
 
-
-# =============================================================================
-# >> CLASSES
-# =============================================================================
-class TraceFilterSimple(TraceFilter):
-    """A simple trace filter."""
-
-    def __init__(self, ignore=(), trace_type=TraceType.EVERYTHING):
-        """Initialize the filter.
-
-        :param iterable ignore: An iterable of entity indexes to ignore. The
-            trace will not hit these entities.
-        :param TraceType trace_type: The trace type that should be used.
-        """
-        super().__init__()
-        self.trace_type = trace_type
-        self.ignore = tuple(map(inthandle_from_index, ignore))
-
-    def should_hit_entity(self, entity, mask):
-        """Called when a trace is about to hit an entity.
-
-        :param HandleEntity entity: The entity that should be hit.
-        :param int mask: The mask that was used to intialize the trace.
-        """
-        entity_inthandle = entity.basehandle.to_int()
-
-        # Check for entities to ignore
-        for ignore_inthandle in self.ignore:
-            if ignore_inthandle == entity_inthandle:
-                return False
-
-        return True
-
-    def get_trace_type(self):
-        """Return the trace type."""
-        return self.trace_type
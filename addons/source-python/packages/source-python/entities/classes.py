@@ -121,6 +121,8 @@ class _ServerClasses(TypeManager):
         """Store the base attributes."""
         super().__init__()
         self._entity_server_classes = defaultdict(list)
+        self._entity_attributes = defaultdict(dict)
+        self._entity_properties = dict()
 
     def get_entity_server_classes(self, entity):
         """Retrieve the first server class."""
@@ -205,6 +207,76 @@ class _ServerClasses(TypeManager):
         # Return the server classes
         return self._entity_server_classes[entity.classname]
 
+    def get_entity_attribute(self, entity, attr):
+        """Return the server class and descriptor providing the attribute.
+
+        The result is resolved once per classname and attribute and shared
+        by all entities of that classname. Attributes that are not provided
+        by any server class are not stored, so looking up arbitrary names
+        doesn't grow the cache.
+
+        :param BaseEntity entity: The entity to get the attribute for.
+        :param str attr: The name of the attribute.
+        :return: A tuple containing the first server class that provides
+            the attribute and the class attribute found in that server
+            class' MRO. Both values are None if no server class provides
+            the attribute.
+        :rtype: tuple
+        """
+        attributes = self._entity_attributes[entity.classname]
+
+        # Has the attribute already been resolved?
+        if attr in attributes:
+            return attributes[attr]
+
+        # Loop through all of the entity's server classes
+        for server_class in self.get_entity_server_classes(entity):
+
+            # Does the current server class contain the given attribute?
+            if not hasattr(server_class, attr):
+                continue
+
+            # Find the class attribute that provides the given attribute
+            descriptor = None
+            for cls in server_class.__mro__:
+                if attr in cls.__dict__:
+                    descriptor = cls.__dict__[attr]
+                    break
+
+            attributes[attr] = (server_class, descriptor)
+            return attributes[attr]
+
+        # The attribute was not found
+        return (None, None)
+
+    def get_entity_properties(self, entity):
+        """Return all properties available for the entity.
+
+        The dictionary is built once per classname and contains the
+        :class:`entities.datamaps.EntityProperty` instance of the first
+        server class providing each property. Calling this method for an
+        entity of each classname in use (e.g. on map start) pre-warms the
+        cache used by :meth:`entities.entity.Entity.get_property_int` and
+        the other property getters and setters.
+
+        :param BaseEntity entity: The entity to get the properties for.
+        :rtype: dict
+        """
+        classname = entity.classname
+
+        # Is the classname already stored?
+        if classname in self._entity_properties:
+            return self._entity_properties[classname]
+
+        # Loop through all of the entity's server classes in reverse order,
+        #   so properties of the first server class take precedence
+        properties = dict()
+        for server_class in reversed(self.get_entity_server_classes(entity)):
+            properties.update(server_class.properties)
+
+        self._entity_properties[classname] = properties
+        return properties
+
     def _get_base_server_classes(self, table):
         """Yield all baseclasses within the table."""
         # Loop through all of the props in the table
@@ -483,7 +555,8 @@ class _ServerClasses(TypeManager):
         value = self.instance_attribute(prop_type, offset)
 
         # Add the property to the properties dictionary
-        instance.properties[name] = EntityProperty(value, prop_type, networked)
+        instance.properties[name] = EntityProperty(
+            value, prop_type, networked, offset)
 
         # Is the property not a named property?
         if name not in contents:
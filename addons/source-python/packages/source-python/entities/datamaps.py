@@ -12,6 +12,8 @@ from enum import IntEnum
 # Source.Python Imports
 #   Memory
 from memory import Function
+from memory import Pointer
+from memory.helpers import Type
 
 
 # =============================================================================
@@ -100,11 +102,19 @@ class TypeDescriptionFlags(IntEnum):
 class EntityProperty(object):
     """Class used to store property information for verification."""
 
-    def __init__(self, instance, prop_type, networked):
+    def __init__(self, instance, prop_type, networked, offset=None):
         """Store the base attributes on instantiation."""
         self._instance = instance
         self._prop_type = prop_type
         self._networked = networked
+        self._offset = offset
+
+        # Store the Pointer methods to access native types directly
+        if offset is not None and Type.is_native(prop_type):
+            self._getter = getattr(Pointer, 'get_' + prop_type)
+            self._setter = getattr(Pointer, 'set_' + prop_type)
+        else:
+            self._getter = self._setter = None
 
     @property
     def instance(self):
@@ -121,6 +131,30 @@ class EntityProperty(object):
         """Return whether the property is networked."""
         return self._networked
 
+    @property
+    def offset(self):
+        """Return the offset of the property."""
+        return self._offset
+
+    def get_value(self, pointer):
+        """Return the value of the property for the given entity pointer."""
+        if self._getter is None:
+            return self._instance.fget(pointer)
+
+        return self._getter(pointer, self._offset)
+
+    def set_value(self, pointer, value):
+        """Set the value of the property for the given entity pointer.
+
+        .. note::
+
+            This does not notify the entity's edict of the change.
+        """
+        if self._setter is None:
+            self._instance.fset(pointer, value)
+        else:
+            self._setter(pointer, value, self._offset)
+
 
 class InputFunction(Function):
     """Class used to create and call an Input type function."""
@@ -89,23 +89,26 @@ class Entity(BaseEntity):
 
     def __getattr__(self, attr):
         """Find if the attribute is valid and returns the appropriate value."""
-        # Loop through all of the entity's server classes
-        for server_class in self.server_classes:
+        # Get the server class and descriptor providing the attribute
+        server_class, descriptor = server_classes.get_entity_attribute(
+            self, attr)
 
-            # Does the current server class contain the given attribute?
-            if hasattr(server_class, attr):
+        # If the attribute is not found, raise an error
+        if server_class is None:
+            raise AttributeError('Attribute "{0}" not found'.format(attr))
 
-                # Return the attribute's value
-                return getattr(make_object(server_class, self.pointer), attr)
+        # Is the attribute a property? Properties only require the pointer
+        # of the entity, so there is no need to wrap it.
+        if isinstance(descriptor, property):
+            return descriptor.__get__(self.pointer)
 
-        # If the attribute is not found, raise an error
-        raise AttributeError('Attribute "{0}" not found'.format(attr))
+        # Return the attribute's value
+        return getattr(make_object(server_class, self.pointer), attr)
 
     def __setattr__(self, attr, value):
         """Find if the attribute is value and sets its value."""
         # Is the given attribute a property?
-        if (attr in super().__dir__() and isinstance(
-                getattr(self.__class__, attr, None), property)):
+        if isinstance(getattr(self.__class__, attr, None), property):
 
             # Set the property's value
             object.__setattr__(self, attr, value)
@@ -113,17 +116,17 @@ class Entity(BaseEntity):
             # No need to go further
             return
 
-        # Loop through all of the entity's server classes
-        for server_class in self.server_classes:
+        # Get the server class providing the attribute
+        server_class = server_classes.get_entity_attribute(self, attr)[0]
 
-            # Does the current server class contain the given attribute?
-            if hasattr(server_class, attr):
+        # Does a server class contain the given attribute?
+        if server_class is not None:
 
-                # Set the attribute's value
-                setattr(server_class(self.pointer, wrap=True), attr, value)
+            # Set the attribute's value
+            setattr(server_class(self.pointer, wrap=True), attr, value)
 
-                # No need to go further
-                return
+            # No need to go further
+            return
 
         # If the attribute is not found, just set the attribute
         super().__setattr__(attr, value)
@@ -334,26 +337,8 @@ class Entity(BaseEntity):
 
     def _get_property(self, name, prop_type):
         """Verify the type and return the property."""
-        # Loop through all entity server classes
-        for server_class in self.server_classes:
-
-            # Is the name a member of the current server class?
-            if name not in server_class.properties:
-                continue
-
-            # Is the type the correct type?
-            if prop_type != server_class.properties[name].prop_type:
-                raise TypeError('Property "{0}" is of type {1} not {2}'.format(
-                    name, server_class.properties[name].prop_type, prop_type))
-
-            # Return the property for the entity
-            return getattr(
-                make_object(server_class._properties, self.pointer), name)
-
-        # Raise an error if the property name was not found
-        raise ValueError(
-            'Property "{0}" not found for entity type "{1}"'.format(
-                name, self.classname))
+        # Return the property for the entity
+        return self._find_property(name, prop_type).get_value(self.pointer)
 
     def set_property_bool(self, name, value):
         """Set the boolean property."""
@@ -417,35 +402,35 @@ class Entity(BaseEntity):
 
     def _set_property(self, name, prop_type, value):
         """Verify the type and set the property."""
-        # Loop through all entity server classes
-        for server_class in self.server_classes:
+        prop = self._find_property(name, prop_type)
 
-            # Is the name a member of the current server class?
-            if name not in server_class.properties:
-                continue
+        # Set the property for the entity
+        prop.set_value(self.pointer, value)
 
-            # Is the type the correct type?
-            if prop_type != server_class.properties[name].prop_type:
-                raise TypeError('Property "{0}" is of type {1} not {2}'.format(
-                    name, server_class.properties[name].prop_type, prop_type))
+        # Is the property networked?
+        if prop.networked:
 
-            # Set the property for the entity
-            setattr(make_object(
-                server_class._properties, self.pointer), name, value)
+            # Notify the change of state
+            self.edict.state_changed()
 
-            # Is the property networked?
-            if server_class.properties[name].networked:
+    def _find_property(self, name, prop_type):
+        """Return the EntityProperty instance after verifying its type."""
+        # Get the property from the cached properties of the entity type
+        try:
+            prop = server_classes.get_entity_properties(self)[name]
+        except KeyError:
 
-                # Notify the change of state
-                self.edict.state_changed()
+            # Raise an error if the property name was not found
+            raise ValueError(
+                'Property "{0}" not found for entity type "{1}"'.format(
+                    name, self.classname)) from None
 
-            # No need to go further
-            return
+        # Is the type the correct type?
+        if prop_type != prop.prop_type:
+            raise TypeError('Property "{0}" is of type {1} not {2}'.format(
+                name, prop.prop_type, prop_type))
 
-        # Raise an error if the property name was not found
-        raise ValueError(
-            'Property "{0}" not found for entity type "{1}"'.format(
-                name, self.classname))
+        return prop
 
     def get_input(self, name):
         """Return the InputFunction instance for the given name."""
@@ -496,7 +481,7 @@ class Entity(BaseEntity):
 
         # Do the trace
         engine_trace.trace_ray(ray, mask, TraceFilterSimple(
-            [entity.index for entity in generator()]), trace)
+            entity.index for entity in generator()), trace)
 
         # Return whether or not the trace did hit
         return trace.did_hit()
@@ -9,6 +9,7 @@
 #   Core
 from core import AutoUnload
 #   Entities
+from _entities._hooks import EntityHookCondition
 #   Memory
 from _memory import HookType
 #   Filters
@@ -25,6 +26,7 @@ from players.entity import Player
 # >> ALL DECLARATION
 # =============================================================================
 __all__ = ('EntityCondition',
+           'EntityHookCondition',
            'EntityPostHook',
            'EntityPreHook',
            )
@@ -83,7 +85,10 @@ class _EntityHook(AutoUnload):
 
         :param callable test_function: A callable object that accepts an
             Entity object as a parameter. The function should return True if
-            the entity matches the required one.
+            the entity matches the required one. If it is an
+            :class:`EntityHookCondition` instance, it is also evaluated
+            natively before the callback is called, so the callback is only
+            called for entities that match the condition.
         :param str/callable function: This is the function to hook. It can be
             either a string that defines the name of a function of the entity
             or a callable object that returns a :class:`memory.Function`
@@ -94,6 +99,10 @@ class _EntityHook(AutoUnload):
         self.hooked_function = None
         self.callback = None
 
+        # Use the test function as a native filter, if possible
+        self.condition = (test_function if isinstance(
+            test_function, EntityHookCondition) else None)
+
     def __call__(self, callback):
         """Store the callback and try initializing the hook."""
         self.callback = callback
@@ -130,7 +139,8 @@ class _EntityHook(AutoUnload):
         else:
             self.hooked_function = getattr(entity, self.function)
 
-        self.hooked_function.add_hook(self.hook_type, self.callback)
+        self.hooked_function.add_hook(
+            self.hook_type, self.callback, self.condition)
         return True
 
     def _unload_instance(self):
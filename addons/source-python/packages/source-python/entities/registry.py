@@ -0,0 +1,141 @@
+# ../entities/registry.py
+
+"""Provides a registry of all entities sorted by their class name."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Source.Python Imports
+#   Entities
+from entities import BaseEntityGenerator
+from entities.helpers import baseentity_from_inthandle
+#   Listeners
+from listeners import on_entity_created_listener_manager
+from listeners import on_entity_deleted_listener_manager
+from listeners import on_entity_spawned_listener_manager
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('entity_registry',
+           )
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _EntityRegistry(dict):
+    """Class used to store the entities of each class name.
+
+    The dictionary maps each class name to a dictionary of
+    ``{<inthandle>: <index>}`` items. The index is None for server-only
+    entities. It is kept up to date with the OnEntityCreated,
+    OnEntitySpawned and OnEntityDeleted listeners.
+
+    The class name of an entity can be changed with its "classname" key
+    value. Entities are filed again under their new class name when they
+    spawn, and whenever a lookup of their old class name finds them.
+    """
+
+    def __init__(self):
+        """Initialize the registry with all existing entities."""
+        super().__init__()
+
+        # Store the class name of each inthandle, so entities can be removed
+        #   even if their class name has changed in the meantime
+        self._class_names = dict()
+
+        for base_entity in BaseEntityGenerator():
+            self._add(base_entity.inthandle, base_entity.classname,
+                base_entity.index if base_entity.is_networked() else None)
+
+        on_entity_created_listener_manager.register_listener(
+            self._on_entity_created)
+        on_entity_spawned_listener_manager.register_listener(
+            self._on_entity_spawned)
+        on_entity_deleted_listener_manager.register_listener(
+            self._on_entity_deleted)
+
+    def __missing__(self, class_name):
+        """Return an empty dictionary for unknown class names."""
+        return dict()
+
+    def get_inthandles(self, class_name):
+        """Return the inthandles of all entities with the given class name.
+
+        :param str class_name: The class name of the entities.
+        :rtype: list
+        """
+        return list(self._get_entities(class_name))
+
+    def get_indexes(self, class_name):
+        """Return the indexes of all networked entities of the class name.
+
+        :param str class_name: The class name of the entities.
+        :rtype: list
+        """
+        return [index for index in self._get_entities(class_name).values()
+            if index is not None]
+
+    def find_class_names(self, part):
+        """Return all registered class names that contain the given part.
+
+        :param str part: The part that should be contained.
+        :rtype: list
+        """
+        return [class_name for class_name in self if part in class_name]
+
+    def _get_entities(self, class_name):
+        """Return the entities of the class name after filing them again.
+
+        Entities whose class name has changed are moved to their new class
+        name, so they are not returned.
+        """
+        entities = self[class_name]
+        for inthandle in list(entities):
+            self._update(baseentity_from_inthandle(inthandle))
+
+        return self[class_name]
+
+    def _add(self, inthandle, class_name, index):
+        """Add an entity to the registry."""
+        self._class_names[inthandle] = class_name
+        self.setdefault(class_name, dict())[inthandle] = index
+
+    def _remove(self, inthandle):
+        """Remove an entity from the registry and return its index."""
+        class_name = self._class_names.pop(inthandle, None)
+        if class_name is None:
+            return None
+
+        entities = self[class_name]
+        index = entities.pop(inthandle, None)
+
+        # Remove the class name if it has no entities left
+        if not entities:
+            self.pop(class_name, None)
+
+        return index
+
+    def _update(self, base_entity):
+        """File the entity again if its class name has changed."""
+        inthandle = base_entity.inthandle
+        class_name = base_entity.classname
+        if self._class_names.get(inthandle, class_name) != class_name:
+            self._add(inthandle, class_name, self._remove(inthandle))
+
+    def _on_entity_created(self, index, base_entity):
+        """Add the created entity to the registry."""
+        self._add(base_entity.inthandle, base_entity.classname, index)
+
+    def _on_entity_spawned(self, index, base_entity):
+        """File the spawned entity again if its class name has changed."""
+        self._update(base_entity)
+
+    def _on_entity_deleted(self, index, base_entity):
+        """Remove the deleted entity from the registry."""
+        self._remove(base_entity.inthandle)
+
+# The singleton object of the :class:`_EntityRegistry` class
+entity_registry = _EntityRegistry()
@@ -0,0 +1,154 @@
+# ../entities/snapshot.py
+
+"""Provides functions to read properties of many entities at once."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Array
+from array import array
+#   Collections
+from collections import OrderedDict
+
+# Source.Python Imports
+#   Entities
+from _entities._snapshot import EntitySnapshot
+from entities.classes import server_classes
+from entities.helpers import baseentity_from_index
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('snapshot',
+           'snapshot_columns',
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Store the number of values each supported property type occupies
+_type_widths = {
+    'bool': 1,
+    'char': 1,
+    'uchar': 1,
+    'short': 1,
+    'ushort': 1,
+    'int': 1,
+    'uint': 1,
+    'float': 1,
+    'Vector': 3,
+}
+
+# Store the native reader of each property list {<names>: <EntitySnapshot>}
+_readers = dict()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def snapshot(indexes, names, buffer=None):
+    """Read the given properties of all given entities into one buffer.
+
+    The properties are resolved once per classname. The values of all
+    entities are then copied in one native pass, without creating an
+    :class:`entities.entity.Entity` instance for any of the entities.
+
+    The buffer is laid out row by row, one row per index. Each row contains
+    the values of the given properties in the given order. ``Vector``
+    properties occupy three columns (x, y and z), all other properties
+    occupy one column. Use :func:`snapshot_columns` to get the column of
+    each property.
+
+    :param iterable indexes: The indexes of the entities to read.
+    :param iterable names: The names of the properties to read
+        (e.g. ``('m_vecOrigin', 'm_iHealth')``).
+    :param buffer: A preallocated, writable and contiguous buffer of doubles
+        that is large enough to store all rows (e.g. an
+        :class:`array.array` of type ``'d'`` or a NumPy ``float64`` array).
+        If None, a new :class:`array.array` of doubles is allocated.
+    :return: The buffer that has been filled. An :class:`array.array`
+        supports the buffer protocol, so it can be wrapped with
+        :func:`numpy.frombuffer` without copying it.
+    :raise ValueError: Raised if a property could not be found, the buffer
+        is too small or the property types differ between the given
+        entities.
+    :raise TypeError: Raised if a property is not of a numeric or
+        ``Vector`` type, or the buffer does not contain doubles.
+    """
+    names = tuple(names)
+    indexes = tuple(indexes)
+    reader = _get_reader(names)
+
+    # Allocate the buffer if none was given
+    if buffer is None:
+        if not indexes:
+            return array('d')
+
+        buffer = array('d', bytes(
+            len(indexes) * reader.get_row_width(indexes[0]) * 8))
+
+    reader.fill(indexes, buffer)
+    return buffer
+
+
+def snapshot_columns(index, names):
+    """Return the column of each property within a row of a snapshot.
+
+    :param int index: The index of an entity whose property types are used
+        to calculate the columns.
+    :param iterable names: The names of the properties.
+    :return: An ordered dictionary mapping the property names to their
+        first column. ``Vector`` properties occupy this and the following
+        two columns.
+    :rtype: OrderedDict
+    """
+    names = tuple(names)
+    entity = baseentity_from_index(index)
+    properties = _get_properties(entity, names)
+    columns = OrderedDict()
+    column = 0
+    for name, prop in zip(names, properties):
+        columns[name] = column
+        column += _type_widths[prop.prop_type]
+
+    return columns
+
+
+def _get_properties(entity, names):
+    """Return the EntityProperty instances of the entity's properties."""
+    properties = server_classes.get_entity_properties(entity)
+    result = list()
+    for name in names:
+        if name not in properties:
+            raise ValueError(
+                'Property "{0}" not found for entity type "{1}"'.format(
+                    name, entity.classname))
+
+        prop = properties[name]
+        if prop.prop_type not in _type_widths:
+            raise TypeError(
+                'Property "{0}" is of unsupported type {1}.'.format(
+                    name, prop.prop_type))
+
+        result.append(prop)
+
+    return result
+
+
+def _get_reader(names):
+    """Return the native reader of the given properties."""
+    try:
+        return _readers[names]
+    except KeyError:
+        pass
+
+    def resolve_layout(index):
+        """Return the offset and type of each property of the entity."""
+        return [(prop.offset, prop.prop_type) for prop in _get_properties(
+            baseentity_from_index(index), names)]
+
+    reader = _readers[names] = EntitySnapshot(resolve_layout)
+    return reader
@@ -12,15 +12,17 @@ from enum import IntEnum
 # Source.Python Imports
 #   Core
 from core import AutoUnload
+from core.profiler import callback_profiler
 #   Events
+from _events import GameEventHookFilter
 from events import GameEvent
 from events.manager import game_event_manager
 #   Hooks
 from hooks.exceptions import except_hooks
 #   Memory
+from _memory import HookType
 from memory import get_virtual_function
 from memory import make_object
-from memory.hooks import PreHook
 
 
 # =============================================================================
@@ -76,13 +78,33 @@ class PreEvent(AutoUnload):
 
 
 class _PreEventManager(dict):
-    """Dictionary class used to store pre-events with their callbacks."""
+    """Dictionary class used to store pre-events with their callbacks.
+
+    The names of the registered pre-events are also stored in a native
+    filter, so the FireEvent hook only calls into Python for registered
+    events. The hook is only added while at least one pre-event is
+    registered.
+    """
+
+    def __init__(self):
+        """Initialize the dictionary and the native filter."""
+        super().__init__()
+        self._filter = GameEventHookFilter()
 
     def __missing__(self, event_name):
         """Add the event to the dictionary and return its instance."""
+        # Is this the first pre-event?
+        if not self:
+
+            # Add the FireEvent hook
+            _fire_event.add_hook(HookType.PRE, _pre_game_event, self._filter)
+
         # Add the event to the dictionary as a new list
         value = self[event_name] = _PreEventList(event_name)
 
+        # Add the event to the native filter
+        self._filter.add_event_name(event_name)
+
         # Return the instance
         return value
 
@@ -145,6 +167,15 @@ class _PreEventManager(dict):
             # Remove the pre-event from the dictionary
             del self[event_name]
 
+            # Remove the event from the native filter
+            self._filter.remove_event_name(event_name)
+
+            # Was this the last pre-event?
+            if not self:
+
+                # Remove the FireEvent hook
+                _fire_event.remove_hook(HookType.PRE, _pre_game_event)
+
 # The singleton object of the :class:`_PreEventManager` class
 pre_event_manager = _PreEventManager()
 
@@ -190,9 +221,16 @@ class _PreEventList(list):
 # =============================================================================
 # >> PRE-HOOK FUNCTIONS
 # =============================================================================
-@PreHook(get_virtual_function(game_event_manager, 'FireEvent'))
+# Get the hooked IGameEventManager2::FireEvent function
+_fire_event = get_virtual_function(game_event_manager, 'FireEvent')
+
+
 def _pre_game_event(args):
-    """Call pre-event functions if the event is registered."""
+    """Call pre-event functions if the event is registered.
+
+    The hook is added by :class:`_PreEventManager` with a native filter, so
+    this is only called for registered events.
+    """
     # Get the GameEvent object
     game_event = make_object(GameEvent, args[1])
 
@@ -206,6 +244,9 @@ def _pre_game_event(args):
     # Create a variable to know what to do after all pre-events are called
     event_action = EventAction.CONTINUE
 
+    # Is the profiler running?
+    profiling = callback_profiler.is_running
+
     # Loop through all callbacks in the pre-event's list
     for callback in pre_event_manager[event_name]:
 
@@ -213,7 +254,11 @@ def _pre_game_event(args):
         try:
 
             # Call the callback and get its return value
-            current_action = callback(game_event)
+            if profiling:
+                current_action = callback_profiler.call(
+                    'PreEvent ' + event_name, callback, game_event)
+            else:
+                current_action = callback(game_event)
 
             # Is the return value invalid?
             if (current_action is not None and
@@ -6,6 +6,8 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python Imports
+#   Core
+from core.profiler import callback_profiler
 #   Hooks
 from hooks.exceptions import except_hooks
 #   Loggers
@@ -82,6 +84,9 @@ class _EventListener(list):
 
     def fire_game_event(self, game_event):
         """Loop through all callbacks for an event and calls them."""
+        # Is the profiler running?
+        profiling = callback_profiler.is_running
+
         # Loop through each callback in the event's list
         for callback in self:
 
@@ -89,7 +94,11 @@ class _EventListener(list):
             try:
 
                 # Call the callback
-                callback(game_event)
+                if profiling:
+                    callback_profiler.call(
+                        'Event ' + self.event_name, callback, game_event)
+                else:
+                    callback(game_event)
 
             # Was an error encountered?
             except:
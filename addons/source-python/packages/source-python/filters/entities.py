@@ -10,7 +10,9 @@
 from entities import BaseEntityGenerator
 from entities import EntityGenerator
 from entities.entity import Entity
+from entities.helpers import baseentity_from_inthandle
 from entities.helpers import index_from_edict
+from entities.registry import entity_registry
 #   Filters
 from filters.iterator import _IterObject
 
@@ -41,6 +43,35 @@ class BaseEntityIter(_IterObject):
         self.class_names = list() if class_names is None else class_names
         self.exact_match = exact_match
 
+    def __iter__(self):
+        """Iterate over all matching :class:`entities.entity.BaseEntity` objects.
+
+        If class names were given, only the matching entities of the
+        :data:`entities.registry.entity_registry` are visited. They are
+        yielded grouped by class name, in the order they were added to the
+        registry.
+        """
+        # Are there no class names to be checked?
+        if not self.class_names:
+            yield from self.iterator()
+            return
+
+        for class_name in self._get_class_names():
+            for inthandle in entity_registry.get_inthandles(class_name):
+                yield baseentity_from_inthandle(inthandle)
+
+    def _get_class_names(self):
+        """Return all registered class names matching the instance."""
+        # Are only exact matches allowed?
+        if self.exact_match:
+            return list(dict.fromkeys(self.class_names))
+
+        class_names = list()
+        for check_name in self.class_names:
+            class_names.extend(entity_registry.find_class_names(check_name))
+
+        return list(dict.fromkeys(class_names))
+
     @staticmethod
     def iterator():
         """Iterate over all :class:`entities.entity.BaseEntity` objects."""
@@ -72,6 +103,25 @@ class BaseEntityIter(_IterObject):
 class EntityIter(BaseEntityIter):
     """Entity iterate class."""
 
+    def __iter__(self):
+        """Iterate over all matching :class:`entities.entity.Entity` objects.
+
+        If class names were given, only the matching entities of the
+        :data:`entities.registry.entity_registry` are visited. Like
+        :meth:`iterator`, they are yielded in the order of their indexes.
+        """
+        # Are there no class names to be checked?
+        if not self.class_names:
+            yield from self.iterator()
+            return
+
+        indexes = list()
+        for class_name in self._get_class_names():
+            indexes.extend(entity_registry.get_indexes(class_name))
+
+        for index in sorted(indexes):
+            yield Entity(index)
+
     @staticmethod
     def iterator():
         """Iterate over all :class:`entities.entity.Entity` objects."""
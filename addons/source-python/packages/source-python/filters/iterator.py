@@ -59,8 +59,12 @@ class _IterObject(metaclass=_IterObjectMeta):
                 yield item
 
     def __len__(self):
-        """Return the length of the generator at this current time."""
-        return len([x for x in self])
+        """Return the length of the generator at this current time.
+
+        The filters depend on the current state of each item, so there is no
+        stored count. This iterates over all items, which takes linear time.
+        """
+        return sum(1 for _ in self)
 
     @property
     def iterator(self):
@@ -8,6 +8,8 @@
 # Python
 #   Ast
 import ast
+#   Functools
+from functools import lru_cache
 # Site-Package Imports
 #   ConfigObj
 from configobj import ConfigObj
@@ -15,15 +17,20 @@ from configobj import ConfigObj
 # Source.Python Imports
 #   Core
 from core import GAME_NAME
+#   Engines
+from engines.server import global_vars
 #   Entities
 from entities.helpers import index_from_edict
 #   Filters
 from filters.iterator import _IterObject
+#   Listeners
+from listeners import on_client_active_listener_manager
+from listeners import on_client_disconnect_listener_manager
 #   Paths
 from paths import SP_DATA_PATH
 #   Players
 from players import PlayerGenerator
-from players.entity import Player
+from players.dictionary import PlayerDictionary
 from players.helpers import index_from_userid
 
 
@@ -42,6 +49,10 @@ __all__ = ('get_default_filters',
 # Get the team's file for the current game
 _game_teams = ConfigObj(SP_DATA_PATH / 'teams' / GAME_NAME + '.ini')
 
+# Store the Player instances yielded by PlayerIter, so they are only created
+#   once per player instead of once per iteration
+_players = PlayerDictionary()
+
 
 # =============================================================================
 # >> PLAYER ITERATION CLASSES
@@ -56,7 +67,7 @@ class PlayerIter(_IterObject):
         for edict in PlayerGenerator():
 
             # Yield the Player instance for the current edict
-            yield Player(index_from_edict(edict))
+            yield _players[index_from_edict(edict)]
 
 
 # =============================================================================
@@ -126,12 +137,60 @@ for _number, _team in enumerate(('un', 'spec', 't', 'ct')):
         _team, _player_teams[_team]._player_is_on_team)
 
 
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _LazyFilters(dict):
+    """Class used to evaluate the default filters only when they are used.
+
+    The result of each filter is cached until the server tick changes.
+    """
+
+    def __init__(self):
+        """Initialize the dictionary."""
+        super().__init__()
+        self._tick = None
+
+        on_client_active_listener_manager.register_listener(
+            self._on_client_changed)
+        on_client_disconnect_listener_manager.register_listener(
+            self._on_client_changed)
+
+    def __missing__(self, filter_name):
+        """Evaluate and store the given filter.
+
+        :raise KeyError: Raised if the filter is not registered.
+        """
+        if filter_name not in PlayerIter.filters:
+            raise KeyError(filter_name)
+
+        instance = self[filter_name] = frozenset(PlayerIter(filter_name))
+        return instance
+
+    def _on_client_changed(self, index):
+        """Remove all stored results when a player joins or leaves."""
+        self.clear()
+
+    def refresh(self):
+        """Remove all stored results if the server tick has changed."""
+        if self._tick != global_vars.tick_count:
+            self.clear()
+            self._tick = global_vars.tick_count
+
+# Get the _LazyFilters instance
+_lazy_filters = _LazyFilters()
+
+
 # =============================================================================
 # >> FUNCTIONS
 # =============================================================================
 def parse_filter(expr, filters=None):
     """Parse an expression and return a set containing :class:`Player` objects.
 
+    Only the filters used by the expression are evaluated. If no filters
+    are given, the results of the default filters are cached for the rest
+    of the current server tick. Parsed expressions are cached as well.
+
     :param str expr: The expression to parse.
     :param dict filters: Filters that should be used instead of the default
         filters. All filter names must be lowercase.
@@ -141,33 +200,44 @@ def parse_filter(expr, filters=None):
     :raise ValueError: Raised if the conversion from userid to index failed.
     """
     if filters is None:
-        filters = get_default_filters()
+        _lazy_filters.refresh()
+        filters = _lazy_filters
 
-    return _parse_node(ast.parse(expr, mode='eval').body, filters)
+    return set(_compile_filter(expr)(filters))
 
 def get_default_filters():
     """Return the default filters (all available filters)."""
     return dict((name, set(PlayerIter(name))) for name in PlayerIter.filters)
 
-def _parse_node(node, filters):
-    """Parse an ast node."""
+@lru_cache(maxsize=256)
+def _compile_filter(expr):
+    """Parse an expression and return a function that evaluates it.
+
+    The returned function must be called with the filters to use.
+    """
+    return _compile_node(ast.parse(expr, mode='eval').body)
+
+def _compile_node(node):
+    """Compile an ast node."""
     # Userid?
     if isinstance(node, ast.Num):
-        return set([Player(index_from_userid(node.n))])
+        userid = node.n
+        return lambda filters: set([_players[index_from_userid(userid)]])
 
     # Filter?
     if isinstance(node, ast.Name):
-        return filters[node.id.casefold()]
+        filter_name = node.id.casefold()
+        return lambda filters: filters[filter_name]
 
     # + or -?
-    if isinstance(node.op, (ast.Add, ast.Sub)):
-        left = _parse_node(node.left, filters)
-        right = _parse_node(node.right, filters)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
 
         if isinstance(node.op, ast.Add):
-            return left | right
+            return lambda filters: left(filters) | right(filters)
 
-        return left - right
+        return lambda filters: left(filters) - right(filters)
 
     # TODO:
     # Figure out how to get the offset of the wrong node (for raising a better
@@ -6,9 +6,6 @@
 # >> IMPORTS
 # =============================================================================
 # Source.Python Imports
-#   Entities
-from entities import EntityGenerator
-from entities.helpers import index_from_edict
 #   Filters
 from filters.iterator import _IterObject
 #   Weapons
@@ -33,18 +30,22 @@ class WeaponIter(_IterObject):
     @staticmethod
     def iterator():
         """Iterate over all :class:`weapons.entity.Weapon` objects."""
-        # Import the Weapon class.
+        # Import the Weapon class and the entity registry.
         # This is done here to avoid circular imports
+        from entities.registry import entity_registry
         from weapons.entity import Weapon
 
-        # Loop through all entities on the server
-        for edict in EntityGenerator():
+        # Get the indexes of all weapons on the server
+        indexes = list()
+        for class_name in list(entity_registry):
+            if class_name in weapon_manager:
+                indexes.extend(entity_registry.get_indexes(class_name))
 
-            # Is the entity a weapon?
-            if edict.classname in weapon_manager:
+        # Loop through the weapons in the order of their indexes
+        for index in sorted(indexes):
 
-                # Yield the Weapon instance for the current edict
-                yield Weapon(index_from_edict(edict))
+            # Yield the Weapon instance for the current index
+            yield Weapon(index)
 
 
 class WeaponClassIter(_IterObject):
@@ -124,11 +124,11 @@ __all__ = ('ListenerManager',
 # Get the sp.listeners logger
 listeners_logger = _sp_logger.listeners
 
-on_version_update_listener_manager = ListenerManager()
-on_convar_changed_listener_manager = ListenerManager()
-on_plugin_loaded_manager = ListenerManager()
-on_plugin_unloaded_manager = ListenerManager()
-on_map_end_listener_manager = ListenerManager()
+on_version_update_listener_manager = ListenerManager('OnVersionUpdate')
+on_convar_changed_listener_manager = ListenerManager('OnConVarChanged')
+on_plugin_loaded_manager = ListenerManager('OnPluginLoaded')
+on_plugin_unloaded_manager = ListenerManager('OnPluginUnloaded')
+on_map_end_listener_manager = ListenerManager('OnMapEnd')
 
 _check_for_update = ConVar(
     'sp_check_for_update',
@@ -153,7 +153,7 @@ class ListenerManagerDecorator(AutoUnload):
         """Store the callback and register the listener."""
         # Log the <instance>.__init__ message
         listeners_logger.log_debug(
-            '{0}.__init__<{1}>'.format(self.name, callback))
+            '%s.__init__<%s>', self.name, callback)
 
         # Is the callback callable?
         if not callable(callback):
@@ -164,7 +164,7 @@ class ListenerManagerDecorator(AutoUnload):
 
         # Log the registering message
         listeners_logger.log_debug(
-            '{0}.__init__ - Registering'.format(self.name))
+            '%s.__init__ - Registering', self.name)
 
         # Store the callback
         self.callback = callback
@@ -176,7 +176,7 @@ class ListenerManagerDecorator(AutoUnload):
         """Call the listener."""
         # Log the calling
         listeners_logger.log_debug(
-            '{0}.__call__<{1}>'.format(self.name, args))
+            '%s.__call__<%s>', self.name, args)
 
         # Call the listener
         return self.callback(*args)
@@ -195,8 +195,8 @@ class ListenerManagerDecorator(AutoUnload):
         """Unregister the listener."""
         # Log the unregistering
         listeners_logger.log_debug(
-            '{0}._unload_instance - Unregistering <{1}>'.format(
-                self.name, self.callback))
+            '%s._unload_instance - Unregistering <%s>',
+            self.name, self.callback)
 
         # Unregister the listener
         self.manager.unregister_listener(self.callback)
@@ -32,7 +32,7 @@ BaseEntityOutput = manager.create_type_from_dict(
     'BaseEntityOutput', GameConfigObj(
         SP_DATA_PATH / 'entity_output' / 'CBaseEntityOutput.ini'))
 
-on_entity_output_listener_manager = ListenerManager()
+on_entity_output_listener_manager = ListenerManager('OnEntityOutput')
 
 
 # =============================================================================
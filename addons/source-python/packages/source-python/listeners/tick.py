@@ -10,16 +10,27 @@
 from contextlib import suppress
 #   Enum
 from enum import IntEnum
+#   Heapq
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+#   Itertools
+from itertools import count
+#   Sys
+import sys
 #   Threading
 from threading import Thread
 #   Time
-import bisect
 import time
 
 # Source.Python Imports
 #   Core
 from core import AutoUnload
 from core import WeakAutoUnload
+from core import _get_caller_name
+from core import autounload_owner
+#   Engines
+from engines.server import global_vars
 #   Hooks
 from hooks.exceptions import except_hooks
 #   Listeners
@@ -71,36 +82,105 @@ class GameThread(Thread):
 # >> DELAY CLASSES
 # =============================================================================
 class _DelayManager(list):
-    """A class that is responsible for executing delays."""
+    """A class that is responsible for executing delays.
+
+    The list is used as a heap of ``(due_time, sequence, delay)`` entries,
+    where the due time is measured with the manager's clock.
+    Delays that have been scheduled in ticks are stored in a second heap of
+    ``(exec_tick, sequence, delay)`` entries. Cancelled delays are not
+    removed from the heaps immediately. Instead, they are removed from the
+    set of pending delays and skipped once they are popped. Entries of a
+    delay that has been added again are skipped by their sequence number.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        """Initialize the heaps and the set of pending delays.
+
+        :param callable clock: The monotonic clock used to schedule the
+            delays. It is not affected by changes of the system time.
+        """
+        super().__init__()
+        self.clock = clock
+        self._tick_heap = []
+        self._pending = set()
+        self._sequence = count()
+
+    def __contains__(self, delay):
+        """Return True if the delay is pending."""
+        return delay in self._pending
 
     def _tick(self):
         """Internal tick listener."""
-        current_time = time.time()
-        while self and self[0].exec_time <= current_time:
+        self._execute_due(self._tick_heap, global_vars.tick_count)
+        self._execute_due(self, self.clock())
+        self._unregister_if_empty()
+
+    def _execute_due(self, heap, current):
+        """Execute all delays of the heap that are due."""
+        while heap and heap[0][0] <= current:
+            sequence, delay = heappop(heap)[1:]
+
+            # Has the delay been cancelled or added again?
+            if not self._is_current(sequence, delay):
+                continue
+
+            self._pending.remove(delay)
             try:
-                self.pop(0).execute()
+                delay.execute()
             except:
                 except_hooks.print_exception()
 
-        self._unregister_if_empty()
-
     def _register_if_empty(self):
-        """Register the internal tick listener if the list is empty."""
-        if not self:
+        """Register the internal tick listener if no delay is pending."""
+        if not self._pending:
             on_tick_listener_manager.register_listener(self._tick)
 
     def _unregister_if_empty(self):
-        """Unregister the internal tick listener if the list is empty."""
-        if not self:
+        """Unregister the internal tick listener if no delay is pending."""
+        if not self._pending:
             on_tick_listener_manager.unregister_listener(self._tick)
 
+            # Drop the entries of all cancelled delays
+            self.clear()
+            self._tick_heap.clear()
+
     def add(self, delay):
         """Add a delay to the list.
 
         :param Delay delay: The delay to add.
         """
         self._register_if_empty()
-        bisect.insort_left(self, delay)
+        self._pending.add(delay)
+        delay._sequence = next(self._sequence)
+        if delay.exec_tick is None:
+            heappush(self, (delay._due_time, delay._sequence, delay))
+        else:
+            heappush(
+                self._tick_heap, (delay.exec_tick, delay._sequence, delay))
+
+    def remove(self, delay):
+        """Cancel a pending delay.
+
+        :param Delay delay: The delay to cancel.
+        :raise ValueError: Raised if the delay is not pending.
+        """
+        try:
+            self._pending.remove(delay)
+        except KeyError:
+            raise ValueError('Delay is not running.')
+
+        # Compact the heaps if cancelled entries make up most of them
+        if len(self) + len(self._tick_heap) > 2 * len(self._pending) + 64:
+            for heap in (self, self._tick_heap):
+                heap[:] = [
+                    entry for entry in heap if self._is_current(*entry[1:])]
+                heapify(heap)
+
+        self._unregister_if_empty()
+
+    def _is_current(self, sequence, delay):
+        """Return True if the heap entry of the delay is still valid."""
+        return delay in self._pending and delay._sequence == sequence
 
 _delay_manager = _DelayManager()
 
@@ -123,10 +203,40 @@ class Delay(WeakAutoUnload):
 
         self.delay = delay
         self.exec_time = time.time() + delay
+        self.exec_tick = None
         self.callback = callback
         self.args = args
         self.kwargs = kwargs
+
+        # Store the time the delay is due on the manager's monotonic clock
+        self._due_time = _delay_manager.clock() + delay
+        _delay_manager.add(self)
+
+    @classmethod
+    def ticks(cls, ticks, callback, *args, **kwargs):
+        """Create a delay that is executed after the given number of ticks.
+
+        All delays that are due in the same tick are executed in the order
+        they have been created, independent of the wall-clock time.
+
+        :param int ticks: The number of ticks to wait.
+        :param callback: A callable object that should be called after the
+            delay expired.
+        :param args: Arguments that should be passed to the callback.
+        :param kwargs: Keyword arguments that should be passed to the
+            callback.
+        :rtype: Delay
+        """
+        with autounload_owner(_get_caller_name(sys._getframe(1))):
+            self = cls(
+                ticks * global_vars.interval_per_tick,
+                callback, *args, **kwargs)
+
+        # Reschedule the delay by ticks instead of time
+        _delay_manager.remove(self)
+        self.exec_tick = global_vars.tick_count + ticks
         _delay_manager.add(self)
+        return self
 
     def __lt__(self, other):
         """Return True if this :attr:`exec_time` is less than the other's."""
@@ -153,6 +263,11 @@ class Delay(WeakAutoUnload):
         """Return True if the delay running."""
         return self in _delay_manager
 
+    @property
+    def time_remaining(self):
+        """Return the remaining time in seconds until the delay executes."""
+        return self._due_time - _delay_manager.clock()
+
     def _unload_instance(self):
         with suppress(ValueError):
             self.cancel()
@@ -181,8 +296,8 @@ class TickRepeat(AutoUnload):
 
         # Log the __init__ message
         listeners_tick_logger.log_debug(
-            'TickRepeat.__init__: <{0}> <{1}> <{2}>'.format(
-                self.callback, self.args, self.kwargs))
+            'TickRepeat.__init__: <%s> <%s> <%s>',
+            self.callback, self.args, self.kwargs)
 
         # Set up private attributes
         self._interval = 0
@@ -197,7 +312,7 @@ class TickRepeat(AutoUnload):
         """Start the repeat loop."""
         # Log the start message
         listeners_tick_logger.log_debug(
-            'TickRepeat.start: <{0}> <{1}>'.format(interval, limit))
+            'TickRepeat.start: <%s> <%s>', interval, limit)
 
         # Is the repeat already running?
         if self._status is TickRepeatStatus.RUNNING:
@@ -290,7 +405,7 @@ class TickRepeat(AutoUnload):
         self._status = TickRepeatStatus.PAUSED
 
         # Set the remaining time in the current loop
-        self._loop_time = self._delay.exec_time - time.time()
+        self._loop_time = self._delay.time_remaining
 
         # Cancel the delay
         self._delay.cancel()
@@ -406,11 +521,13 @@ class TickRepeat(AutoUnload):
 
                 # Log continuing the loop
                 listeners_tick_logger.log_debug(
-                    'TickRepeat._execute - Remaining - {0}'.format(
-                        self.remaining))
+                    'TickRepeat._execute - Remaining - %s', self.remaining)
 
-            # Call the delay again
-            self._delay = Delay(self._interval, self._execute)
+            # Call the delay again. Re-arm relative to the scheduled time of
+            # the previous loop, so late executions do not cause drift.
+            self._delay = Delay(
+                max(0, self._interval + self._delay.time_remaining),
+                self._execute)
 
         # Are no more loops to be made?
         else:
@@ -18,6 +18,10 @@ from logging import FileHandler
 from logging import Formatter
 from logging import addLevelName
 from logging import getLogger
+#   Queue
+from queue import Queue
+#   Sys
+import sys
 
 # Source.Python Imports
 #   Cvars
@@ -54,6 +58,10 @@ addLevelName(EXCEPTION, 'EXCEPTION')
 # Store a formatter for use with the main log
 _main_log_formatter = Formatter('- %(name)s\t-\t%(levelname)s\n\t%(message)s')
 
+# Store the values of the ConVars used by LogManager instances
+#   {<convar name>: <value>}
+_convar_values = dict()
+
 
 # =============================================================================
 # >> CLASSES
@@ -69,6 +77,9 @@ class _LogInstance(dict):
         # Store the parent instance
         self.parent = parent
 
+        # Store the root instance
+        self._root = self if parent is None else parent.root
+
         # Was a parent class passed?
         if self.parent is not None:
 
@@ -135,16 +146,38 @@ class _LogInstance(dict):
         # Call the main logging method
         self._log(level, msg, *args, **kwargs)
 
+    def is_enabled_for(self, level):
+        """Return whether or not messages of the given level are logged.
+
+        :param int level: The logging level (e.g. :data:`logging.DEBUG`).
+        :rtype: bool
+        """
+        return self.level <= level
+
     def _log(self, level, msg, *args, **kwargs):
-        """Main logging method."""
+        """Main logging method.
+
+        If any arguments are given, the message is formatted with the
+        %-operator, but only if the message is actually logged.
+        """
+        # Get the root instance
+        root = self._root
+
         # Does the message need logged?
-        if self.level > level:
+        if root.level > level:
 
             # If not, simply return
             return
 
+        # Are there any arguments to format the message with?
+        if args:
+
+            # Format the message only once for all areas
+            msg = msg % args
+            args = ()
+
         # Get the areas to be used
-        areas = self.areas
+        areas = root.areas
 
         # Print to main log file?
         if MAIN_LOG & areas:
@@ -156,7 +189,7 @@ class _LogInstance(dict):
             # Create the record
             record = self.logger.makeRecord(
                 self.logger.name, level,
-                '(unknown file)', 0, msg, args, None)
+                '(unknown file)', 0, msg, (), None)
 
             # Get the message to send
             message = _main_log_formatter.format(record)
@@ -174,16 +207,16 @@ class _LogInstance(dict):
             echo_console(msg)
 
         # Print to the script's log file?
-        if SCRIPT_LOG & areas and self.root != _sp_logger:
+        if SCRIPT_LOG & areas and root is not _sp_logger:
 
             # Print message to the log file
-            self.logger.log(level, msg, *args, **kwargs)
+            self.logger.log(level, msg, **kwargs)
 
         # Print to the main SP log file?
         if SP_LOG & areas:
 
             # Print to the SP log file
-            _sp_logger.logger.log(level, msg, *args, **kwargs)
+            _sp_logger.logger.log(level, msg, **kwargs)
 
     @staticmethod
     def _get_level_value(level):
@@ -193,27 +226,17 @@ class _LogInstance(dict):
     @property
     def root(self):
         """Return the root class."""
-        # Store the current instance
-        instance = self
-
-        # Use a while statement to get the parent until root is found
-        while instance.parent is not None:
-
-            # Set the current instance to the parent
-            instance = instance.parent
-
-        # Return the root instance
-        return instance
+        return self._root
 
     @property
     def areas(self):
         """Return the root's areas value."""
-        return self.root.areas
+        return self._root.areas
 
     @property
     def level(self):
         """Return the root's level value."""
-        return self.root.level
+        return self._root.level
 
     @property
     def formatter(self):
@@ -265,19 +288,127 @@ class LogManager(_LogInstance):
                 log_path.parent.makedirs()
 
             # Create the handler an add it to the logger
-            self._handler = FileHandler(log_path)
+            self._handler = _AsyncFileHandler(log_path)
             self._handler.setFormatter(self.formatter)
             self.logger.addHandler(self._handler)
 
     @property
     def level(self):
         """Return the needed level value."""
-        return 50 - (self._level.get_int() * 10)
+        return 50 - (_get_convar_value(self._level) * 10)
 
     @property
     def areas(self):
         """Return the areas to print messages to."""
-        return self._areas.get_int()
+        return _get_convar_value(self._areas)
+
+
+class _LogWriter(object):
+    """Class used to write log records in a background thread."""
+
+    def __init__(self):
+        """Create the queue of records."""
+        self._queue = Queue()
+        self._thread = None
+
+    def put(self, handler, record):
+        """Add a record that should be written by the given handler.
+
+        Return False if the records can't be written in the background yet.
+        Threads only run reliably when the tick listener of
+        :class:`listeners.tick.GameThread` is active, so the thread is not
+        started before the module has been imported.
+
+        :rtype: bool
+        """
+        # Has the thread not been started yet?
+        if self._thread is None:
+
+            # Is it not possible to use a GameThread yet?
+            if 'listeners.tick' not in sys.modules:
+                return False
+
+            # Import GameThread
+            # This is done here to avoid circular imports
+            from listeners.tick import GameThread
+
+            # Start the thread
+            self._thread = GameThread(
+                target=self._write_records, name='sp_log_writer', daemon=True)
+            self._thread.start()
+
+        # Add the record to the queue
+        self._queue.put((handler, record))
+        return True
+
+    def wait(self):
+        """Wait until all records in the queue have been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _write_records(self):
+        """Write all records of the queue."""
+        while True:
+            handler, record = self._queue.get()
+            try:
+                FileHandler.emit(handler, record)
+            finally:
+                self._queue.task_done()
+
+# The singleton object of the :class:`_LogWriter` class
+_log_writer = _LogWriter()
+
+
+class _AsyncFileHandler(FileHandler):
+    """A FileHandler that writes its records in a background thread."""
+
+    def emit(self, record):
+        """Pass the record to the background thread."""
+        try:
+            # Merge the arguments and the exception into the message, so
+            #   they are not accessed from the background thread
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info and self.formatter is not None:
+                record.exc_text = self.formatter.formatException(
+                    record.exc_info)
+                record.exc_info = None
+
+        except Exception:
+            self.handleError(record)
+            return
+
+        # Write the record in the game thread if the background thread is
+        #   not available yet
+        if not _log_writer.put(self, record):
+            super().emit(record)
+
+    def close(self):
+        """Wait for the background thread and close the stream."""
+        _log_writer.wait()
+        super().close()
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _get_convar_value(convar):
+    """Return the integer value of the given ConVar.
+
+    The value is stored until :func:`_on_convar_changed` is called for the
+    ConVar.
+    """
+    try:
+        return _convar_values[convar.name]
+    except KeyError:
+        value = _convar_values[convar.name] = convar.get_int()
+        return value
+
+
+def _on_convar_changed(convar, old_value):
+    """Remove the stored value of the changed ConVar."""
+    _convar_values.pop(convar.name, None)
+
 
 # Set the core ConVars
 _level = ConVar(
@@ -28,6 +28,7 @@ from _memory import DataType
 from _memory import EXPOSED_CLASSES
 from _memory import Function
 from _memory import FunctionInfo
+from _memory import HookFilter
 from _memory import NULL
 from _memory import Pointer
 from _memory import ProcessorRegister
@@ -55,6 +56,7 @@ __all__ = ('BinaryFile',
            'EXPOSED_CLASSES',
            'Function',
            'FunctionInfo',
+           'HookFilter',
            'NULL',
            'Pointer',
            'ProcessorRegister',
@@ -27,6 +27,7 @@ from memory.helpers import MemberFunction
 from memory.helpers import NO_DEFAULT
 from memory.helpers import Type
 from memory.helpers import parse_data
+from memory.signatures import signature_cache
 
 
 # =============================================================================
@@ -274,6 +275,17 @@ class TypeManager(dict):
             )
         )
 
+        funcs = tuple(funcs)
+
+        # Search all signatures of each binary at once
+        binaries = dict()
+        for name, (binary, identifier, args, return_type, convention,
+                srv_check, doc) in funcs:
+            binaries.setdefault((binary, srv_check), []).append(identifier)
+
+        for (binary, srv_check), identifiers in binaries.items():
+            self.find_signatures(binary, srv_check, identifiers)
+
         # Create the functions
         cls_dict = {}
         for name, data in funcs:
@@ -281,6 +293,37 @@ class TypeManager(dict):
 
         return self.create_pipe(cls_dict)
 
+    @staticmethod
+    def find_signatures(binary, srv_check, identifiers):
+        """Search all signatures of the given identifiers in one pass.
+
+        Found signatures are added to the binary's signature cache, so
+        they don't need to be searched again when the functions are
+        created. The offsets are also stored on disk, so the binary
+        doesn't need to be scanned after a restart.
+
+        :param str binary: The path of the binary.
+        :param bool srv_check: Passed to :func:`memory.find_binary`.
+        :param iterable identifiers: Signatures and symbols. Symbols are
+            ignored.
+        """
+        signatures = [
+            identifier for identifier in identifiers
+            if isinstance(identifier, bytes)]
+
+        if not signatures:
+            return
+
+        # Errors are raised when the functions are accessed
+        try:
+            binary = find_binary(binary, srv_check)
+        except (IOError, RuntimeError):
+            return
+
+        signature_cache.load(binary)
+        binary.find_signatures(signatures)
+        signature_cache.store(binary)
+
     def pipe_function(
             self, binary, identifier, args=(), return_type=DataType.VOID,
             convention=Convention.CDECL, srv_check=True, doc=None):
@@ -384,6 +427,14 @@ class TypeManager(dict):
             )
         )
 
+        funcs = tuple(funcs)
+
+        # Search all signatures of the type at once
+        if cls_dict['_binary'] is not None:
+            self.find_signatures(
+                cls_dict['_binary'], cls_dict['_srv_check'],
+                [data[0] for name, data in funcs])
+
         # Create the functions
         for name, data in funcs:
             cls_dict[name] = self.function(*data)
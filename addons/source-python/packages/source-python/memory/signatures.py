@@ -0,0 +1,137 @@
+# ../memory/signatures.py
+
+"""Provides a persistent cache for signatures found in binaries."""
+
+# =============================================================================
+# >> IMPORTS
+# =============================================================================
+# Python Imports
+#   Binascii
+from binascii import hexlify
+from binascii import unhexlify
+#   Hashlib
+from hashlib import md5
+#   Json
+import json
+
+# Source.Python Imports
+#   Memory
+from memory import memory_logger
+#   Paths
+from paths import SP_DATA_PATH
+
+
+# =============================================================================
+# >> ALL DECLARATION
+# =============================================================================
+__all__ = ('_SignatureCache',
+           'signature_cache',
+           )
+
+
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Get the sp.memory.signatures logger
+signatures_logger = memory_logger.signatures
+
+# Get the path to the signature cache file
+_CACHE_PATH = SP_DATA_PATH / 'memory' / 'signature_cache.json'
+
+
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _SignatureCache(dict):
+    """Class used to store the offsets of found signatures on disk.
+
+    The offsets are stored per binary path together with the size and the
+    MD5 hash of the binary. If the binary changes, its offsets are
+    discarded.
+
+    The dictionary maps the path of a binary to a dictionary with the keys
+    ``size``, ``hash`` and ``signatures``, which maps hex encoded
+    signatures to their offsets.
+    """
+
+    def __init__(self):
+        """Load the cache file."""
+        super().__init__()
+
+        # Store the identity of each binary {<path>: (<size>, <hash>)}
+        self._identities = dict()
+
+        # Store the addresses of the binaries the cache has been loaded for
+        self._loaded = set()
+
+        if not _CACHE_PATH.isfile():
+            return
+
+        try:
+            with _CACHE_PATH.open() as f:
+                self.update(json.load(f))
+        except ValueError:
+            signatures_logger.log_warning(
+                'Signature cache is corrupt and has been discarded.')
+
+    def load(self, binary):
+        """Add the cached signatures of the binary to its signature cache.
+
+        :param BinaryFile binary: The binary to load the signatures for.
+        """
+        if binary.address in self._loaded:
+            return
+
+        self._loaded.add(binary.address)
+        data = self.get(binary.path)
+        if data is None or (data['size'], data['hash']) != self._get_identity(
+                binary):
+            return
+
+        binary.update_signature_cache(dict(
+            (unhexlify(signature), offset)
+            for signature, offset in data['signatures'].items()))
+
+    def store(self, binary):
+        """Write the found signatures of the binary to the cache file.
+
+        :param BinaryFile binary: The binary to store the signatures of.
+        """
+        signatures = dict(
+            (hexlify(signature).decode(), offset)
+            for signature, offset in binary.signature_cache.items())
+
+        data = self.get(binary.path)
+        if data is not None and data['signatures'] == signatures:
+            return
+
+        size, hash_value = self._get_identity(binary)
+        self[binary.path] = {
+            'size': size, 'hash': hash_value, 'signatures': signatures}
+
+        if not _CACHE_PATH.parent.isdir():
+            _CACHE_PATH.parent.makedirs()
+
+        with _CACHE_PATH.open('w') as f:
+            json.dump(self, f, indent=4, sort_keys=True)
+
+    def _get_identity(self, binary):
+        """Return the size and the MD5 hash of the binary's file."""
+        try:
+            return self._identities[binary.path]
+        except KeyError:
+            pass
+
+        hash_object = md5()
+        size = 0
+        with open(binary.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hash_object.update(chunk)
+                size += len(chunk)
+
+        identity = self._identities[binary.path] = (
+            size, hash_object.hexdigest())
+        return identity
+
+# The singleton object of the :class:`_SignatureCache` class
+signature_cache = _SignatureCache()
@@ -49,6 +49,11 @@ else:
     MAX_ITEM_COUNT = 7
     VALID_CHOICES = range(1, 11)
 
+# The number of seconds a radio menu is displayed after it has been sent.
+#   The menu queue resends the active menu every second, so a menu that has
+#   been overwritten or closed on the client is redrawn by the next refresh
+DISPLAY_TIME = 1
+
 
 # =============================================================================
 # >> CLASSES
@@ -64,27 +69,28 @@ class SimpleRadioMenu(_BaseMenu):
         """
         # Always enable BUTTON_CLOSE_SLOT
         slots = {BUTTON_CLOSE_SLOT}
-        buffer = ''
+        buffer = []
         page = self._player_pages[player_index]
         page.options = {}
         for raw_data in self:
             # Handle Text objects
             if isinstance(raw_data, Text):
-                buffer += raw_data._render(player_index)
+                buffer.append(raw_data._render(player_index))
 
             # Handle _BaseOption objects
             elif isinstance(raw_data, SimpleRadioOption):
-                buffer += raw_data._render(player_index)
+                buffer.append(raw_data._render(player_index))
                 if raw_data.selectable:
                     slots.add(raw_data.choice_index)
                     page.options[raw_data.choice_index] = raw_data
 
             # Handle every other object type as a text
             else:
-                buffer += Text(raw_data)._render(player_index)
+                buffer.append(Text(raw_data)._render(player_index))
 
         # Return the menu data
-        return (buffer[:-1] if buffer else '', self._slots_to_bin(slots), 1)
+        return (
+            ''.join(buffer)[:-1], self._slots_to_bin(slots), DISPLAY_TIME)
 
     @staticmethod
     def _slots_to_bin(slots):
@@ -187,18 +193,20 @@ class PagedRadioMenu(SimpleRadioMenu, _PagedMenuBase):
         # Create the page info string
         info = '[{0}/{1}]\n'.format(page.index + 1, self.page_count)
 
-        buffer = '{0} {1}'.format(_translate_text(
-            self.title, player_index), info) if self.title else info
+        buffer = ['{0} {1}'.format(_translate_text(
+            self.title, player_index), info) if self.title else info]
 
         # Set description if present
         if self.description is not None:
-            buffer += _translate_text(self.description, player_index) + '\n'
+            buffer.append(_translate_text(self.description, player_index))
+            buffer.append('\n')
 
         # Set the top separator if present
         if self.top_separator is not None:
-            buffer += self.top_separator + '\n'
+            buffer.append(self.top_separator)
+            buffer.append('\n')
 
-        return buffer
+        return ''.join(buffer)
 
     def _format_body(self, player_index, page, slots):
         """Prepare the body for the menu.
@@ -208,7 +216,7 @@ class PagedRadioMenu(SimpleRadioMenu, _PagedMenuBase):
         :param slots: A set to which slots can be added.
         :type slots: :class:`set`
         """
-        buffer = ''
+        buffer = []
 
         # Get all options for the current page
         options = tuple(enumerate(self._get_options(page.index), 1))
@@ -217,19 +225,21 @@ class PagedRadioMenu(SimpleRadioMenu, _PagedMenuBase):
         # Loop through all options of the current page
         for choice_index, option in options:
             if isinstance(option, PagedRadioOption):
-                buffer += option._render(player_index, choice_index)
+                buffer.append(option._render(player_index, choice_index))
                 if option.selectable:
                     slots.add(choice_index)
             elif isinstance(option, Text):
-                buffer += option._render(player_index, choice_index)
+                buffer.append(option._render(player_index, choice_index))
             else:
-                buffer += Text(option)._render(player_index, choice_index)
+                buffer.append(
+                    Text(option)._render(player_index, choice_index))
 
         # Fill the rest of the menu
         if self.fill:
-            buffer += ' \n' * (self._get_max_item_count() - len(options))
+            buffer.append(
+                ' \n' * (self._get_max_item_count() - len(options)))
 
-        return buffer
+        return ''.join(buffer)
 
     def _format_footer(self, player_index, page, slots):
         """Prepare the footer for the menu.
@@ -239,35 +249,36 @@ class PagedRadioMenu(SimpleRadioMenu, _PagedMenuBase):
         :param slots: A set to which slots can be added.
         :type slots: :class:`set`
         """
-        buffer = ''
+        buffer = []
 
         # Set the bottom separator if present
         if self.bottom_separator is not None:
-            buffer += self.bottom_separator + '\n'
+            buffer.append(self.bottom_separator)
+            buffer.append('\n')
 
         # TODO: Add translations
         # Add "Back" option
         back_selectable = page.index > 0 or self.parent_menu is not None
-        buffer += PagedRadioOption(
+        buffer.append(PagedRadioOption(
             'Back', highlight=back_selectable)._render(
-                player_index, BUTTON_BACK)
+                player_index, BUTTON_BACK))
         if back_selectable:
             slots.add(BUTTON_BACK)
 
         # Add "Next" option
         next_selectable = page.index < self.last_page_index
-        buffer += PagedRadioOption(
+        buffer.append(PagedRadioOption(
             'Next', highlight=next_selectable)._render(
-                player_index, BUTTON_NEXT)
+                player_index, BUTTON_NEXT))
         if next_selectable:
             slots.add(BUTTON_NEXT)
 
         # Add "Close" option
-        buffer += PagedRadioOption(
-            'Close', highlight=False)._render(player_index, BUTTON_CLOSE_SLOT)
+        buffer.append(PagedRadioOption(
+            'Close', highlight=False)._render(player_index, BUTTON_CLOSE_SLOT))
 
         # Return the buffer
-        return buffer
+        return ''.join(buffer)
 
     def _get_menu_data(self, player_index):
         """Return all relevant menu data as a dictionary.
@@ -281,12 +292,13 @@ class PagedRadioMenu(SimpleRadioMenu, _PagedMenuBase):
         slots = {BUTTON_CLOSE_SLOT}
 
         # Format the menu
-        buffer = self._format_header(player_index, page, slots)
-        buffer += self._format_body(player_index, page, slots)
-        buffer += self._format_footer(player_index, page, slots)
+        buffer = ''.join((
+            self._format_header(player_index, page, slots),
+            self._format_body(player_index, page, slots),
+            self._format_footer(player_index, page, slots)))
 
         # Return the menu data
-        return (buffer[:-1] if buffer else '', self._slots_to_bin(slots), 1)
+        return (buffer[:-1], self._slots_to_bin(slots), DISPLAY_TIME)
 
     def _select(self, player_index, choice_index):
         """See :meth:`menus.base._BaseMenu._select`."""
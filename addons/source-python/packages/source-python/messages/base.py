@@ -7,12 +7,18 @@
 # ============================================================================
 # Python Imports
 import collections
+from collections import OrderedDict
 
 # Source.Python Imports
 #   Colors
 from colors import WHITE
 #   Filters
 from filters.recipients import RecipientFilter
+#   Listeners
+from listeners import on_client_active_listener_manager
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_settings_changed_listener_manager
+from listeners import on_level_shutdown_listener_manager
 #   Players
 from players.helpers import get_client_language
 from players.helpers import playerinfo_from_index
@@ -31,9 +37,52 @@ from _messages import HudDestination
 from _messages import FadeFlags
 
 
+# =============================================================================
+# >> GLOBAL VARIABLES
+# =============================================================================
+# Types of field values that can be used to identify an encoded user message
+_payload_types = (str, int, float)
+
+
 # =============================================================================
 # >> CLASSES
 # =============================================================================
+class _ClientLanguages(dict):
+    """Class used to store the language of each player.
+
+    The language of bots is stored as None, because they don't need to
+    receive user messages.
+    """
+
+    def __init__(self):
+        """Register the listeners that keep the languages up to date."""
+        super().__init__()
+
+        on_client_active_listener_manager.register_listener(self._on_client)
+        on_client_disconnect_listener_manager.register_listener(
+            self._on_client)
+        on_client_settings_changed_listener_manager.register_listener(
+            self._on_client)
+        on_level_shutdown_listener_manager.register_listener(self.clear)
+
+    def __missing__(self, index):
+        """Store and return the language of the given player."""
+        if playerinfo_from_index(index).is_fake_client():
+            language = None
+        else:
+            language = get_client_language(index)
+
+        self[index] = language
+        return language
+
+    def _on_client(self, index):
+        """Remove the stored language of the given player."""
+        self.pop(index, None)
+
+# Get the _ClientLanguages instance
+_client_languages = _ClientLanguages()
+
+
 class AttrDict(dict):
     """A dictionary that redirects __getattr__ and __setattr__."""
 
@@ -44,6 +93,9 @@ class AttrDict(dict):
 class UserMessageCreator(AttrDict):
     """Provide an easy interface to create user messages."""
 
+    # Maximum number of encoded user messages that are stored per instance
+    max_payloads = 8
+
     def __init__(self, **kwargs):
         """Initialize the usermessage creator.
 
@@ -52,6 +104,10 @@ class UserMessageCreator(AttrDict):
         super().__setattr__('valid_fields', kwargs.keys())
         super().__init__(kwargs)
 
+        # Store the encoded user messages as a real attribute, so it's not
+        #   treated as a field
+        object.__setattr__(self, '_payloads', OrderedDict())
+
     def __setitem__(self, item, value):
         """Set a field value."""
         if item not in self.valid_fields:
@@ -80,6 +136,12 @@ class UserMessageCreator(AttrDict):
             setting.
         :param AttrDict translated_kwargs: The translated arguments.
         """
+        if UserMessage.is_protobuf():
+            key = self._get_payload_key(translated_kwargs)
+            if key is not None:
+                self._send_payload(player_indexes, key, translated_kwargs)
+                return
+
         user_message = UserMessage(
             RecipientFilter(*player_indexes), self.message_name)
 
@@ -90,20 +152,77 @@ class UserMessageCreator(AttrDict):
 
         user_message.send()
 
+    def _send_payload(self, player_indexes, key, translated_kwargs):
+        """Send an encoded user message to the given players.
+
+        The user message is only encoded if it hasn't been sent with the
+        same field values recently. Otherwise, the stored message is sent
+        again to the new recipients.
+
+        :param iterable player_indexes: All players with the same language
+            setting.
+        :param tuple key: The field values that identify the message.
+        :param AttrDict translated_kwargs: The translated arguments.
+        """
+        payloads = self._payloads
+        try:
+            recipients, user_message = payloads[key]
+        except KeyError:
+            # The recipient filter must be stored as well, because the user
+            #   message only references it
+            recipients = RecipientFilter(*player_indexes)
+            user_message = UserMessage(recipients, self.message_name)
+            self.protobuf(user_message.buffer, translated_kwargs)
+
+            payloads[key] = recipients, user_message
+            if len(payloads) > self.max_payloads:
+                payloads.popitem(last=False)
+        else:
+            payloads.move_to_end(key)
+            recipients.update(player_indexes)
+
+        user_message.send()
+
+    def _get_payload_key(self, translated_kwargs):
+        """Return a key that identifies the encoded user message.
+
+        Return None if a field value can't be used to identify the message
+        (e.g. a mutable object like a :class:`colors.Color` instance).
+        """
+        key = []
+        for field in sorted(self.valid_fields):
+            value = translated_kwargs[field]
+            if isinstance(value, (list, tuple)):
+                if not all(isinstance(item, _payload_types) for item in value):
+                    return None
+
+                value = tuple(value)
+
+            elif not isinstance(value, _payload_types):
+                return None
+
+            key.append((field, value))
+
+        return tuple(key)
+
     @staticmethod
     def _categorize_players_by_language(player_indexes):
         """Categorize players by their language.
 
         Return a dict in the following format:
         {<language>: set([<player index>, ...])}
+
+        The languages are stored until a player becomes active, changes
+        the settings or disconnects.
         """
         languages = collections.defaultdict(set)
         for index in player_indexes:
-            if playerinfo_from_index(index).is_fake_client():
+            language = _client_languages[index]
+            if language is None:
                 # No need to send a user message to bots
                 continue
 
-            languages[get_client_language(index)].add(index)
+            languages[language].add(index)
 
         return languages
 
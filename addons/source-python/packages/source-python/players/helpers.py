@@ -8,9 +8,19 @@
 # Source.Python Imports
 #   Engines
 from engines.server import engine_server
+#   Listeners
+from listeners import on_client_active_listener_manager
+from listeners import on_client_connect_listener_manager
+from listeners import on_client_disconnect_listener_manager
+from listeners import on_client_put_in_server_listener_manager
+from listeners import on_client_settings_changed_listener_manager
+from listeners import on_level_shutdown_listener_manager
+from listeners import on_network_id_validated_listener_manager
 #   Players
 from players import PlayerGenerator
 from players.games import get_client_language
+#   Steam
+from steam import SteamID
 
 
 # =============================================================================
@@ -85,29 +95,143 @@ __all__ = ('address_from_playerinfo',
            )
 
 
+# =============================================================================
+# >> CLASSES
+# =============================================================================
+class _PlayerIdentities(object):
+    """Class used to map the identities of all players to their indexes.
+
+    The mapping is built from all players on the server once it is needed
+    and is invalidated whenever a client connects, gets validated, changes
+    its settings (e.g. its name) or disconnects.
+    """
+
+    def __init__(self):
+        """Initialize the object and register the invalidating listeners."""
+        # Store {(<identity type>, <identity>): <index>}. None means that
+        #   the mapping needs to be rebuilt.
+        self._indexes = None
+
+        # Store {<index>: <uniqueid>}
+        self._uniqueids = dict()
+
+        for manager in (
+                on_client_active_listener_manager,
+                on_client_connect_listener_manager,
+                on_client_disconnect_listener_manager,
+                on_client_put_in_server_listener_manager,
+                on_client_settings_changed_listener_manager,
+                on_level_shutdown_listener_manager,
+                on_network_id_validated_listener_manager):
+            manager.register_listener(self._invalidate)
+
+    def get_index(self, identity_type, identity):
+        """Return the index of the player with the given identity.
+
+        :param str identity_type: The type of the identity ('steamid',
+            'steamid64', 'uniqueid' or 'name').
+        :param identity: The identity of the player.
+        :return: The index of the player or None if no player was found.
+        :rtype: int
+        """
+        if self._indexes is None:
+            self._build()
+
+        index = self._indexes.get((identity_type, identity))
+
+        # Verify the index, in case the player changed without notifying us
+        if index is not None and self._get_identity(
+                identity_type, index) != identity:
+            self._build()
+            index = self._indexes.get((identity_type, identity))
+
+        return index
+
+    def get_uniqueid(self, playerinfo):
+        """Return the cached UniqueID of the given player.
+
+        :param PlayerInfo playerinfo: The PlayerInfo instance of the player.
+        :rtype: str
+        """
+        index = index_from_playerinfo(playerinfo)
+        if index not in self._uniqueids:
+            self._uniqueids[index] = _uniqueid_from_playerinfo(playerinfo)
+
+        return self._uniqueids[index]
+
+    def _invalidate(self, *args):
+        """Invalidate all identities."""
+        self._indexes = None
+        self._uniqueids.clear()
+
+    def _build(self):
+        """Map the identities of all players to their indexes."""
+        self._indexes = indexes = dict()
+        for edict in PlayerGenerator():
+            playerinfo = playerinfo_from_edict(edict)
+            index = index_from_playerinfo(playerinfo)
+            steamid = playerinfo.steamid
+            indexes.setdefault(('steamid', steamid), index)
+            indexes.setdefault(('name', playerinfo.name), index)
+            indexes.setdefault(
+                ('uniqueid', self.get_uniqueid(playerinfo)), index)
+
+            steamid64 = _steamid64_from_string(steamid)
+            if steamid64 is not None:
+                indexes.setdefault(('steamid64', steamid64), index)
+
+    def _get_identity(self, identity_type, index):
+        """Return the current identity of the given player."""
+        try:
+            playerinfo = playerinfo_from_index(index)
+        except ValueError:
+            return None
+
+        if identity_type == 'steamid':
+            return playerinfo.steamid
+
+        if identity_type == 'steamid64':
+            return _steamid64_from_string(playerinfo.steamid)
+
+        if identity_type == 'uniqueid':
+            return self.get_uniqueid(playerinfo)
+
+        return playerinfo.name
+
+# The singleton object of the :class:`_PlayerIdentities` class
+_player_identities = _PlayerIdentities()
+
+
 # =============================================================================
 # >> OTHER HELPER FUNCTIONS
 # =============================================================================
 def index_from_steamid(steamid):
     """Return an index from the given SteamID.
 
-    :param str steamid: The SteamID to get the index of.
+    :param steamid: The SteamID to get the index of. This can be the
+        SteamID of the player's :class:`PlayerInfo` object or any SteamID2,
+        SteamID3 or SteamID64 representation of it.
+    :type steamid: str/int
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
+    index = None
 
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
+    # Is the SteamID a string?
+    if isinstance(steamid, str):
+        index = _player_identities.get_index('steamid', steamid)
 
-        # Is the current player's SteamID the same as the one given?
-        if playerinfo.steamid == steamid:
+    # Was no player found with the exact SteamID?
+    if index is None:
+        steamid64 = _steamid64_from_string(steamid)
+        if steamid64 is not None:
+            index = _player_identities.get_index('steamid64', steamid64)
 
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
+    if index is None:
+        raise ValueError(
+            'Conversion from "SteamID" ({}) to "Index" failed.'.format(
+                steamid))
 
-    raise ValueError(
-        'Conversion from "SteamID" ({}) to "Index" failed.'.format(steamid))
+    return index
 
 
 def index_from_uniqueid(uniqueid):
@@ -116,20 +240,13 @@ def index_from_uniqueid(uniqueid):
     :param str uniqueid: The UniqueID to get the index of.
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
+    index = _player_identities.get_index('uniqueid', uniqueid)
+    if index is None:
+        raise ValueError(
+            'Conversion from "UniqueID" ({}) to "Index" failed.'.format(
+                uniqueid))
 
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
-
-        # Is the current player's UniqueID the same as the one given?
-        if uniqueid_from_playerinfo(playerinfo) == uniqueid:
-
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
-
-    raise ValueError(
-        'Conversion from "UniqueID" ({}) to "Index" failed.'.format(uniqueid))
+    return index
 
 
 def index_from_name(name):
@@ -138,30 +255,44 @@ def index_from_name(name):
     :param str name: The player name to get the index of.
     :rtype: int
     """
-    # Loop through all players on the server
-    for edict in PlayerGenerator():
+    index = _player_identities.get_index('name', name)
+    if index is None:
+        raise ValueError(
+            'Conversion from "Name" ({}) to "Index" failed.'.format(name))
+
+    return index
 
-        # Get the PlayerInfo instance of the player...
-        playerinfo = playerinfo_from_edict(edict)
 
-        # Is the current player's name the same as the one given?
-        if playerinfo.name == name:
+def _steamid64_from_string(steamid):
+    """Return the SteamID64 of the given SteamID or None if it is invalid."""
+    if isinstance(steamid, int):
+        return steamid
 
-            # Return the index of the current player
-            return index_from_playerinfo(playerinfo)
+    # SteamID.parse raises a boost.python ArgumentError for anything else
+    if not isinstance(steamid, str):
+        return None
 
-    raise ValueError(
-        'Conversion from "Name" ({}) to "Index" failed.'.format(name))
+    try:
+        return SteamID.parse(steamid).to_uint64()
+    except ValueError:
+        return None
 
 
 def uniqueid_from_playerinfo(playerinfo):
     """Return the UniqueID for the given player.
 
+    The UniqueID is cached until the player's identity might have changed.
+
     :param PlayerInfo playerinfo: The PlayerInfo
         instance to get the UniqueID from.
     :return: The UniqueID of the player. E.g. 'BOT_STAN' or 'STEAM_0:0:12345'
     :rtype: str
     """
+    return _player_identities.get_uniqueid(playerinfo)
+
+
+def _uniqueid_from_playerinfo(playerinfo):
+    """Return the UniqueID for the given player without using the cache."""
     # Is the player a Bot?
     if playerinfo.is_fake_client():
 
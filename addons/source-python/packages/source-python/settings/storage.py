@@ -8,12 +8,22 @@
 # Python Imports
 #   SQLite3
 from sqlite3 import connect
+#   Threading
+from threading import Event
+from threading import Lock
 
 # Source.Python Imports
+#   Hooks
+from hooks.exceptions import except_hooks
 #   Listeners
+from listeners import on_client_active_listener_manager
+from listeners import on_client_disconnect_listener_manager
 from listeners import on_level_shutdown_listener_manager
+from listeners.tick import GameThread
 #   Paths
 from paths import SP_DATA_PATH
+#   Players
+from players.helpers import uniqueid_from_index
 
 
 # =============================================================================
@@ -28,6 +38,9 @@ if not _STORAGE_PATH.parent.isdir():
     # Create the ../data/source-python/settings/ directory
     _STORAGE_PATH.parent.mkdir()
 
+# Number of seconds a connection waits for the other one to release a lock
+_TIMEOUT = 30
+
 
 # =============================================================================
 # >> CLASSES
@@ -35,43 +48,21 @@ if not _STORAGE_PATH.parent.isdir():
 class _UniqueSettings(dict):
     """Class used to interact with the database for a specific uniqueid."""
 
-    def __init__(self, uniqueid):
-        """Store the given uniqueid and adds it to the players table."""
+    def __init__(self, uniqueid, values=()):
+        """Store the given uniqueid and its already stored values."""
         # Call the super class' __init__ to initialize the dictionary
-        super().__init__()
+        super().__init__(values)
 
         # Store the given uniqueid
         self._uniqueid = uniqueid
 
-        # If _player_settings_storage is initializing, don't try to call it
-        if _IN_INITIALIZATION:
-            return
-
-        # Add the uniqueid to the players table if it is not already a member
-        _player_settings_storage.cursor.execute(
-            """INSERT OR IGNORE INTO players VALUES(null, ?)""",
-            (self.uniqueid, ))
-
     def __setitem__(self, variable, value):
-        """Insert the given variable and value to their respective tables."""
+        """Set the value and queue it to be written to the database."""
         # Set the given variable's value in the dictionary
         super().__setitem__(variable, value)
 
-        # If _player_settings_storage is initializing, don't try to call it
-        if _IN_INITIALIZATION:
-            return
-
-        # Add the variable to the variables table if it is not already a member
-        _player_settings_storage.cursor.execute(
-            """INSERT OR IGNORE INTO variables VALUES(null, ?)""",
-            (variable, ))
-
-        # Set the value of the variable/uniqueid combination
-        _player_settings_storage.cursor.execute(
-            """INSERT OR REPLACE INTO variable_values SELECT """ +
-            """variables.id, players.id, ? FROM variables, players """ +
-            """WHERE variables.name=? AND players.uniqueid=?""",
-            (value, variable, self.uniqueid))
+        # Queue the value to be written by the writer thread
+        _player_settings_storage.writer.put(self.uniqueid, variable, value)
 
     @property
     def uniqueid(self):
@@ -79,16 +70,130 @@ class _UniqueSettings(dict):
         return self._uniqueid
 
 
+class _SettingsWriter(object):
+    """Class used to write changed settings in a background thread.
+
+    Values are coalesced by uniqueid and variable, so only the latest value
+    of each setting is written. All queued values are written in a single
+    transaction.
+    """
+
+    def __init__(self):
+        """Connect to the database and initialize the queue."""
+        # Connect to the database. The connection is only used while
+        #   holding the write lock, so it can be shared between threads.
+        self._connection = connect(
+            _STORAGE_PATH, timeout=_TIMEOUT, check_same_thread=False)
+        self._connection.text_factory = str
+
+        # Store the queued values {(<uniqueid>, <variable>): <value>}
+        self._pending = dict()
+
+        # Store the values that are currently being written
+        self._writing = dict()
+
+        self._lock = Lock()
+        self._write_lock = Lock()
+        self._event = Event()
+        self._thread = None
+
+    def put(self, uniqueid, variable, value):
+        """Queue the value of the given uniqueid's variable."""
+        with self._lock:
+            self._pending[uniqueid, variable] = value
+
+        # Start the thread if it is not running, yet
+        if self._thread is None:
+            self._thread = GameThread(
+                target=self._run, name='sp_settings_writer', daemon=True)
+            self._thread.start()
+
+        # Wake up the thread
+        self._event.set()
+
+    def get_pending(self, uniqueid):
+        """Return the values of the uniqueid that have not been stored yet.
+
+        :rtype: dict
+        """
+        values = dict()
+        with self._lock:
+            for queue in (self._writing, self._pending):
+                for (pending_uniqueid, variable), value in queue.items():
+                    if pending_uniqueid == uniqueid:
+                        values[variable] = value
+
+        return values
+
+    def flush(self):
+        """Write all queued values in the calling thread."""
+        with self._write_lock:
+            self._write()
+
+    def _run(self):
+        """Write the queued values whenever new values have been queued."""
+        while True:
+            self._event.wait()
+            self._event.clear()
+            try:
+                self.flush()
+            except:
+                except_hooks.print_exception()
+
+    def _write(self):
+        """Write the queued values in a single transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            self._writing, self._pending = self._pending, dict()
+
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    """INSERT OR IGNORE INTO players VALUES(null, ?)""",
+                    {(uniqueid, ) for uniqueid, variable in self._writing})
+
+                self._connection.executemany(
+                    """INSERT OR IGNORE INTO variables VALUES(null, ?)""",
+                    {(variable, ) for uniqueid, variable in self._writing})
+
+                self._connection.executemany(
+                    """INSERT OR REPLACE INTO variable_values SELECT """ +
+                    """variables.id, players.id, ? FROM variables, """ +
+                    """players WHERE variables.name=? AND """ +
+                    """players.uniqueid=?""",
+                    [(value, variable, uniqueid) for (uniqueid, variable),
+                        value in self._writing.items()])
+
+        except:
+            # Queue the values again, unless they have been changed
+            with self._lock:
+                for key, value in self._writing.items():
+                    self._pending.setdefault(key, value)
+
+            raise
+
+        finally:
+            with self._lock:
+                self._writing = dict()
+
+
 class _PlayerSettingsDictionary(dict):
-    """Dictionary class used to store user specific settings values."""
+    """Dictionary class used to store user specific settings values.
+
+    The values of a uniqueid are loaded from the database when the player
+    becomes active, or when they are first accessed. They are removed from
+    the dictionary again once the player disconnected.
+    """
 
     def __init__(self):
-        """Connect to the database and retrieve any stored values."""
+        """Connect to the database and create the tables."""
         # Call the super class' __init__ to initialize the dictionary
         super().__init__()
 
         # Connect to the database
-        self._connection = connect(_STORAGE_PATH)
+        self._connection = connect(_STORAGE_PATH, timeout=_TIMEOUT)
 
         # Set the text factory
         self.connection.text_factory = str
@@ -96,6 +201,9 @@ class _PlayerSettingsDictionary(dict):
         # Get the cursor instance
         self._cursor = self.connection.cursor()
 
+        # Use write-ahead logging, so reading does not block the writer
+        self.cursor.execute("""PRAGMA journal_mode=WAL""")
+
         # Create the variables table if it does not exist
         self.cursor.execute(
             """CREATE TABLE IF NOT EXISTS variables (id INTEGER """
@@ -111,31 +219,34 @@ class _PlayerSettingsDictionary(dict):
             """CREATE TABLE IF NOT EXISTS variable_values (vid """
             """INTEGER, pid INTEGER, value, PRIMARY KEY (vid, pid))""")
 
-        # Get all current data from the variable_values table
-        data = self.cursor.execute(
-            """SELECT V.name, P.uniqueid, value FROM """ +
-            """variable_values AS R JOIN variables AS V ON """ +
-            """R.vid=V.id JOIN players AS P ON R.pid=P.id""")
+        self.connection.commit()
 
-        # Fetch all objects from the result
-        data = data.fetchall()
+        # Store the writer used to store changed values
+        self._writer = _SettingsWriter()
 
-        # Is the table empty?
-        if not data:
+        # Store the uniqueids of the active players {<index>: <uniqueid>}
+        self._uniqueids = dict()
 
-            # No need to go further
-            return
+    def __missing__(self, uniqueid):
+        """Load the values of the given uniqueid from the database."""
+        # Get the values that have not been written, yet. This has to be
+        #   done before reading the database, because the writer might
+        #   commit them and forget about them while the database is read.
+        pending = self.writer.get_pending(uniqueid)
 
-        # Loop through all values in the data
-        for variable, uniqueid, value in data:
+        # Get the stored values of the uniqueid
+        data = self.cursor.execute(
+            """SELECT V.name, R.value FROM variable_values AS R """ +
+            """JOIN variables AS V ON R.vid=V.id JOIN players AS P """ +
+            """ON R.pid=P.id WHERE P.uniqueid=?""", (uniqueid, ))
 
-            # Store the value for the given uniqueid and variable name
-            self[uniqueid][variable] = value
+        values = dict(data.fetchall())
+
+        # Apply the pending values on top of the stored ones
+        values.update(pending)
 
-    def __missing__(self, uniqueid):
-        """Add the given uniqueid to the dictionary."""
         # Add the uniqueid to the dictionary
-        value = self[uniqueid] = _UniqueSettings(uniqueid)
+        value = self[uniqueid] = _UniqueSettings(uniqueid, values)
 
         # Return the _UniqueSettings instance
         return value
@@ -150,21 +261,42 @@ class _PlayerSettingsDictionary(dict):
         """Return the cursor instance."""
         return self._cursor
 
+    @property
+    def writer(self):
+        """Return the writer used to store changed values."""
+        return self._writer
+
+    def flush(self):
+        """Write all changed values to the database."""
+        self.writer.flush()
+
+    def on_client_active(self, index):
+        """Load the settings of the player."""
+        uniqueid = self._uniqueids[index] = uniqueid_from_index(index)
+        self[uniqueid]
+
+    def on_client_disconnect(self, index):
+        """Remove the settings of the player."""
+        uniqueid = self._uniqueids.pop(index, None)
+        if uniqueid is not None:
+            self.pop(uniqueid, None)
+
     def on_level_shutdown(self):
-        """Store the dictionary to the database on map change."""
-        self.connection.commit()
+        """Write all changed values and remove inactive players' settings."""
+        self.flush()
 
-# Set a variable to make sure _UniqueSettings doesn't
-#   call _player_settings_storage while it is being initialized.
-_IN_INITIALIZATION = True
+        active_uniqueids = set(self._uniqueids.values())
+        for uniqueid in tuple(self):
+            if uniqueid not in active_uniqueids:
+                del self[uniqueid]
 
 # Get the _PlayerSettingsDictionary instance
 _player_settings_storage = _PlayerSettingsDictionary()
 
-# Now that the initialization is done, allow
-#   _UniqueSettings to call _player_settings_storage.
-_IN_INITIALIZATION = False
-
-# Register a level shutdown listener to store the database on map change
+# Register the listeners used to load and remove the settings of players
+on_client_active_listener_manager.register_listener(
+    _player_settings_storage.on_client_active)
+on_client_disconnect_listener_manager.register_listener(
+    _player_settings_storage.on_client_disconnect)
 on_level_shutdown_listener_manager.register_listener(
     _player_settings_storage.on_level_shutdown)
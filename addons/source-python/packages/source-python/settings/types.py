@@ -123,26 +123,26 @@ class _SettingsType(object):
         # Get the client's uniqueid
         uniqueid = uniqueid_from_index(index)
 
-        # Is the uniqueid in the setting's storage dictionary?
-        if uniqueid in _player_settings_storage:
+        # Get the client's stored settings (loaded if necessary)
+        settings = _player_settings_storage[uniqueid]
 
-            # Is the convar in the clients's dictionary?
-            if self.convar in _player_settings_storage[uniqueid]:
+        # Is the convar in the clients's dictionary?
+        if self.convar in settings:
 
-                # Get the client's value for the convar
-                value = _player_settings_storage[uniqueid][self.convar]
+            # Get the client's value for the convar
+            value = settings[self.convar]
 
-                # Try to typecast the value, suppressing ValueErrors
-                with suppress(ValueError):
+            # Try to typecast the value, suppressing ValueErrors
+            with suppress(ValueError):
 
-                    # Typecast the given value
-                    value = self._type(value)
+                # Typecast the given value
+                value = self._type(value)
 
-                    # Is the given value a proper one for the convar?
-                    if self._is_valid_setting(value):
+                # Is the given value a proper one for the convar?
+                if self._is_valid_setting(value):
 
-                        # Return the value
-                        return value
+                    # Return the value
+                    return value
 
         # Return the default value
         return self.default
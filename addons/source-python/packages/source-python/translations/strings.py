@@ -10,6 +10,10 @@
 from binascii import unhexlify
 #   Codecs
 from codecs import unicode_escape_decode
+#   Functools
+from functools import lru_cache
+#   String
+from string import Formatter
 #   Re
 from re import compile as re_compile
 from re import VERBOSE
@@ -44,6 +48,12 @@ _double_escaped_pattern = re_compile(
     r"""(\\(?:(?P<octal>[0-7]{1,3})|x(?P<hexadecimal>[0-9|a-f|A-F]{2})|
     (?P<notation>a|b|e|f|n|r|s|t|v)))""", VERBOSE)
 
+# Get a Formatter instance to parse the translation strings
+_formatter = Formatter()
+
+# Store the types of token values whose formatted strings can be cached
+_cached_token_types = (str, int, float, type(None))
+
 
 # =============================================================================
 # >> CLASSES
@@ -232,8 +242,25 @@ class TranslationStrings(dict):
         super().__init__()
         self.tokens = {}
 
+        # Store the resolved languages {<given language>: <language>}
+        self._languages = {}
+
+    def __setitem__(self, language, string):
+        """Store the string as a template for the given language."""
+        super().__setitem__(language, _Template(string))
+        self._languages.clear()
+
+    def __delitem__(self, language):
+        """Remove the string of the given language."""
+        super().__delitem__(language)
+        self._languages.clear()
+
     def get_string(self, language=None, **tokens):
-        """Return the language string for the given language/tokens."""
+        """Return the language string for the given language/tokens.
+
+        The given tokens are used in addition to the stored tokens, but they
+        are not stored.
+        """
         # Was no language passed?
         if language is None:
 
@@ -250,13 +277,45 @@ class TranslationStrings(dict):
             # Possibly raise an error silently here
             return ''
 
-        # Update the stored tokens with the given ones
-        self.tokens.update(tokens)
+        # Were any tokens given?
+        if tokens:
+
+            # Use the given tokens in addition to the stored tokens
+            tokens = dict(self.tokens, **tokens)
+
+        # Otherwise
+        else:
+
+            # Only use the stored tokens
+            tokens = self.tokens
+
+        # Get the template of the language
+        template = self[language]
+
+        # Was the string stored without being compiled?
+        if not isinstance(template, _Template):
+            template = _Template(template)
 
         # Return the formatted message
-        return self[language].format(**self.tokens)
+        return template.render(tokens)
 
     def get_language(self, language):
+        """Return the language to be used."""
+        # The result depends on the server's default language and the
+        #   default language of the strings as well
+        key = (language, language_manager.default,
+               getattr(self, '_default_language', None))
+
+        # Has the language not been resolved yet?
+        if key not in self._languages:
+
+            # Resolve and store the language
+            self._languages[key] = self._find_language(language)
+
+        # Return the language
+        return self._languages[key]
+
+    def _find_language(self, language):
         """Return the language to be used."""
         # Get the given language's shortname
         language = language_manager.get_language(language)
@@ -291,5 +350,90 @@ class TranslationStrings(dict):
         # Return None as the language, as no language has been found
         return None
 
+
+class _Template(str):
+    """Class used to store a compiled translation string."""
+
+    def __new__(cls, string):
+        """Parse the names of the tokens used by the string."""
+        self = super().__new__(cls, string)
+        self.token_names = _get_token_names(string)
+        return self
+
+    def render(self, tokens):
+        """Return the string formatted with the given tokens.
+
+        The formatted string is cached if all tokens used by the string
+        have immutable values.
+        """
+        # Can the formatted string not be cached?
+        if self.token_names is None:
+            return self.format(**tokens)
+
+        # Get the used tokens and their types
+        key = []
+        for name in self.token_names:
+
+            # Is the token missing or its value mutable?
+            if (name not in tokens or
+                    not isinstance(tokens[name], _cached_token_types)):
+
+                # Let str.format raise or use the mutable value
+                return self.format(**tokens)
+
+            value = tokens[name]
+            key.append((name, type(value), value))
+
+        # Return the cached string
+        return _render_template(self, tuple(key))
+
+
+# =============================================================================
+# >> FUNCTIONS
+# =============================================================================
+def _get_token_names(string):
+    """Return the sorted names of all tokens used by the given string.
+
+    Return None if the string uses positional fields or can't be parsed.
+    """
+    names = set()
+    try:
+        for literal, field, format_spec, conversion in _formatter.parse(
+                string):
+
+            # Is there no field?
+            if field is None:
+                continue
+
+            # Get the name of the token (e.g. "player" for "player.name")
+            name = field.split('.', 1)[0].split('[', 1)[0]
+
+            # Is the field positional?
+            if not name or name.isdigit():
+                return None
+
+            names.add(name)
+
+            # Does the format spec contain nested fields?
+            if format_spec:
+                nested_names = _get_token_names(format_spec)
+                if nested_names is None:
+                    return None
+
+                names.update(nested_names)
+
+    except ValueError:
+        return None
+
+    return tuple(sorted(names))
+
+
+@lru_cache(maxsize=1024)
+def _render_template(template, key):
+    """Return the template formatted with the given tokens."""
+    return str.format(template, **dict(
+        (name, value) for name, value_type, value in key))
+
+
 # Get the translations language strings
 _translation_strings = LangStrings('_core/translations_strings')
@@ -15,7 +15,7 @@ from core import AutoUnload
 #   Entities
 from entities.constants import INVALID_ENTITY_INDEX
 from entities.helpers import edict_from_pointer
-from entities.hooks import EntityCondition
+from entities.hooks import EntityHookCondition
 from entities.hooks import EntityPreHook
 #   Filters
 from filters.players import PlayerIter
@@ -376,15 +376,14 @@ weapon_restriction_handler = WeaponRestrictionHandler()
 # =============================================================================
 # >> FUNCTION HOOKS
 # =============================================================================
-@EntityPreHook(EntityCondition.is_human_player, 'bump_weapon')
-@EntityPreHook(EntityCondition.is_bot_player, 'bump_weapon')
+@EntityPreHook(EntityHookCondition(is_player=True), 'bump_weapon')
 def _on_weapon_bump(args):
     """Return whether the player is allowed to pickup the weapon."""
     return weapon_restriction_manager.on_player_bumping_weapon(
         make_object(Player, args[0]), edict_from_pointer(args[1]).classname)
 
 
-@EntityPreHook(EntityCondition.is_player, 'buy_internal')
+@EntityPreHook(EntityHookCondition(is_player=True), 'buy_internal')
 def _on_weapon_purchase(args):
     """Return whether the player is allowed to purchase the weapon."""
     return weapon_restriction_manager.on_player_purchasing_weapon(
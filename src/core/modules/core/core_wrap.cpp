@@ -29,6 +29,7 @@
 //-----------------------------------------------------------------------------
 #include "export_main.h"
 #include "sp_main.h"
+#include "utilities/callback_profiler.h"
 
 
 //-----------------------------------------------------------------------------
@@ -53,6 +54,15 @@ DECLARE_SP_MODULE(_core)
 	// Constants...
 	_core.attr("SOURCE_ENGINE") = XSTRINGIFY(SOURCE_ENGINE);
 	_core.attr("SOURCE_ENGINE_BRANCH") = XSTRINGIFY(SOURCE_ENGINE_BRANCH);
+
+	// Functions...
+	def("set_callback_profiler",
+		&SetCallbackProfiler,
+		"Set the callable that receives the execution time of listeners and hook callbacks.\n\n"
+		":param callable profiler: The callable that is called with the source, the callback and "
+		"the execution time in seconds. None disables profiling.",
+		args("profiler")
+	);
 }
 
 
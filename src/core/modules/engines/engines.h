@@ -30,11 +30,15 @@
 //-----------------------------------------------------------------------------
 // Includes.
 //-----------------------------------------------------------------------------
+#include <vector>
+
 #include "utilities/wrap_macros.h"
 #include "engine/iserverplugin.h"
 #include "eiface.h"
 #include "engine/IEngineTrace.h"
 #include "iserver.h"
+#include "boost/unordered_set.hpp"
+#include "utilities/conversions.h"
 
 #include ENGINE_INCLUDE_PATH(engines.h)
 
@@ -132,6 +136,132 @@ public:
 };
 
 
+//-----------------------------------------------------------------------------
+// CIgnoreTraceFilter class.
+//-----------------------------------------------------------------------------
+class CIgnoreTraceFilter: public ITraceFilter
+{
+public:
+	CIgnoreTraceFilter(object oIgnore=tuple(), TraceType_t iTraceType=TRACE_EVERYTHING)
+	{
+		m_iTraceType = iTraceType;
+		for (stl_input_iterator<unsigned int> it(oIgnore), end; it != end; ++it)
+		{
+			AddIgnore(ExcIntHandleFromIndex(*it));
+		}
+	}
+
+	virtual bool ShouldHitEntity(IHandleEntity* pEntity, int mask)
+	{
+		return m_setIgnore.find(pEntity->GetRefEHandle().ToInt()) == m_setIgnore.end();
+	}
+
+	virtual TraceType_t GetTraceType() const
+	{
+		return m_iTraceType;
+	}
+
+	tuple GetIgnore()
+	{
+		list ignore;
+		for (std::vector<unsigned int>::iterator it = m_vecIgnore.begin(); it != m_vecIgnore.end(); ++it)
+		{
+			ignore.append(*it);
+		}
+		return tuple(ignore);
+	}
+
+	void SetIgnore(object oIgnore)
+	{
+		// Convert the inthandles first, so the filter stays unchanged on errors
+		std::vector<unsigned int> vecIgnore;
+		for (stl_input_iterator<unsigned int> it(oIgnore), end; it != end; ++it)
+		{
+			vecIgnore.push_back(*it);
+		}
+
+		m_setIgnore.clear();
+		m_vecIgnore.clear();
+		for (std::vector<unsigned int>::iterator it = vecIgnore.begin(); it != vecIgnore.end(); ++it)
+		{
+			AddIgnore(*it);
+		}
+	}
+
+private:
+	void AddIgnore(unsigned int uiInthandle)
+	{
+		if (m_setIgnore.insert(uiInthandle).second)
+			m_vecIgnore.push_back(uiInthandle);
+	}
+
+public:
+	TraceType_t m_iTraceType;
+
+private:
+	// The set is used for lookups, the vector keeps the order of the inthandles
+	boost::unordered_set<unsigned int> m_setIgnore;
+	std::vector<unsigned int> m_vecIgnore;
+};
+
+
+//-----------------------------------------------------------------------------
+// CIgnoreTraceFilter wrapper class.
+//-----------------------------------------------------------------------------
+class CIgnoreTraceFilterWrap: public CIgnoreTraceFilter, public wrapper<CIgnoreTraceFilter>
+{
+public:
+	CIgnoreTraceFilterWrap(object oIgnore=tuple(), TraceType_t iTraceType=TRACE_EVERYTHING)
+		:CIgnoreTraceFilter(oIgnore, iTraceType)
+	{
+		m_iShouldHitEntityOverridden = -1;
+		m_iGetTraceTypeOverridden = -1;
+	}
+
+	// Only call back into Python if a subclass has overridden the method
+	virtual bool ShouldHitEntity(IHandleEntity* pEntity, int mask)
+	{
+		if (IsOverridden(m_iShouldHitEntityOverridden, "should_hit_entity"))
+			return get_override("should_hit_entity")(ptr(pEntity), mask);
+
+		return CIgnoreTraceFilter::ShouldHitEntity(pEntity, mask);
+	}
+
+	bool default_ShouldHitEntity(IHandleEntity* pEntity, int mask)
+	{
+		return CIgnoreTraceFilter::ShouldHitEntity(pEntity, mask);
+	}
+
+	virtual TraceType_t GetTraceType() const
+	{
+		if (IsOverridden(m_iGetTraceTypeOverridden, "get_trace_type"))
+			return get_override("get_trace_type")();
+
+		return CIgnoreTraceFilter::GetTraceType();
+	}
+
+	TraceType_t default_GetTraceType() const
+	{
+		return CIgnoreTraceFilter::GetTraceType();
+	}
+
+private:
+	// The Python instance is not available in the constructor, so the lookup
+	// is done once on the first call. -1 means that it hasn't been done, yet.
+	bool IsOverridden(int& iOverridden, const char* szName) const
+	{
+		if (iOverridden == -1)
+			iOverridden = get_override(szName) ? 1 : 0;
+
+		return iOverridden == 1;
+	}
+
+private:
+	mutable int m_iShouldHitEntityOverridden;
+	mutable int m_iGetTraceTypeOverridden;
+};
+
+
 //-----------------------------------------------------------------------------
 // IEntityEnumerator wrapper class.
 //-----------------------------------------------------------------------------
@@ -174,6 +304,25 @@ public:
 	{
 		pEngineTrace->EnumerateEntities(p1.Min(p2), p2.Max(p1), pEnumerator);
 	}
+
+	static tuple TraceRays(IEngineTrace* pEngineTrace, object oRays, unsigned int fMask, ITraceFilter* pFilter)
+	{
+		list end_positions;
+		list fractions;
+		list entity_indexes;
+
+		CGameTrace trace;
+		for (stl_input_iterator<Ray_t*> it(oRays), end; it != end; ++it)
+		{
+			pEngineTrace->TraceRay(**it, fMask, pFilter, &trace);
+
+			end_positions.append(trace.endpos);
+			fractions.append(trace.fraction);
+			entity_indexes.append(trace.GetEntityIndex());
+		}
+
+		return make_tuple(end_positions, fractions, entity_indexes);
+	}
 };
 
 
@@ -74,9 +74,12 @@ DECLARE_SP_SUBMODULE(_engines, _trace)
 	export_displacement_flags(_trace);
 	export_game_trace(_trace);
 	export_surface_t(_trace);
+
+	// TraceType must be exported before the trace filters, because it's used
+	// as a default value
+	export_trace_type_t(_trace);
 	export_trace_filter(_trace);
 	export_entity_enumerator(_trace);
-	export_trace_type_t(_trace);
 
 	// Sucks that we can't use enum for content flags and masks. They are too big
 	// and crash the server
@@ -144,6 +147,15 @@ void export_engine_trace(scope _trace)
 			args("ray", "triggers", "enumerator")
 		)
 
+		.def("trace_rays",
+			&IEngineTraceExt::TraceRays,
+			"Traces all given rays with the same mask and filter.\n\n"
+			":return: A tuple containing a list of the end positions, a list of the fractions "
+			"and a list of the indexes of the hit entities (-1 if no entity was hit).\n"
+			":rtype: tuple",
+			args("rays", "mask", "filter")
+		)
+
 		.def("enumerate_entities_in_box",
 			&IEngineTraceExt::EnumerateEntitiesInBox,
 			"Enumerates over all entities within a box.",
@@ -358,6 +370,41 @@ void export_trace_filter(scope _trace)
 
 		ADD_MEM_TOOLS_WRAPPER(ITraceFilterWrap, ITraceFilter)
 	;
+
+	// Trace filter that ignores a set of entities
+	class_<CIgnoreTraceFilter, CIgnoreTraceFilterWrap, bases<ITraceFilter>, boost::noncopyable>(
+		"TraceFilterSimple",
+		init<object, TraceType_t>(
+			(arg("ignore")=tuple(), arg("trace_type")=TRACE_EVERYTHING),
+			"Initialize the filter.\n\n"
+			":param iterable ignore: An iterable of entity indexes to ignore. The trace will not hit these entities.\n"
+			":param TraceType trace_type: The trace type that should be used."
+		)
+	)
+		.def("should_hit_entity",
+			&CIgnoreTraceFilter::ShouldHitEntity,
+			&CIgnoreTraceFilterWrap::default_ShouldHitEntity,
+			"Returns False if the entity should be ignored."
+		)
+
+		.def("get_trace_type",
+			&CIgnoreTraceFilter::GetTraceType,
+			&CIgnoreTraceFilterWrap::default_GetTraceType,
+			"Returns the trace type."
+		)
+
+		.def_readwrite("trace_type",
+			&CIgnoreTraceFilter::m_iTraceType
+		)
+
+		.add_property("ignore",
+			&CIgnoreTraceFilter::GetIgnore,
+			&CIgnoreTraceFilter::SetIgnore,
+			"Returns or sets the inthandles of all ignored entities."
+		)
+
+		ADD_MEM_TOOLS_WRAPPER(CIgnoreTraceFilterWrap, CIgnoreTraceFilter)
+	;
 }
 
 
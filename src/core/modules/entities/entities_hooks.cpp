@@ -0,0 +1,164 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include <string.h>
+
+#include "entities_hooks.h"
+#include "utilities/conversions.h"
+#include "utilities/wrap_macros.h"
+
+
+//-----------------------------------------------------------------------------
+// Helper functions.
+//-----------------------------------------------------------------------------
+static int ToRequirement(object value)
+{
+	if (value.is_none())
+		return -1;
+
+	return extract<bool>(value) ? 1 : 0;
+}
+
+static object FromRequirement(int iValue)
+{
+	if (iValue == -1)
+		return object();
+
+	return object(iValue == 1);
+}
+
+
+//-----------------------------------------------------------------------------
+// CEntityHookCondition class.
+//-----------------------------------------------------------------------------
+boost::shared_ptr<CEntityHookCondition> CEntityHookCondition::__init__(
+	object classnames, object is_player, object is_bot, object team)
+{
+	boost::shared_ptr<CEntityHookCondition> pCondition(new CEntityHookCondition);
+	if (!classnames.is_none())
+	{
+		// Allow passing a single classname
+		if (PyUnicode_Check(classnames.ptr()))
+			classnames = make_tuple(classnames);
+
+		stl_input_iterator<const char*> it(classnames), end;
+		for (; it != end; ++it)
+			pCondition->m_vecClassnames.push_back(std::string(*it));
+	}
+
+	pCondition->m_iIsPlayer = ToRequirement(is_player);
+	pCondition->m_iIsBot = ToRequirement(is_bot);
+	pCondition->m_iTeam = team.is_none() ? -1 : extract<int>(team);
+	return pCondition;
+}
+
+bool CEntityHookCondition::IsMatch(CHook* pHook)
+{
+	// The first argument of an entity function is the entity itself
+	if (pHook->m_pCallingConvention->m_vecArgTypes.empty())
+		return false;
+
+	return IsEntityMatch(pHook->GetArgument<CBaseEntity*>(0));
+}
+
+bool CEntityHookCondition::IsEntityMatch(CBaseEntity* pEntity)
+{
+	if (!pEntity)
+		return false;
+
+	CBaseEntityWrapper* pWrapper = (CBaseEntityWrapper*) pEntity;
+	if (!m_vecClassnames.empty())
+	{
+		IServerNetworkable* pNetworkable = pWrapper->GetNetworkable();
+		const char* szClassname = pNetworkable ? pNetworkable->GetClassName() : NULL;
+		if (!szClassname)
+			return false;
+
+		bool bFound = false;
+		for (std::vector<std::string>::iterator it=m_vecClassnames.begin(); it != m_vecClassnames.end(); ++it)
+		{
+			if (strcmp(it->c_str(), szClassname) == 0)
+			{
+				bFound = true;
+				break;
+			}
+		}
+
+		if (!bFound)
+			return false;
+	}
+
+	// The bot and team requirements can only be matched by players
+	bool bRequiresPlayerInfo = m_iIsBot != -1 || m_iTeam != -1;
+	if (m_iIsPlayer == -1 && !bRequiresPlayerInfo)
+		return true;
+
+	bool bIsPlayer = pWrapper->IsPlayer();
+	if (m_iIsPlayer != -1 && bIsPlayer != (m_iIsPlayer == 1))
+		return false;
+
+	if (!bRequiresPlayerInfo)
+		return true;
+
+	IPlayerInfo* pPlayerInfo;
+	if (!bIsPlayer || !PlayerInfoFromBaseEntity(pEntity, pPlayerInfo))
+		return false;
+
+	if (m_iIsBot != -1 && (strcmp(pPlayerInfo->GetNetworkIDString(), "BOT") == 0) != (m_iIsBot == 1))
+		return false;
+
+	return m_iTeam == -1 || pPlayerInfo->GetTeamIndex() == m_iTeam;
+}
+
+tuple CEntityHookCondition::GetClassnames()
+{
+	list classnames;
+	for (std::vector<std::string>::iterator it=m_vecClassnames.begin(); it != m_vecClassnames.end(); ++it)
+		classnames.append(*it);
+
+	return tuple(classnames);
+}
+
+object CEntityHookCondition::GetIsPlayer()
+{
+	return FromRequirement(m_iIsPlayer);
+}
+
+object CEntityHookCondition::GetIsBot()
+{
+	return FromRequirement(m_iIsBot);
+}
+
+object CEntityHookCondition::GetTeam()
+{
+	if (m_iTeam == -1)
+		return object();
+
+	return object(m_iTeam);
+}
@@ -0,0 +1,69 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+#ifndef _ENTITIES_HOOKS_H
+#define _ENTITIES_HOOKS_H
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include <string>
+#include <vector>
+
+#include "modules/memory/memory_hooks.h"
+#include "entities_entity.h"
+
+
+//-----------------------------------------------------------------------------
+// Native condition for entity hooks.
+//-----------------------------------------------------------------------------
+class CEntityHookCondition: public IHookFilter
+{
+public:
+	static boost::shared_ptr<CEntityHookCondition> __init__(
+		object classnames, object is_player, object is_bot, object team);
+
+	virtual bool IsMatch(CHook* pHook);
+	bool IsEntityMatch(CBaseEntity* pEntity);
+
+	bool __call__(CBaseEntityWrapper* pEntity)
+	{ return IsEntityMatch(pEntity->GetThis()); }
+
+	tuple GetClassnames();
+	object GetIsPlayer();
+	object GetIsBot();
+	object GetTeam();
+
+private:
+	// Store the requirements. -1 means that there is no requirement.
+	std::vector<std::string> m_vecClassnames;
+	int m_iIsPlayer;
+	int m_iIsBot;
+	int m_iTeam;
+};
+
+
+#endif // _ENTITIES_HOOKS_H
@@ -0,0 +1,110 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include "export_main.h"
+#include "utilities/wrap_macros.h"
+#include "entities_hooks.h"
+
+
+//-----------------------------------------------------------------------------
+// Forward declarations.
+//-----------------------------------------------------------------------------
+void export_entity_hook_condition(scope);
+
+
+//-----------------------------------------------------------------------------
+// Declare the _entities._hooks module.
+//-----------------------------------------------------------------------------
+DECLARE_SP_SUBMODULE(_entities, _hooks)
+{
+	export_entity_hook_condition(_hooks);
+}
+
+
+//-----------------------------------------------------------------------------
+// Exports CEntityHookCondition.
+//-----------------------------------------------------------------------------
+void export_entity_hook_condition(scope _hooks)
+{
+	// HookFilter is exported by the _memory module. Make sure it has been
+	// registered before using it as the base class.
+	import("_memory");
+
+	class_<CEntityHookCondition, boost::shared_ptr<CEntityHookCondition>, bases<IHookFilter>, boost::noncopyable>("EntityHookCondition", no_init)
+		.def("__init__",
+			make_constructor(&CEntityHookCondition::__init__,
+				default_call_policies(),
+				(arg("classnames")=object(), arg("is_player")=object(), arg("is_bot")=object(),
+				arg("team")=object())
+			),
+			"Initialize the condition.\n"
+			"\n"
+			"The condition is evaluated natively for the entity a hooked function is called for. "
+			"All given requirements must be met. None means that there is no requirement.\n"
+			"\n"
+			":param iterable classnames: The classnames of the entities. A single classname can also be passed as a string.\n"
+			":param bool is_player: Whether the entity must be a player.\n"
+			":param bool is_bot: Whether the entity must be a bot. Only players can match this requirement.\n"
+			":param int team: The team index of the entity. Only players can match this requirement."
+		)
+
+		.def("__call__",
+			&CEntityHookCondition::__call__,
+			"Return True if the entity meets the requirements.\n"
+			"\n"
+			":param BaseEntity entity: The entity to check.\n"
+			":rtype: bool",
+			args("entity")
+		)
+
+		.add_property("classnames",
+			&CEntityHookCondition::GetClassnames,
+			"Return the required classnames.\n\n"
+			":rtype: tuple"
+		)
+
+		.add_property("is_player",
+			&CEntityHookCondition::GetIsPlayer,
+			"Return whether the entity must be a player.\n\n"
+			":rtype: bool"
+		)
+
+		.add_property("is_bot",
+			&CEntityHookCondition::GetIsBot,
+			"Return whether the entity must be a bot.\n\n"
+			":rtype: bool"
+		)
+
+		.add_property("team",
+			&CEntityHookCondition::GetTeam,
+			"Return the required team index.\n\n"
+			":rtype: int"
+		)
+	;
+}
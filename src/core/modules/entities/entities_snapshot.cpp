@@ -0,0 +1,194 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include <string.h>
+
+#include "entities_snapshot.h"
+#include "utilities/conversions.h"
+#include "utilities/wrap_macros.h"
+
+
+//-----------------------------------------------------------------------------
+// Helper functions.
+//-----------------------------------------------------------------------------
+static SnapshotType_t GetSnapshotType(const char* szTypeName, int& iWidth)
+{
+	iWidth = 1;
+	if (strcmp(szTypeName, "bool") == 0)
+		return SNAPSHOT_BOOL;
+	else if (strcmp(szTypeName, "char") == 0)
+		return SNAPSHOT_CHAR;
+	else if (strcmp(szTypeName, "uchar") == 0)
+		return SNAPSHOT_UCHAR;
+	else if (strcmp(szTypeName, "short") == 0)
+		return SNAPSHOT_SHORT;
+	else if (strcmp(szTypeName, "ushort") == 0)
+		return SNAPSHOT_USHORT;
+	else if (strcmp(szTypeName, "int") == 0)
+		return SNAPSHOT_INT;
+	else if (strcmp(szTypeName, "uint") == 0)
+		return SNAPSHOT_UINT;
+	else if (strcmp(szTypeName, "float") == 0)
+		return SNAPSHOT_FLOAT;
+	else if (strcmp(szTypeName, "Vector") == 0)
+	{
+		iWidth = 3;
+		return SNAPSHOT_VECTOR;
+	}
+
+	BOOST_RAISE_EXCEPTION(PyExc_TypeError, "Property type \"%s\" is not supported.", szTypeName)
+	return SNAPSHOT_INT;
+}
+
+
+//-----------------------------------------------------------------------------
+// CEntitySnapshot class.
+//-----------------------------------------------------------------------------
+CEntitySnapshot::CEntitySnapshot(object oResolveLayout)
+{
+	m_oResolveLayout = oResolveLayout;
+}
+
+int CEntitySnapshot::GetRowWidth(unsigned int uiEntityIndex)
+{
+	CBaseEntity* pEntity;
+	return GetLayout(uiEntityIndex, pEntity)->iWidth;
+}
+
+int CEntitySnapshot::Fill(object indexes, object buffer)
+{
+	Py_buffer view;
+	if (PyObject_GetBuffer(buffer.ptr(), &view, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) != 0)
+		throw_error_already_set();
+
+	// Accept native and explicit byte order doubles (e.g. "d" or "<d")
+	const char* szFormat = view.format ? view.format : "B";
+	if (view.itemsize != sizeof(double) || szFormat[strlen(szFormat) - 1] != 'd')
+	{
+		PyBuffer_Release(&view);
+		BOOST_RAISE_EXCEPTION(PyExc_TypeError, "The buffer must contain doubles.")
+	}
+
+	double* pBuffer = (double *) view.buf;
+	Py_ssize_t iSize = view.len / sizeof(double);
+	Py_ssize_t iPosition = 0;
+	int iWidth = -1;
+
+	try
+	{
+		stl_input_iterator<unsigned int> it(indexes), end;
+		for (; it != end; ++it)
+		{
+			CBaseEntity* pEntity;
+			SnapshotLayout_t* pLayout = GetLayout(*it, pEntity);
+
+			// Is this the first entity?
+			if (iWidth == -1)
+				iWidth = pLayout->iWidth;
+
+			// Are the property types different to the first entity?
+			else if (pLayout->iWidth != iWidth)
+				BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Property types differ between the given entities.")
+
+			if (iPosition + iWidth > iSize)
+				BOOST_RAISE_EXCEPTION(PyExc_ValueError, "The buffer is too small.")
+
+			ReadRow(pEntity, pLayout, pBuffer + iPosition);
+			iPosition += iWidth;
+		}
+	}
+	catch (...)
+	{
+		PyBuffer_Release(&view);
+		throw;
+	}
+
+	PyBuffer_Release(&view);
+	return (int) iPosition;
+}
+
+SnapshotLayout_t* CEntitySnapshot::GetLayout(unsigned int uiEntityIndex, CBaseEntity*& pEntity)
+{
+	if (!BaseEntityFromIndex(uiEntityIndex, pEntity))
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Conversion from \"Index\" (%d) to \"BaseEntity\" failed.", uiEntityIndex)
+
+	std::string classname(IServerUnknownExt::GetClassname((CBaseEntityWrapper *) pEntity));
+	std::map<std::string, SnapshotLayout_t>::iterator it = m_mapLayouts.find(classname);
+	if (it != m_mapLayouts.end())
+		return &it->second;
+
+	// Resolve the layout of the classname in Python. This is only done once
+	// per classname.
+	SnapshotLayout_t layout;
+	layout.iWidth = 0;
+
+	object columns = m_oResolveLayout(uiEntityIndex);
+	stl_input_iterator<object> column_it(columns), column_end;
+	for (; column_it != column_end; ++column_it)
+	{
+		object column = *column_it;
+		int iColumnWidth;
+
+		SnapshotColumn_t snapshot_column;
+		snapshot_column.iOffset = extract<int>(column[0]);
+		snapshot_column.eType = GetSnapshotType(extract<const char*>(column[1]), iColumnWidth);
+
+		layout.columns.push_back(snapshot_column);
+		layout.iWidth += iColumnWidth;
+	}
+
+	return &(m_mapLayouts[classname] = layout);
+}
+
+void CEntitySnapshot::ReadRow(CBaseEntity* pEntity, SnapshotLayout_t* pLayout, double* pRow)
+{
+	unsigned long ulBase = (unsigned long) pEntity;
+	for (std::vector<SnapshotColumn_t>::iterator it=pLayout->columns.begin(); it != pLayout->columns.end(); ++it)
+	{
+		void* pValue = (void *) (ulBase + it->iOffset);
+		switch(it->eType)
+		{
+			case SNAPSHOT_BOOL:		*pRow++ = *(bool *) pValue ? 1 : 0; break;
+			case SNAPSHOT_CHAR:		*pRow++ = *(unsigned char *) pValue; break;
+			case SNAPSHOT_UCHAR:	*pRow++ = *(unsigned char *) pValue; break;
+			case SNAPSHOT_SHORT:	*pRow++ = *(short *) pValue; break;
+			case SNAPSHOT_USHORT:	*pRow++ = *(unsigned short *) pValue; break;
+			case SNAPSHOT_INT:		*pRow++ = *(int *) pValue; break;
+			case SNAPSHOT_UINT:		*pRow++ = *(unsigned int *) pValue; break;
+			case SNAPSHOT_FLOAT:	*pRow++ = *(float *) pValue; break;
+			case SNAPSHOT_VECTOR:
+			{
+				float* pVector = (float *) pValue;
+				*pRow++ = pVector[0];
+				*pRow++ = pVector[1];
+				*pRow++ = pVector[2];
+			} break;
+		}
+	}
+}
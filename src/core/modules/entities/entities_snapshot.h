@@ -0,0 +1,94 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+#ifndef _ENTITIES_SNAPSHOT_H
+#define _ENTITIES_SNAPSHOT_H
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include <map>
+#include <string>
+#include <vector>
+
+#include "entities_entity.h"
+
+
+//-----------------------------------------------------------------------------
+// Property types supported by snapshots.
+//-----------------------------------------------------------------------------
+enum SnapshotType_t
+{
+	SNAPSHOT_BOOL,
+	SNAPSHOT_CHAR,
+	SNAPSHOT_UCHAR,
+	SNAPSHOT_SHORT,
+	SNAPSHOT_USHORT,
+	SNAPSHOT_INT,
+	SNAPSHOT_UINT,
+	SNAPSHOT_FLOAT,
+	SNAPSHOT_VECTOR
+};
+
+struct SnapshotColumn_t
+{
+	int iOffset;
+	SnapshotType_t eType;
+};
+
+struct SnapshotLayout_t
+{
+	std::vector<SnapshotColumn_t> columns;
+	int iWidth;
+};
+
+
+//-----------------------------------------------------------------------------
+// Reads the same properties of many entities into one buffer.
+//-----------------------------------------------------------------------------
+class CEntitySnapshot
+{
+public:
+	CEntitySnapshot(object oResolveLayout);
+
+	int GetRowWidth(unsigned int uiEntityIndex);
+	int Fill(object indexes, object buffer);
+
+private:
+	SnapshotLayout_t* GetLayout(unsigned int uiEntityIndex, CBaseEntity*& pEntity);
+	void ReadRow(CBaseEntity* pEntity, SnapshotLayout_t* pLayout, double* pRow);
+
+private:
+	// Called with an index to get the (<offset>, <type name>) tuples of the
+	// properties of the entity's classname
+	object m_oResolveLayout;
+
+	// Store the layout of each classname
+	std::map<std::string, SnapshotLayout_t> m_mapLayouts;
+};
+
+
+#endif // _ENTITIES_SNAPSHOT_H
@@ -0,0 +1,85 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include "export_main.h"
+#include "utilities/wrap_macros.h"
+#include "entities_snapshot.h"
+
+
+//-----------------------------------------------------------------------------
+// Forward declarations.
+//-----------------------------------------------------------------------------
+void export_entity_snapshot(scope);
+
+
+//-----------------------------------------------------------------------------
+// Declare the _entities._snapshot module.
+//-----------------------------------------------------------------------------
+DECLARE_SP_SUBMODULE(_entities, _snapshot)
+{
+	export_entity_snapshot(_snapshot);
+}
+
+
+//-----------------------------------------------------------------------------
+// Exports CEntitySnapshot.
+//-----------------------------------------------------------------------------
+void export_entity_snapshot(scope _snapshot)
+{
+	class_<CEntitySnapshot, boost::noncopyable>("EntitySnapshot", init<object>(
+			args("resolve_layout"),
+			"Initialize the snapshot reader.\n"
+			"\n"
+			":param callable resolve_layout: Called with the index of an entity whose classname has no layout, yet. "
+			"It must return an iterable of ``(<offset>, <type name>)`` tuples."
+		))
+
+		.def("get_row_width",
+			&CEntitySnapshot::GetRowWidth,
+			"Return the number of values a row of the given entity occupies.\n"
+			"\n"
+			":param int index: The index of the entity.\n"
+			":rtype: int",
+			args("index")
+		)
+
+		.def("fill",
+			&CEntitySnapshot::Fill,
+			"Copy the properties of the given entities into the buffer.\n"
+			"\n"
+			":param iterable indexes: The indexes of the entities.\n"
+			":param buffer: A writable, contiguous buffer of doubles.\n"
+			":return: The number of values that have been written.\n"
+			":rtype: int\n"
+			":raise ValueError: Raised if an index is invalid, the buffer is too small or "
+			"the row widths differ between the given entities.",
+			args("indexes", "buffer")
+		)
+	;
+}
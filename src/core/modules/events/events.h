@@ -30,8 +30,13 @@
 //-----------------------------------------------------------------------------
 // Includes.
 //-----------------------------------------------------------------------------
+#include <string.h>
+#include <string>
+#include <vector>
+
 #include "igameevents.h"
 #include "modules/keyvalues/keyvalues.h"
+#include "modules/memory/memory_hooks.h"
 
 
 //-----------------------------------------------------------------------------
@@ -94,4 +99,60 @@ public:
 };
 
 
+//-----------------------------------------------------------------------------
+// Native filter for the IGameEventManager2::FireEvent hook.
+//-----------------------------------------------------------------------------
+class CGameEventHookFilter: public IHookFilter
+{
+public:
+	virtual bool IsMatch(CHook* pHook)
+	{
+		// FireEvent(this, event, dont_broadcast)
+		if (pHook->m_pCallingConvention->m_vecArgTypes.size() < 2)
+			return false;
+
+		IGameEvent* pEvent = pHook->GetArgument<IGameEvent*>(1);
+		return pEvent && HasEventName(pEvent->GetName());
+	}
+
+	bool HasEventName(const char* szName)
+	{
+		// Only a few events are usually pre-hooked, so a linear search without
+		// allocating a string is faster than hashing
+		for (std::vector<std::string>::iterator it=m_vecEventNames.begin(); it != m_vecEventNames.end(); ++it)
+		{
+			if (strcmp(it->c_str(), szName) == 0)
+				return true;
+		}
+		return false;
+	}
+
+	void AddEventName(const char* szName)
+	{
+		if (!HasEventName(szName))
+			m_vecEventNames.push_back(std::string(szName));
+	}
+
+	void RemoveEventName(const char* szName)
+	{
+		for (std::vector<std::string>::iterator it=m_vecEventNames.begin(); it != m_vecEventNames.end(); ++it)
+		{
+			if (strcmp(it->c_str(), szName) == 0)
+			{
+				m_vecEventNames.erase(it);
+				return;
+			}
+		}
+	}
+
+	int GetLength()
+	{
+		return (int) m_vecEventNames.size();
+	}
+
+private:
+	std::vector<std::string> m_vecEventNames;
+};
+
+
 #endif // _EVENTS_H
@@ -45,6 +45,7 @@ extern IGameEventManager2* gameeventmanager;
 void export_igameevent(scope);
 void export_igameeventlistener(scope);
 void export_igameeventmanager(scope);
+void export_game_event_hook_filter(scope);
 
 
 //-----------------------------------------------------------------------------
@@ -55,6 +56,7 @@ DECLARE_SP_MODULE(_events)
 	export_igameevent(_events);
 	export_igameeventlistener(_events);
 	export_igameeventmanager(_events);
+	export_game_event_hook_filter(_events);
 }
 
 
@@ -291,3 +293,42 @@ void export_igameeventmanager(scope _events)
 
 	_events.attr("game_event_manager") = object(ptr(gameeventmanager));
 }
+
+
+//-----------------------------------------------------------------------------
+// Exports CGameEventHookFilter.
+//-----------------------------------------------------------------------------
+void export_game_event_hook_filter(scope _events)
+{
+	// HookFilter is exported by the _memory module. Make sure it has been
+	// registered before using it as the base class.
+	import("_memory");
+
+	class_<CGameEventHookFilter, bases<IHookFilter>, boost::noncopyable>(
+		"GameEventHookFilter",
+		"Native filter for hooks on :meth:`GameEventManager.fire_event`, which matches the names of the fired events.")
+
+		.def("add_event_name",
+			&CGameEventHookFilter::AddEventName,
+			"Add an event name to the filter.",
+			args("event_name")
+		)
+
+		.def("remove_event_name",
+			&CGameEventHookFilter::RemoveEventName,
+			"Remove an event name from the filter.",
+			args("event_name")
+		)
+
+		.def("__contains__",
+			&CGameEventHookFilter::HasEventName,
+			"Return True if the event name has been added to the filter.",
+			args("event_name")
+		)
+
+		.def("__len__",
+			&CGameEventHookFilter::GetLength,
+			"Return the number of event names."
+		)
+	;
+}
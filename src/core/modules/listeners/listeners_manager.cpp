@@ -27,6 +27,7 @@
 //-----------------------------------------------------------------------------
 // Includes.
 //-----------------------------------------------------------------------------
+#include <vector>
 #include "listeners_manager.h"
 
 
@@ -65,10 +66,26 @@ void CListenerManager::UnregisterListener(PyObject* pCallable)
 //-----------------------------------------------------------------------------
 void CListenerManager::Notify(tuple args, dict kwargs)
 {
-	for(int i = 0; i < m_vecCallables.Count(); i++)
+	// Copy the callables, so listeners can register or unregister listeners
+	// while being notified.
+	std::vector<object> vecCallables(
+		m_vecCallables.Base(), m_vecCallables.Base() + m_vecCallables.Count());
+
+	// Don't pass an empty dictionary to the callables
+	PyObject* pKwargs = PyDict_Size(kwargs.ptr()) ? kwargs.ptr() : NULL;
+
+	for(std::vector<object>::iterator it=vecCallables.begin(); it != vecCallables.end(); ++it)
 	{
 		BEGIN_BOOST_PY()
-			eval("lambda func, args, kwargs: func(*args, **kwargs)")(m_vecCallables[i], args, kwargs);
+			// Call the callable directly instead of compiling a lambda
+			PyObject* pResult;
+			PROFILE_CALLBACK(m_szName.c_str(), it->ptr(),
+				pResult = PyObject_Call(it->ptr(), args.ptr(), pKwargs));
+
+			if (!pResult)
+				throw_error_already_set();
+
+			Py_DECREF(pResult);
 		END_BOOST_PY_NORET()
 	}
 }
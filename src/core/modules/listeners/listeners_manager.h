@@ -32,6 +32,7 @@
 //-----------------------------------------------------------------------------
 #include "utilities/wrap_macros.h"
 #include "utilities/call_python.h"
+#include "utilities/callback_profiler.h"
 #include "utlvector.h"
 
 
@@ -41,7 +42,7 @@
 // This creates a static manager and a function that returns a pointer to the
 // manager. Must be used in a *.cpp file!
 #define DEFINE_MANAGER_ACCESSOR(name) \
-	static CListenerManager s_##name; \
+	static CListenerManager s_##name(#name); \
 	CListenerManager* Get##name##ListenerManager() \
 	{ return &s_##name; }
 
@@ -51,7 +52,8 @@
 	for(int i = 0; i < Get##name##ListenerManager()->m_vecCallables.Count(); i++) \
 	{ \
 		BEGIN_BOOST_PY() \
-			CALL_PY_FUNC(Get##name##ListenerManager()->m_vecCallables[i].ptr(), ##__VA_ARGS__); \
+			object oCallable = Get##name##ListenerManager()->m_vecCallables[i]; \
+			PROFILE_CALLBACK(#name, oCallable.ptr(), CALL_PY_FUNC(oCallable.ptr(), ##__VA_ARGS__)); \
 		END_BOOST_PY_NORET() \
 	}
 
@@ -62,6 +64,9 @@
 class CListenerManager
 {
 public:
+	CListenerManager(const char* szName=NULL)
+	{ m_szName = szName ? szName : "ListenerManager"; }
+
 	void RegisterListener(PyObject* pCallable);
 	void UnregisterListener(PyObject* pCallable);
 	void Notify(boost::python::tuple args, dict kwargs);
@@ -70,6 +75,9 @@ public:
 
 public:
 	CUtlVector<object> m_vecCallables;
+
+	// Name passed to the callback profiler
+	std::string m_szName;
 };
 
 
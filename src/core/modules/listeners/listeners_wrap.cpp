@@ -79,7 +79,11 @@ DECLARE_SP_MODULE(_listeners)
 //-----------------------------------------------------------------------------
 void export_listener_managers(scope _listeners) 
 {
-	class_<CListenerManager, boost::noncopyable>("ListenerManager")
+	class_<CListenerManager, boost::noncopyable>("ListenerManager", init< optional<const char*> >(
+			(arg("name")=object()),
+			"Create a new listener manager.\n\n"
+			":param str name: The name of the manager that is passed to the callback profiler."
+		))
 		.def("register_listener",
 			&CListenerManager::RegisterListener,
 			"Registers a callable object. If it was already registered it will be ignored.",
@@ -44,12 +44,6 @@
 #include "conventions/x86GccThiscall.h"
 
 
-// ============================================================================
-// >> EXTERNALS
-// ============================================================================
-extern std::map<CHook *, std::map<HookType_t, std::list<object> > > g_mapCallbacks;
-
-
 // ============================================================================
 // >> GLOBAL VARIABLES
 // ============================================================================
@@ -312,10 +306,13 @@ CHook* HookFunctionHelper(void* addr, ICallingConvention* pConv)
 	return result;
 }
 
-void CFunction::AddHook(HookType_t eType, PyObject* pCallable)
+void CFunction::AddHook(HookType_t eType, PyObject* pCallable, object filter)
 {
 	if (!IsHookable())
 		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Function is not hookable.")
+
+	if (!filter.is_none() && !extract<IHookFilter*>(filter).check())
+		BOOST_RAISE_EXCEPTION(PyExc_TypeError, "Filter must be a HookFilter instance.")
 		
 	Validate();
 	CHook* pHook = GetHookManager()->FindHook((void *) m_ulAddr);
@@ -325,7 +322,7 @@ void CFunction::AddHook(HookType_t eType, PyObject* pCallable)
 	
 	// Add the hook handler. If it's already added, it won't be added twice
 	pHook->AddCallback(eType, (HookHandlerFn *) (void *) &SP_HookHandler);
-	g_mapCallbacks[pHook][eType].push_back(object(handle<>(borrowed(pCallable))));
+	AddHookCallback(pHook, eType, object(handle<>(borrowed(pCallable))), filter);
 }
 
 void CFunction::RemoveHook(HookType_t eType, PyObject* pCallable)
@@ -335,7 +332,7 @@ void CFunction::RemoveHook(HookType_t eType, PyObject* pCallable)
 	if (!pHook)
 		return;
 
-	g_mapCallbacks[pHook][eType].remove(object(handle<>(borrowed(pCallable))));
+	RemoveHookCallback(pHook, eType, object(handle<>(borrowed(pCallable))));
 }
 
 void CFunction::DeleteHook()
@@ -344,7 +341,7 @@ void CFunction::DeleteHook()
 	if (!pHook)
 		return;
 
-	g_mapCallbacks.erase(pHook);
+	RemoveHookCallbacks(pHook);
 	// Set the calling convention to NULL, because DynamicHooks will delete it otherwise.
 	pHook->m_pCallingConvention = NULL;
 	GetHookManager()->UnhookFunction((void *) m_ulAddr);
@@ -69,7 +69,7 @@ public:
 	object CallTrampoline(boost::python::tuple args, dict kw);
 	object SkipHooks(boost::python::tuple args, dict kw);
 	
-	void AddHook(HookType_t eType, PyObject* pCallable);
+	void AddHook(HookType_t eType, PyObject* pCallable, object filter=object());
 	void RemoveHook(HookType_t eType, PyObject* pCallable);
     
 	void AddPreHook(PyObject* pCallable)
@@ -31,6 +31,7 @@
 #include "memory_pointer.h"
 #include "utilities/wrap_macros.h"
 #include "utilities/call_python.h"
+#include "utilities/callback_profiler.h"
 #include "utilities/sp_util.h"
 
 #include "boost/python.hpp"
@@ -40,8 +41,8 @@ using namespace boost::python;
 // ============================================================================
 // >> GLOBAL VARIABLES
 // ============================================================================
-// g_mapCallbacks[<CHook *>][<HookType_t>] -> [<object>, <object>, ...]
-std::map<CHook *, std::map<HookType_t, std::list<object> > > g_mapCallbacks;
+// g_mapCallbacks[<CHook *>] -> <HookCallbacks_t>
+HookCallbackMap_t g_mapCallbacks;
 
 
 // ============================================================================
@@ -74,52 +75,124 @@ object GetArgument(CHook* pHook, int iIndex)
 }
 
 
+object GetReturnValueObject(CHook* pHook)
+{
+	switch(pHook->m_pCallingConvention->m_returnType)
+	{
+		case DATA_TYPE_VOID:		return object();
+		case DATA_TYPE_BOOL:		return GetReturnValue<bool>(pHook);
+		case DATA_TYPE_CHAR:		return GetReturnValue<char>(pHook);
+		case DATA_TYPE_UCHAR:		return GetReturnValue<unsigned char>(pHook);
+		case DATA_TYPE_SHORT:		return GetReturnValue<short>(pHook);
+		case DATA_TYPE_USHORT:		return GetReturnValue<unsigned short>(pHook);
+		case DATA_TYPE_INT:			return GetReturnValue<int>(pHook);
+		case DATA_TYPE_UINT:		return GetReturnValue<unsigned int>(pHook);
+		case DATA_TYPE_LONG:		return GetReturnValue<long>(pHook);
+		case DATA_TYPE_ULONG:		return GetReturnValue<unsigned long>(pHook);
+		case DATA_TYPE_LONG_LONG:	return GetReturnValue<long long>(pHook);
+		case DATA_TYPE_ULONG_LONG:	return GetReturnValue<unsigned long long>(pHook);
+		case DATA_TYPE_FLOAT:		return GetReturnValue<float>(pHook);
+		case DATA_TYPE_DOUBLE:		return GetReturnValue<double>(pHook);
+		case DATA_TYPE_POINTER:		return object(CPointer(pHook->GetReturnValue<unsigned long>()));
+		case DATA_TYPE_STRING:		return GetReturnValue<const char *>(pHook);
+		default: BOOST_RAISE_EXCEPTION(PyExc_TypeError, "Unknown type.");
+	}
+	return object();
+}
+
+
+// ============================================================================
+// >> Callback management
+// ============================================================================
+void AddHookCallback(CHook* pHook, HookType_t eHookType, object callback, object filter)
+{
+	HookCallback_t entry;
+	entry.callback = callback;
+	entry.filter = filter;
+	entry.pFilter = filter.is_none() ? NULL : extract<IHookFilter*>(filter);
+
+	CallbackListPtr_t& callbacks = g_mapCallbacks[pHook].Get(eHookType);
+	CallbackList_t* pNewCallbacks = callbacks ? new CallbackList_t(*callbacks) : new CallbackList_t();
+	pNewCallbacks->push_back(entry);
+	callbacks.reset(pNewCallbacks);
+}
+
+void RemoveHookCallback(CHook* pHook, HookType_t eHookType, object callback)
+{
+	HookCallbackMap_t::iterator it = g_mapCallbacks.find(pHook);
+	if (it == g_mapCallbacks.end())
+		return;
+
+	CallbackListPtr_t& callbacks = it->second.Get(eHookType);
+	if (!callbacks)
+		return;
+
+	CallbackList_t* pNewCallbacks = new CallbackList_t();
+	for (CallbackList_t::const_iterator cb=callbacks->begin(); cb != callbacks->end(); ++cb)
+	{
+		if (!(cb->callback == callback))
+			pNewCallbacks->push_back(*cb);
+	}
+	callbacks.reset(pNewCallbacks);
+}
+
+void RemoveHookCallbacks(CHook* pHook)
+{
+	g_mapCallbacks.erase(pHook);
+}
+
+
 // ============================================================================
 // >> SP_HookHandler
 // ============================================================================
 bool SP_HookHandler(HookType_t eHookType, CHook* pHook)
 {
-	std::list<object> callbacks = g_mapCallbacks[pHook][eHookType];
+	HookCallbackMap_t::iterator hook_it = g_mapCallbacks.find(pHook);
+	if (hook_it == g_mapCallbacks.end())
+		return false;
+
+	// Hold a reference to the list, so callbacks can safely add or remove
+	// callbacks while we are iterating over it
+	CallbackListPtr_t callbacks = hook_it->second.Get(eHookType);
 
 	// No need to do all this stuff, if there is no callback registered
-	if (callbacks.empty())
+	if (!callbacks || callbacks->empty())
 		return false;
 
+	// The stack data and the return value are converted when the first callback
+	// passed its filter. The stack data is converted only once, so all callbacks
+	// share its argument cache.
+	object stackdata;
 	object retval;
-	if (eHookType == HOOKTYPE_POST)
-	{
-		switch(pHook->m_pCallingConvention->m_returnType)
-		{
-			case DATA_TYPE_VOID:		retval = object(); break;
-			case DATA_TYPE_BOOL:		retval = GetReturnValue<bool>(pHook); break;
-			case DATA_TYPE_CHAR:		retval = GetReturnValue<char>(pHook); break;
-			case DATA_TYPE_UCHAR:		retval = GetReturnValue<unsigned char>(pHook); break;
-			case DATA_TYPE_SHORT:		retval = GetReturnValue<short>(pHook); break;
-			case DATA_TYPE_USHORT:		retval = GetReturnValue<unsigned short>(pHook); break;
-			case DATA_TYPE_INT:			retval = GetReturnValue<int>(pHook); break;
-			case DATA_TYPE_UINT:		retval = GetReturnValue<unsigned int>(pHook); break;
-			case DATA_TYPE_LONG:		retval = GetReturnValue<long>(pHook); break;
-			case DATA_TYPE_ULONG:		retval = GetReturnValue<unsigned long>(pHook); break;
-			case DATA_TYPE_LONG_LONG:	retval = GetReturnValue<long long>(pHook); break;
-			case DATA_TYPE_ULONG_LONG:	retval = GetReturnValue<unsigned long long>(pHook); break;
-			case DATA_TYPE_FLOAT:		retval = GetReturnValue<float>(pHook); break;
-			case DATA_TYPE_DOUBLE:		retval = GetReturnValue<double>(pHook); break;
-			case DATA_TYPE_POINTER:		retval = object(CPointer(pHook->GetReturnValue<unsigned long>())); break;
-			case DATA_TYPE_STRING:		retval = GetReturnValue<const char *>(pHook); break;
-			default: BOOST_RAISE_EXCEPTION(PyExc_TypeError, "Unknown type.");
-		}
-	}
-	
-	CStackData stackdata = CStackData(pHook);
+	bool bConverted = false;
 	bool bOverride = false;
-	for (std::list<object>::iterator it=callbacks.begin(); it != callbacks.end(); ++it)
+	for (CallbackList_t::const_iterator it=callbacks->begin(); it != callbacks->end(); ++it)
 	{
 		BEGIN_BOOST_PY()
+			if (it->pFilter && !it->pFilter->IsMatch(pHook))
+				continue;
+
+			if (!bConverted)
+			{
+				stackdata = object(CStackData(pHook));
+				if (eHookType == HOOKTYPE_POST)
+					retval = GetReturnValueObject(pHook);
+
+				bConverted = true;
+			}
+
+			PyObject* pCallable = it->callback.ptr();
 			object pyretval;
 			if (eHookType == HOOKTYPE_PRE)
-				pyretval = CALL_PY_FUNC((*it).ptr(), stackdata);
+			{
+				PROFILE_CALLBACK("PreHook", pCallable,
+					pyretval = CALL_PY_FUNC(pCallable, stackdata));
+			}
 			else
-				pyretval = CALL_PY_FUNC((*it).ptr(), stackdata, retval);
+			{
+				PROFILE_CALLBACK("PostHook", pCallable,
+					pyretval = CALL_PY_FUNC(pCallable, stackdata, retval));
+			}
 
 			if (!pyretval.is_none())
 			{
@@ -169,9 +242,13 @@ object CStackData::GetItem(unsigned int iIndex)
 		BOOST_RAISE_EXCEPTION(PyExc_IndexError, "Index out of range.")
 
 	// Argument already cached?
-	object retval = m_mapCache[iIndex];
-	if (retval)
-		return retval;
+	object retval;
+	if (iIndex < MAX_CACHED_ARGUMENTS)
+	{
+		retval = m_Cache[iIndex];
+		if (!retval.is_none())
+			return retval;
+	}
 
 	switch(m_pHook->m_pCallingConvention->m_vecArgTypes[iIndex])
 	{
@@ -192,7 +269,9 @@ object CStackData::GetItem(unsigned int iIndex)
 		case DATA_TYPE_STRING:		retval = GetArgument<const char *>(m_pHook, iIndex); break;
 		default: BOOST_RAISE_EXCEPTION(PyExc_TypeError, "Unknown type.") break;
 	}
-	m_mapCache[iIndex] = retval;
+	if (iIndex < MAX_CACHED_ARGUMENTS)
+		m_Cache[iIndex] = retval;
+
 	return retval;
 }
 
@@ -202,7 +281,9 @@ void CStackData::SetItem(unsigned int iIndex, object value)
 		BOOST_RAISE_EXCEPTION(PyExc_IndexError, "Index out of range.")
 
 	// Update cache
-	m_mapCache[iIndex] = value;
+	if (iIndex < MAX_CACHED_ARGUMENTS)
+		m_Cache[iIndex] = value;
+
 	switch(m_pHook->m_pCallingConvention->m_vecArgTypes[iIndex])
 	{
 		case DATA_TYPE_BOOL:		SetArgument<bool>(m_pHook, iIndex, value); break;
@@ -30,18 +30,71 @@
 //---------------------------------------------------------------------------------
 // Includes
 //---------------------------------------------------------------------------------
-#include <list>
 #include <map>
+#include <vector>
 
 #include "boost/python.hpp"
+#include "boost/shared_ptr.hpp"
+#include "boost/unordered_map.hpp"
 using namespace boost::python;
 
 // DynamicHooks
 #include "hook.h"
 
+//---------------------------------------------------------------------------------
+// Constants
+//---------------------------------------------------------------------------------
+// Number of arguments CStackData caches
+#define MAX_CACHED_ARGUMENTS 16
+
+
+//---------------------------------------------------------------------------------
+// Typedefs
+//---------------------------------------------------------------------------------
+class IHookFilter;
+
+struct HookCallback_t
+{
+	object callback;
+
+	// Keeps the filter alive. pFilter is only used to avoid the conversion on
+	// every call.
+	object filter;
+	IHookFilter* pFilter;
+};
+
+// The callback lists are never modified after they have been created. Adding or
+// removing a callback replaces the list, so the hook handler can iterate over it
+// without copying it, even if a callback adds or removes callbacks.
+typedef std::vector<HookCallback_t> CallbackList_t;
+typedef boost::shared_ptr<const CallbackList_t> CallbackListPtr_t;
+
+struct HookCallbacks_t
+{
+	CallbackListPtr_t pre_callbacks;
+	CallbackListPtr_t post_callbacks;
+
+	CallbackListPtr_t& Get(HookType_t eHookType)
+	{ return eHookType == HOOKTYPE_PRE ? pre_callbacks : post_callbacks; }
+};
+
+typedef boost::unordered_map<CHook*, HookCallbacks_t> HookCallbackMap_t;
+
+
 //---------------------------------------------------------------------------------
 // Classes
 //---------------------------------------------------------------------------------
+// Base class of native filters that decide whether a hook callback is called. The
+// filter is evaluated before the callback, so calls that don't match never enter
+// the interpreter.
+class IHookFilter
+{
+public:
+	virtual ~IHookFilter() {}
+	virtual bool IsMatch(CHook* pHook) = 0;
+};
+
+
 class CStackData
 {
 public:
@@ -67,7 +120,7 @@ public:
 
 protected:
 	CHook*                m_pHook;
-	std::map<int, object> m_mapCache;
+	object                m_Cache[MAX_CACHED_ARGUMENTS];
 };
 
 
@@ -76,4 +129,8 @@ protected:
 //---------------------------------------------------------------------------------
 bool SP_HookHandler(HookType_t eHookType, CHook* pHook);
 
+void AddHookCallback(CHook* pHook, HookType_t eHookType, object callback, object filter=object());
+void RemoveHookCallback(CHook* pHook, HookType_t eHookType, object callback);
+void RemoveHookCallbacks(CHook* pHook);
+
 #endif // MEMORY_HOOKS_H
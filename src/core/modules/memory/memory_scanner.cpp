@@ -28,6 +28,8 @@
 // Includes
 //-----------------------------------------------------------------------------
 #include <stdio.h>
+#include <string.h>
+#include <vector>
 #ifdef _WIN32
 	#include <windows.h>
 #else
@@ -58,6 +60,57 @@ CBinaryFile::CBinaryFile(unsigned long ulAddr, unsigned long ulSize)
 {
 	m_ulAddr = ulAddr;
 	m_ulSize = ulSize;
+	m_bSymbolsLoaded = false;
+	m_szSymbolsError = NULL;
+}
+
+// Returns true if the signature matches the bytes at the given address
+inline bool MatchSignature(const unsigned char* sigstr, int iLength, const unsigned char* base)
+{
+	for(int i = 0; i < iLength; i++)
+	{
+		if (sigstr[i] != '\x2A' && sigstr[i] != base[i])
+			return false;
+	}
+	return true;
+}
+
+// Returns the index of the first byte that is not a wildcard
+inline int GetSignatureAnchor(const unsigned char* sigstr, int iLength)
+{
+	int iAnchor = 0;
+	while (iAnchor < iLength && sigstr[iAnchor] == '\x2A')
+		iAnchor++;
+
+	return iAnchor;
+}
+
+// Returns the first address in [base, end) the signature matches or 0
+unsigned long ScanForSignature(const unsigned char* sigstr, int iLength, unsigned char* base, unsigned char* end)
+{
+	if (base >= end)
+		return 0;
+
+	int iAnchor = GetSignatureAnchor(sigstr, iLength);
+	if (iAnchor == iLength)
+		return (unsigned long) base;
+
+	// Let memchr() skip to the next occurrence of the first byte that must
+	// match instead of comparing the signature at every address
+	unsigned char* current = base + iAnchor;
+	unsigned char* last = end + iAnchor;
+	while (current < last)
+	{
+		current = (unsigned char *) memchr(current, sigstr[iAnchor], last - current);
+		if (!current)
+			break;
+
+		if (MatchSignature(sigstr, iLength, current - iAnchor))
+			return (unsigned long) (current - iAnchor);
+
+		current++;
+	}
+	return 0;
 }
 
 CPointer* CBinaryFile::FindSignatureRaw(object oSignature)
@@ -71,59 +124,36 @@ CPointer* CBinaryFile::FindSignatureRaw(object oSignature)
 	unsigned char* base = (unsigned char *) m_ulAddr;
 	unsigned char* end  = (unsigned char *) (base + m_ulSize - iLength);
 
-	while(base < end)
-	{
-		int i = 0;
-		for(; i < iLength; i++)
-		{
-			if (sigstr[i] == '\x2A')
-				continue;
-
-			if (sigstr[i] != base[i])
-				break;
-		}
-
-		if (i == iLength)
-		{
-			return new CPointer((unsigned long) base);
-		}
-		base++;
-	}
-	return new CPointer();
+	return new CPointer(ScanForSignature(sigstr, iLength, base, end));
 }
 
-void CBinaryFile::AddSignatureToCache(unsigned char* sigstr, int iLength, unsigned int ulAddr)
+void CBinaryFile::AddSignatureToCache(const std::string& szSignature, unsigned long ulAddr)
 {
-	Signature_t sig_t = {new unsigned char[iLength+1], ulAddr};
-	strcpy((char*) sig_t.m_szSignature, (char*) sigstr);
-	m_Signatures.push_back(sig_t);
+	m_Signatures[szSignature] = ulAddr;
 }
 
-bool CBinaryFile::SearchSigInCache(unsigned char* sigstr, CPointer*& result)
+bool CBinaryFile::SearchSigInCache(const std::string& szSignature, CPointer*& result)
 {
 	PythonLog(4, "Searching for a cached signature...");
-	for (std::list<Signature_t>::iterator iter=m_Signatures.begin(); iter != m_Signatures.end(); ++iter)
+	SignatureMap_t::iterator iter = m_Signatures.find(szSignature);
+	if (iter != m_Signatures.end())
 	{
-		Signature_t sig = *iter;
-		if (strcmp((const char *) sig.m_szSignature, (const char *) sigstr) == 0)
-		{
-			PythonLog(4, "Found a cached signature!");
-			result = new CPointer(sig.m_ulAddr);
-			return true;
-		}
+		PythonLog(4, "Found a cached signature!");
+		result = new CPointer(iter->second);
+		return true;
 	}
 	PythonLog(4, "Could not find a cached signature.");
 	return false;
 }
 
-bool CBinaryFile::SearchSigInBinary(object oSignature, int iLength, unsigned char* sigstr, CPointer*& result)
+bool CBinaryFile::SearchSigInBinary(object oSignature, const std::string& szSignature, CPointer*& result)
 {
 	PythonLog(4, "Searching in the binary...");
 	CPointer* pPtr = FindSignatureRaw(oSignature);
 	if (pPtr->IsValid())
 	{
 		PythonLog(4, "Found a signature in the binary!");
-		AddSignatureToCache(sigstr, iLength, pPtr->m_ulAddr);
+		AddSignatureToCache(szSignature, pPtr->m_ulAddr);
 		result = pPtr;
 		return true;
 	}
@@ -132,7 +162,7 @@ bool CBinaryFile::SearchSigInBinary(object oSignature, int iLength, unsigned cha
 	return false;
 }
 
-bool CBinaryFile::SearchSigHooked(object oSignature, int iLength, unsigned char* sigstr, CPointer*& result)
+bool CBinaryFile::SearchSigHooked(object oSignature, const std::string& szSignature, CPointer*& result)
 {
 	CPointer* pPtr = FindSignatureRaw(oSignature);
 	if (!pPtr->IsValid())
@@ -157,201 +187,250 @@ bool CBinaryFile::SearchSigHooked(object oSignature, int iLength, unsigned char*
 		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Found more than one hooked signatures. Please pass more bytes.");
 
 	PythonLog(4, "Signature is unique!");
-	AddSignatureToCache(sigstr, iLength, pPtr->m_ulAddr);
+	AddSignatureToCache(szSignature, pPtr->m_ulAddr);
 	result = pPtr;
 	return true;
 }
 
 CPointer* CBinaryFile::FindSignature(object oSignature)
 {
-	unsigned char* sigstr = (unsigned char *) PyBytes_AsString(oSignature.ptr());
+	char* sigstr = PyBytes_AsString(oSignature.ptr());
 	if (!sigstr)
 		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to read the given signature.");
-	
+
+	std::string szSignature(sigstr, PyBytes_Size(oSignature.ptr()));
+
 	CPointer* result = NULL;
-	if (SearchSigInCache(sigstr, result))
+	if (SearchSigInCache(szSignature, result))
 		return result;
-	
-	int iLength = len(oSignature);
-	if (SearchSigInBinary(oSignature, iLength, sigstr, result))
+
+	if (SearchSigInBinary(oSignature, szSignature, result))
 		return result;
-	
+
+	return FindHookedSignature(oSignature, szSignature);
+}
+
+CPointer* CBinaryFile::FindHookedSignature(object oSignature, const std::string& szSignature)
+{
+	CPointer* result = NULL;
+	int iLength = szSignature.size();
+
 	PythonLog(4, "Searching for a hooked signature (relative jump)...");
 	if (iLength <= 6)
 		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Signature is too short to search for a hooked signature (relative jump).");
 
 	oSignature = import("binascii").attr("unhexlify")("E92A2A2A2A") + oSignature.slice(5, _);
-	if (SearchSigHooked(oSignature, iLength, sigstr, result))
+	if (SearchSigHooked(oSignature, szSignature, result))
 		return result;
-	
+
 	PythonLog(4, "Searching for a hooked signature (absolute jump)...");
 	if (iLength <= 7)
 		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Signature is too short to search for a hooked signature (absolute jump).");
 
 	oSignature = import("binascii").attr("unhexlify")("FF252A2A2A2A") + oSignature.slice(6, _);
-	if (SearchSigHooked(oSignature, iLength, sigstr, result))
+	if (SearchSigHooked(oSignature, szSignature, result))
 		return result;
 
 	BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Could not find signature.");
 	return new CPointer(); // To fix a warning. This will never get called.
 }
 
-CPointer* CBinaryFile::FindSymbol(char* szSymbol)
+list CBinaryFile::FindSignatures(object oSignatures)
 {
-#ifdef _WIN32
-	return new CPointer((unsigned long) GetProcAddress((HMODULE) m_ulAddr, szSymbol));
+	std::vector<object> vecObjects;
+	std::vector<std::string> vecSignatures;
+	for (stl_input_iterator<object> iter(oSignatures), end; iter != end; ++iter)
+	{
+		object oSignature = *iter;
+		char* sigstr = PyBytes_AsString(oSignature.ptr());
+		if (!sigstr)
+			BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to read the given signature.");
 
-#elif defined(__linux__)
-	// -----------------------------------------
-	// We need to use mmap now that VALVe has
-	// made them all private!
-	// Thank you to DamagedSoul from AlliedMods
-	// for the following code.
-	// It can be found at:
-	// http://hg.alliedmods.net/sourcemod-central/file/dc361050274d/core/logic/MemoryUtils.cpp
-	// -----------------------------------------
-	struct link_map *dlmap;
-	struct stat dlstat;
-	int dlfile;
-	uintptr_t map_base;
-	Elf32_Ehdr *file_hdr;
-	Elf32_Shdr *sections, *shstrtab_hdr, *symtab_hdr, *strtab_hdr;
-	Elf32_Sym *symtab;
-	const char *shstrtab, *strtab;
-	uint16_t section_count;
-	uint32_t symbol_count;
+		vecObjects.push_back(oSignature);
+		vecSignatures.push_back(std::string(sigstr, PyBytes_Size(oSignature.ptr())));
+	}
 
-	dlmap = (struct link_map *) m_ulAddr;
-	symtab_hdr = NULL;
-	strtab_hdr = NULL;
+	std::vector<unsigned long> vecResults(vecSignatures.size(), 0);
 
-	dlfile = open(dlmap->l_name, O_RDONLY);
-	if (dlfile == -1 || fstat(dlfile, &dlstat) == -1)
+	// Sort the signatures that are not cached into buckets by the first byte
+	// that isn't a wildcard: (<signature index>, <index of the byte>)
+	std::vector< std::pair<unsigned int, int> > vecBuckets[256];
+	unsigned int iPending = 0;
+	for (unsigned int i = 0; i < vecSignatures.size(); i++)
 	{
-		close(dlfile);
-		return new CPointer();
-	}
+		SignatureMap_t::iterator cached = m_Signatures.find(vecSignatures[i]);
+		if (cached != m_Signatures.end())
+		{
+			vecResults[i] = cached->second;
+			continue;
+		}
 
-	/* Map library file into memory */
-	file_hdr = (Elf32_Ehdr *)mmap(NULL, dlstat.st_size, PROT_READ, MAP_PRIVATE, dlfile, 0);
-	map_base = (uintptr_t)file_hdr;
-	if (file_hdr == MAP_FAILED)
-	{
-		close(dlfile);
-		return new CPointer();
-	}
-	close(dlfile);
+		const unsigned char* sigstr = (const unsigned char *) vecSignatures[i].data();
+		int iLength = vecSignatures[i].size();
+		int iAnchor = GetSignatureAnchor(sigstr, iLength);
 
-	if (file_hdr->e_shoff == 0 || file_hdr->e_shstrndx == SHN_UNDEF)
-	{
-		munmap(file_hdr, dlstat.st_size);
-		return new CPointer();
-	}
+		// Signatures without any fixed byte are left to FindSignature()
+		if (iAnchor == iLength)
+			continue;
 
-	sections = (Elf32_Shdr *)(map_base + file_hdr->e_shoff);
-	section_count = file_hdr->e_shnum;
-	/* Get ELF section header string table */
-	shstrtab_hdr = &sections[file_hdr->e_shstrndx];
-	shstrtab = (const char *)(map_base + shstrtab_hdr->sh_offset);
+		vecBuckets[sigstr[iAnchor]].push_back(std::make_pair(i, iAnchor));
+		iPending++;
+	}
 
-	/* Iterate sections while looking for ELF symbol table and string table */
-	for (uint16_t i = 0; i < section_count; i++)
+	// Search all signatures in one pass over the binary
+	unsigned char* base = (unsigned char *) m_ulAddr;
+	for (unsigned long ulPos = 0; iPending > 0 && ulPos < m_ulSize; ulPos++)
 	{
-		Elf32_Shdr &hdr = sections[i];
-		const char *section_name = shstrtab + hdr.sh_name;
+		std::vector< std::pair<unsigned int, int> >& bucket = vecBuckets[base[ulPos]];
+		for (unsigned int j = 0; j < bucket.size(); j++)
+		{
+			unsigned int iIndex = bucket[j].first;
+			unsigned long ulAnchor = bucket[j].second;
+			if (vecResults[iIndex] || ulPos < ulAnchor)
+				continue;
 
-		if (strcmp(section_name, ".symtab") == 0)
-			symtab_hdr = &hdr;
+			// Same bounds as FindSignatureRaw()
+			const std::string& szSignature = vecSignatures[iIndex];
+			unsigned long ulStart = ulPos - ulAnchor;
+			if (ulStart + szSignature.size() >= m_ulSize)
+				continue;
 
-		else if (strcmp(section_name, ".strtab") == 0)
-			strtab_hdr = &hdr;
+			if (MatchSignature((const unsigned char *) szSignature.data(), szSignature.size(), base + ulStart))
+			{
+				vecResults[iIndex] = m_ulAddr + ulStart;
+				AddSignatureToCache(szSignature, vecResults[iIndex]);
+				iPending--;
+			}
+		}
 	}
 
-	/* Uh oh, we don't have a symbol table or a string table */
-	if (symtab_hdr == NULL || strtab_hdr == NULL)
+	list result;
+	for (unsigned int i = 0; i < vecSignatures.size(); i++)
 	{
-		munmap(file_hdr, dlstat.st_size);
-		return new CPointer();
-	}
+		// Search for hooked signatures, but don't raise an exception
+		if (!vecResults[i])
+		{
+			try
+			{
+				CPointer* pPtr = FindHookedSignature(vecObjects[i], vecSignatures[i]);
+				vecResults[i] = pPtr->m_ulAddr;
+				delete pPtr;
+			}
+			catch (error_already_set&)
+			{
+				PyErr_Clear();
+			}
+		}
 
-	symtab = (Elf32_Sym *)(map_base + symtab_hdr->sh_offset);
-	strtab = (const char *)(map_base + strtab_hdr->sh_offset);
-	symbol_count = symtab_hdr->sh_size / symtab_hdr->sh_entsize;
-	void* sym_addr = NULL;
+		result.append(CPointer(vecResults[i]));
+	}
+	return result;
+}
 
-	/* Iterate symbol table starting from the position we were at last time */
-	for (uint32_t i = 0; i < symbol_count; i++)
+dict CBinaryFile::GetSignatureCache()
+{
+	dict result;
+	for (SignatureMap_t::iterator iter = m_Signatures.begin(); iter != m_Signatures.end(); ++iter)
 	{
-		Elf32_Sym &sym = symtab[i];
-		unsigned char sym_type = ELF32_ST_TYPE(sym.st_info);
-		const char *sym_name = strtab + sym.st_name;
+		object oSignature(handle<>(PyBytes_FromStringAndSize(iter->first.data(), iter->first.size())));
+		result[oSignature] = iter->second - m_ulAddr;
+	}
+	return result;
+}
 
-		/* Skip symbols that are undefined or do not refer to functions or objects */
-		if (sym.st_shndx == SHN_UNDEF || (sym_type != STT_FUNC && sym_type != STT_OBJECT))
-			continue;
+void CBinaryFile::UpdateSignatureCache(dict oSignatures)
+{
+	list items = oSignatures.items();
+	for (int i = 0; i < len(items); i++)
+	{
+		object oSignature = items[i][0];
+		char* sigstr = PyBytes_AsString(oSignature.ptr());
+		if (!sigstr)
+			BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to read the given signature.");
 
-		if (strcmp(szSymbol, sym_name) == 0)
-		{
-			sym_addr = (void *)(dlmap->l_addr + sym.st_value);
-			break;
-		}
+		unsigned long ulOffset = extract<unsigned long>(items[i][1]);
+		AddSignatureToCache(std::string(sigstr, PyBytes_Size(oSignature.ptr())), m_ulAddr + ulOffset);
 	}
+}
 
-	// Unmap the file now.
-	munmap(file_hdr, dlstat.st_size);
-	return new CPointer((unsigned long) sym_addr);
+CPointer* CBinaryFile::FindSymbol(char* szSymbol)
+{
+#ifdef _WIN32
+	return new CPointer((unsigned long) GetProcAddress((HMODULE) m_ulAddr, szSymbol));
+
+#elif defined(__linux__)
+	// The symbol table is only parsed once
+	if (LoadSymbols() != NULL)
+		return new CPointer();
+
+	SymbolMap_t::iterator iter = m_Symbols.find(szSymbol);
+	if (iter == m_Symbols.end())
+		return new CPointer();
+
+	return new CPointer(iter->second);
 
 #else
 #error "BinaryFile::FindSymbol() is not implemented on this OS"
 #endif
 }
 
-CPointer* CBinaryFile::FindPointer(object oIdentifier, int iOffset, unsigned int iLevel)
+list CBinaryFile::FindSymbols(object oSymbols)
 {
-	CPointer* ptr = FindAddress(oIdentifier);
-	if (ptr->IsValid())
+	list result;
+	for (stl_input_iterator<const char*> iter(oSymbols), end; iter != end; ++iter)
 	{
-		ptr->m_ulAddr += iOffset;
-		while (iLevel > 0)
-		{
-			ptr = ptr->GetPtr();
-			iLevel = iLevel - 1;
-		}
+		CPointer* pPtr = FindSymbol((char *) *iter);
+		result.append(CPointer(pPtr->m_ulAddr));
+		delete pPtr;
 	}
-	return ptr;
+	return result;
 }
 
-CPointer* CBinaryFile::FindAddress(object oIdentifier)
+dict CBinaryFile::FindSymbolsByPrefix(const char* szPrefix)
 {
-#ifdef _WIN32
-	if(CheckClassname(oIdentifier, "bytes"))
-		return FindSignature(oIdentifier);
-#endif
-	
-	return FindSymbol(extract<char*>(oIdentifier));
+	const char* szError = LoadSymbols();
+	if (szError != NULL)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, szError)
+
+	// The symbols are sorted, so all matches follow the first one
+	dict result;
+	std::string szPrefixStr = szPrefix;
+	for (SymbolMap_t::iterator iter = m_Symbols.lower_bound(szPrefixStr); iter != m_Symbols.end(); ++iter)
+	{
+		if (iter->first.compare(0, szPrefixStr.size(), szPrefixStr) != 0)
+			break;
+
+		result[iter->first] = CPointer(iter->second);
+	}
+	return result;
 }
 
-dict CBinaryFile::GetSymbols()
+const char* CBinaryFile::LoadSymbols()
 {
-	dict result;
+	if (m_bSymbolsLoaded)
+		return m_szSymbolsError;
+
+	m_bSymbolsLoaded = true;
+	m_szSymbolsError = NULL;
+
 #ifdef _WIN32
 	PIMAGE_DOS_HEADER dos_header = (PIMAGE_DOS_HEADER) m_ulAddr;
 	if (dos_header->e_magic != IMAGE_DOS_SIGNATURE)
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Unable to retrieve DOS header.")
+		return m_szSymbolsError = "Unable to retrieve DOS header.";
 
 	PIMAGE_NT_HEADERS nt_headers = (PIMAGE_NT_HEADERS) ((BYTE *) m_ulAddr + dos_header->e_lfanew);
 	if (nt_headers->Signature != IMAGE_NT_SIGNATURE)
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Unable to retrieve NT headers.")
+		return m_szSymbolsError = "Unable to retrieve NT headers.";
 
 	if (nt_headers->OptionalHeader.NumberOfRvaAndSizes <= 0)
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Invalid number of directories in the optional header.")
+		return m_szSymbolsError = "Invalid number of directories in the optional header.";
 
 	PIMAGE_EXPORT_DIRECTORY exports = (PIMAGE_EXPORT_DIRECTORY) (
 		(BYTE *) m_ulAddr
 		+ nt_headers->OptionalHeader.DataDirectory[IMAGE_DIRECTORY_ENTRY_EXPORT].VirtualAddress);
 
 	if (exports->AddressOfNames == NULL)
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Address of names is NULL.")
+		return m_szSymbolsError = "Address of names is NULL.";
 
 	BYTE** symbols = (BYTE**)(m_ulAddr + exports->AddressOfNames);
 	for (DWORD i=0; i < exports->NumberOfNames; i++)
@@ -359,11 +438,18 @@ dict CBinaryFile::GetSymbols()
 		const char* name = (const char*) (m_ulAddr + symbols[i]);
 
 		// TODO: Don't use GetProcAddress. There is probably a faster way
-		result[name] = CPointer((unsigned long) GetProcAddress((HMODULE) m_ulAddr, name));
+		m_Symbols.insert(SymbolMap_t::value_type(name, (unsigned long) GetProcAddress((HMODULE) m_ulAddr, name)));
 	}
-#elif __linux__
-	// TODO: Remove duplicated code. See also: FindSymbol()
-	
+
+#elif defined(__linux__)
+	// -----------------------------------------
+	// We need to use mmap now that VALVe has
+	// made them all private!
+	// Thank you to DamagedSoul from AlliedMods
+	// for the following code.
+	// It can be found at:
+	// http://hg.alliedmods.net/sourcemod-central/file/dc361050274d/core/logic/MemoryUtils.cpp
+	// -----------------------------------------
 	struct link_map *dlmap;
 	struct stat dlstat;
 	int dlfile;
@@ -383,7 +469,7 @@ dict CBinaryFile::GetSymbols()
 	if (dlfile == -1 || fstat(dlfile, &dlstat) == -1)
 	{
 		close(dlfile);
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to open file.")
+		return m_szSymbolsError = "Failed to open file.";
 	}
 
 	/* Map library file into memory */
@@ -391,12 +477,12 @@ dict CBinaryFile::GetSymbols()
 	map_base = (uintptr_t)file_hdr;
 	close(dlfile);
 	if (file_hdr == MAP_FAILED)
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "Failed to map file.")
+		return m_szSymbolsError = "Failed to map file.";
 
 	if (file_hdr->e_shoff == 0 || file_hdr->e_shstrndx == SHN_UNDEF)
 	{
 		munmap(file_hdr, dlstat.st_size);
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "No section header string table has been found.")
+		return m_szSymbolsError = "No section header string table has been found.";
 	}
 
 	sections = (Elf32_Shdr *)(map_base + file_hdr->e_shoff);
@@ -422,14 +508,14 @@ dict CBinaryFile::GetSymbols()
 	if (symtab_hdr == NULL || strtab_hdr == NULL)
 	{
 		munmap(file_hdr, dlstat.st_size);
-		BOOST_RAISE_EXCEPTION(PyExc_ValueError, "No symbol table or string table found.")
+		return m_szSymbolsError = "No symbol table or string table found.";
 	}
 
 	symtab = (Elf32_Sym *)(map_base + symtab_hdr->sh_offset);
 	strtab = (const char *)(map_base + strtab_hdr->sh_offset);
 	symbol_count = symtab_hdr->sh_size / symtab_hdr->sh_entsize;
 
-	/* Iterate symbol table starting from the position we were at last time */
+	/* Store all symbols, so the file doesn't need to be read again */
 	for (uint32_t i = 0; i < symbol_count; i++)
 	{
 		Elf32_Sym &sym = symtab[i];
@@ -440,7 +526,8 @@ dict CBinaryFile::GetSymbols()
 		if (sym.st_shndx == SHN_UNDEF || (sym_type != STT_FUNC && sym_type != STT_OBJECT))
 			continue;
 
-		result[sym_name] = CPointer((unsigned long)(dlmap->l_addr + sym.st_value));
+		/* The first symbol with the same name wins */
+		m_Symbols.insert(SymbolMap_t::value_type(sym_name, (unsigned long)(dlmap->l_addr + sym.st_value)));
 	}
 
 	// Unmap the file now.
@@ -448,6 +535,44 @@ dict CBinaryFile::GetSymbols()
 #else
 	#error Unsupported platform.
 #endif
+	return NULL;
+}
+
+CPointer* CBinaryFile::FindPointer(object oIdentifier, int iOffset, unsigned int iLevel)
+{
+	CPointer* ptr = FindAddress(oIdentifier);
+	if (ptr->IsValid())
+	{
+		ptr->m_ulAddr += iOffset;
+		while (iLevel > 0)
+		{
+			ptr = ptr->GetPtr();
+			iLevel = iLevel - 1;
+		}
+	}
+	return ptr;
+}
+
+CPointer* CBinaryFile::FindAddress(object oIdentifier)
+{
+#ifdef _WIN32
+	if(CheckClassname(oIdentifier, "bytes"))
+		return FindSignature(oIdentifier);
+#endif
+	
+	return FindSymbol(extract<char*>(oIdentifier));
+}
+
+dict CBinaryFile::GetSymbols()
+{
+	const char* szError = LoadSymbols();
+	if (szError != NULL)
+		BOOST_RAISE_EXCEPTION(PyExc_ValueError, szError)
+
+	dict result;
+	for (SymbolMap_t::iterator iter = m_Symbols.begin(); iter != m_Symbols.end(); ++iter)
+		result[iter->first] = CPointer(iter->second);
+
 	return result;
 }
 
@@ -536,6 +661,17 @@ CBinaryFile* CBinaryManager::FindBinary(char* szPath, bool bSrvCheck /* = true *
 
 	// Create a new Binary object and add it to the list
 	CBinaryFile* binary = new CBinaryFile(ulAddr, ulSize);
+
+#ifdef _WIN32
+	char szModulePath[MAX_PATH];
+	if (GetModuleFileNameA((HMODULE) ulAddr, szModulePath, MAX_PATH))
+		binary->m_szPath = szModulePath;
+	else
+		binary->m_szPath = szBinaryPath;
+#else
+	binary->m_szPath = ((struct link_map *) ulAddr)->l_name;
+#endif
+
 	m_Binaries.push_front(binary);
 	return binary;
 }
@@ -31,14 +31,19 @@
 // Includes
 //-----------------------------------------------------------------------------
 #include <list>
+#include <map>
+#include <string>
+#include "boost/unordered_map.hpp"
 #include "export_main.h"
 #include "memory_pointer.h"
 
-struct Signature_t
-{
-	unsigned char* m_szSignature;
-	unsigned long  m_ulAddr;
-};
+// Found signatures {<signature bytes>: <address>}. Strings are used as keys,
+// because signatures might contain NUL bytes.
+typedef boost::unordered_map<std::string, unsigned long> SignatureMap_t;
+
+
+// Sorted, so symbols can be searched by their prefix
+typedef std::map<std::string, unsigned long> SymbolMap_t;
 
 
 class CBinaryFile
@@ -49,23 +54,39 @@ public:
 	CPointer* FindSignatureRaw(object oSignature);
 
 	CPointer* FindSignature(object oSignature);
+	list FindSignatures(object oSignatures);
 	CPointer* FindSymbol(char* szSymbol);
+	list FindSymbols(object oSymbols);
+	dict FindSymbolsByPrefix(const char* szPrefix);
 	CPointer* FindPointer(object oIdentifier, int iOffset, unsigned int iLevel);
 	CPointer* FindAddress(object oIdentifier);
 
 	dict GetSymbols();
 
+	dict GetSignatureCache();
+	void UpdateSignatureCache(dict oSignatures);
+
 private:
-	void AddSignatureToCache(unsigned char* sigstr, int iLength, unsigned int ulAddr);
+	const char* LoadSymbols();
+
+	void AddSignatureToCache(const std::string& szSignature, unsigned long ulAddr);
 
-	bool SearchSigInCache(unsigned char* sigstr, CPointer*& result);
-	bool SearchSigInBinary(object oSignature, int iLength, unsigned char* sigstr, CPointer*& result);
-	bool SearchSigHooked(object oSignature, int iLength, unsigned char* sigstr, CPointer*& result);
+	bool SearchSigInCache(const std::string& szSignature, CPointer*& result);
+	bool SearchSigInBinary(object oSignature, const std::string& szSignature, CPointer*& result);
+	bool SearchSigHooked(object oSignature, const std::string& szSignature, CPointer*& result);
+	CPointer* FindHookedSignature(object oSignature, const std::string& szSignature);
 
 public:
 	unsigned long          m_ulAddr;
 	unsigned long          m_ulSize;
-	std::list<Signature_t> m_Signatures;
+	std::string            m_szPath;
+	SignatureMap_t         m_Signatures;
+
+private:
+	// Symbols are parsed once on the first lookup
+	bool                   m_bSymbolsLoaded;
+	const char*            m_szSymbolsError;
+	SymbolMap_t            m_Symbols;
 };
 
 
@@ -54,6 +54,7 @@ void export_data_type_t(scope);
 void export_convention_t(scope);
 void export_hook_type_t(scope);
 void export_stack_data(scope);
+void export_hook_filter(scope);
 void export_register_t(scope);
 void export_register(scope);
 void export_registers(scope);
@@ -78,6 +79,7 @@ DECLARE_SP_MODULE(_memory)
 	export_convention_t(_memory);
 	export_hook_type_t(_memory);
 	export_stack_data(_memory);
+	export_hook_filter(_memory);
 	export_register_t(_memory);
 	export_register(_memory);
 	export_registers(_memory);
@@ -127,6 +129,38 @@ void export_binary_file(scope _memory)
 			manage_new_object_policy()
 		)
 
+		.def("find_signatures",
+			&CBinaryFile::FindSignatures,
+			"Return a list of pointers to the given signatures. All signatures are searched in a single pass. "
+			"Signatures that were not found have an invalid pointer.\n\n"
+			":param iterable signatures: The signatures (bytes) to find.\n"
+			":rtype: list",
+			args("signatures")
+		)
+
+		.def("update_signature_cache",
+			&CBinaryFile::UpdateSignatureCache,
+			"Add signatures and their offsets to the cache of found signatures.\n\n"
+			":param dict signatures: A dict containing signatures (bytes) and their offsets relative to the binary's address.",
+			args("signatures")
+		)
+
+		.def("find_symbols",
+			&CBinaryFile::FindSymbols,
+			"Return a list of pointers to the given symbols. Symbols that were not found have an invalid pointer.\n\n"
+			":param iterable symbols: The names of the symbols to find.\n"
+			":rtype: list",
+			args("symbols")
+		)
+
+		.def("find_symbols_by_prefix",
+			&CBinaryFile::FindSymbolsByPrefix,
+			"Return a dict containing all symbols that start with the given prefix and their addresses.\n\n"
+			":param str prefix: The prefix of the symbols.\n"
+			":rtype: dict",
+			args("prefix")
+		)
+
 		// Special methods
 		.def("__getitem__",
 			&CBinaryFile::FindAddress,
@@ -146,6 +180,16 @@ void export_binary_file(scope _memory)
 			"Size of the binary."
 		)
 
+		.def_readonly("path",
+			&CBinaryFile::m_szPath,
+			"Path of the binary."
+		)
+
+		.add_property("signature_cache",
+			&CBinaryFile::GetSignatureCache,
+			"Return a dict containing all found signatures and their offsets relative to the binary's address."
+		)
+
 		.add_property("symbols",
 			&CBinaryFile::GetSymbols,
 			"Return a dict containing all symbols and their addresses."
@@ -480,8 +524,12 @@ void export_function(scope _memory)
 
 		.def("add_hook",
 			&CFunction::AddHook,
-			"Adds a hook callback.",
-			args("hook_type", "callback")
+			"Adds a hook callback.\n\n"
+			":param HookType hook_type: The type of the hook.\n"
+			":param callable callback: The callback to add.\n"
+			":param HookFilter filter: A native filter that is evaluated before the callback is called. "
+			"The callback is only called if the filter matches.",
+			("hook_type", "callback", arg("filter")=object())
 		)
 
 		.def("remove_hook",
@@ -620,6 +668,19 @@ void export_stack_data(scope _memory)
 }
 
 
+// ============================================================================
+// >> IHookFilter
+// ============================================================================
+void export_hook_filter(scope _memory)
+{
+	class_<IHookFilter, boost::noncopyable>(
+		"HookFilter",
+		"Base class of native filters that can be passed to :meth:`Function.add_hook`.",
+		no_init)
+	;
+}
+
+
 // ============================================================================
 // >> Register_t
 // ============================================================================
@@ -0,0 +1,124 @@
+/**
+* =============================================================================
+* Source Python
+* Copyright (C) 2012-2015 Source Python Development Team.  All rights reserved.
+* =============================================================================
+*
+* This program is free software; you can redistribute it and/or modify it under
+* the terms of the GNU General Public License, version 3.0, as published by the
+* Free Software Foundation.
+*
+* This program is distributed in the hope that it will be useful, but WITHOUT
+* ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+* FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+* details.
+*
+* You should have received a copy of the GNU General Public License along with
+* this program.  If not, see <http://www.gnu.org/licenses/>.
+*
+* As a special exception, the Source Python Team gives you permission
+* to link the code of this program (as well as its derivative works) to
+* "Half-Life 2," the "Source Engine," and any Game MODs that run on software
+* by the Valve Corporation.  You must obey the GNU General Public License in
+* all respects for all other code used.  Additionally, the Source.Python
+* Development Team grants this exception to all derivative works.
+*/
+
+#ifndef _CALLBACK_PROFILER_H
+#define _CALLBACK_PROFILER_H
+
+//-----------------------------------------------------------------------------
+// Includes.
+//-----------------------------------------------------------------------------
+#include "tier0/platform.h"
+#include "utilities/wrap_macros.h"
+
+
+//-----------------------------------------------------------------------------
+// Returns the Python callable that receives the execution times of
+// callbacks or NULL if profiling is disabled.
+//-----------------------------------------------------------------------------
+inline PyObject*& GetCallbackProfilerPtr()
+{
+	// Not using an object instance, because it would be released after
+	// the interpreter has been finalized.
+	static PyObject* s_pProfiler = NULL;
+	return s_pProfiler;
+}
+
+inline bool IsCallbackProfilerEnabled()
+{
+	return GetCallbackProfilerPtr() != NULL;
+}
+
+
+//-----------------------------------------------------------------------------
+// Sets the Python callable that receives the execution times of callbacks.
+// Passing None disables profiling.
+//-----------------------------------------------------------------------------
+inline void SetCallbackProfiler(object oProfiler)
+{
+	PyObject*& pProfiler = GetCallbackProfilerPtr();
+	PyObject* pOldProfiler = pProfiler;
+
+	pProfiler = oProfiler.is_none() ? NULL : oProfiler.ptr();
+	Py_XINCREF(pProfiler);
+	Py_XDECREF(pOldProfiler);
+}
+
+
+//-----------------------------------------------------------------------------
+// Passes the execution time of a callback to the profiler:
+// profiler(<source>, <callable>, <seconds>)
+//-----------------------------------------------------------------------------
+inline void ReportCallbackTime(const char* szSource, PyObject* pCallable, double dElapsed)
+{
+	PyObject* pProfiler = GetCallbackProfilerPtr();
+	if (!pProfiler)
+		return;
+
+	// Keep the profiler alive, even if it unsets itself
+	Py_INCREF(pProfiler);
+
+	// Don't lose the exception of the callback
+	PyObject *pType, *pValue, *pTraceback;
+	PyErr_Fetch(&pType, &pValue, &pTraceback);
+
+	PyObject* pResult = PyObject_CallFunction(pProfiler, "sOd", szSource, pCallable, dElapsed);
+	if (pResult)
+		Py_DECREF(pResult);
+	else
+		PyErr_Print();
+
+	PyErr_Restore(pType, pValue, pTraceback);
+	Py_DECREF(pProfiler);
+}
+
+
+//-----------------------------------------------------------------------------
+// Executes the given statement and reports its execution time to the
+// profiler if profiling is enabled. The time is also reported if the
+// statement raised an exception.
+//-----------------------------------------------------------------------------
+#define PROFILE_CALLBACK(szSource, pCallable, ...) \
+	if (!IsCallbackProfilerEnabled()) \
+	{ \
+		__VA_ARGS__; \
+	} \
+	else \
+	{ \
+		double dProfileStart = Plat_FloatTime(); \
+		try \
+		{ \
+			__VA_ARGS__; \
+		} \
+		catch( ... ) \
+		{ \
+			ReportCallbackTime(szSource, pCallable, Plat_FloatTime() - dProfileStart); \
+			throw; \
+		} \
+		ReportCallbackTime(szSource, pCallable, Plat_FloatTime() - dProfileStart); \
+	}
+
+
+#endif // _CALLBACK_PROFILER_H